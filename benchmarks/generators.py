@@ -0,0 +1,153 @@
+# ----------------------------------------------------
+# GOAL:
+# Seeded synthetic data for the benchmark suite
+# 1. Text corpora of any size (with names, places, numbers
+#    and punctuation, so every NLP stage has work to do)
+# 2. Labeled movie-style reviews ('pos' / 'neg')
+# 3. Patient tables with any number of rows and any
+#    symptom cardinality
+# ----------------------------------------------------
+#
+# The same seed always gives the same data, so two benchmark
+# runs (before / after a change) measure the same work.
+
+# random: every generator uses its own random.Random(seed)
+import random
+
+# pandas: the patient table is a DataFrame (like the disease scripts)
+import pandas as pd
+
+
+# ----------------------------------------------------
+# WORD POOLS
+# ----------------------------------------------------
+
+PEOPLE = ["Barack Obama", "Angela Merkel", "Ada Lovelace", "Alan Turing", "Grace Hopper",
+          "Marie Curie", "Nelson Mandela", "Frida Kahlo"]
+PLACES = ["Hawaii", "Europe", "Germany", "London", "Paris", "Kenya", "Canada", "Tokyo",
+          "the United States", "South Africa"]
+ORGANIZATIONS = ["Google", "OpenAI", "Meta", "the United Nations", "NASA", "Siemens"]
+NOUNS = ["intelligence", "model", "industry", "economy", "government", "regulation", "system",
+         "company", "researcher", "student", "market", "data", "network", "policy", "city",
+         "feet", "bats", "children", "studies", "leaves"]
+VERBS = ["transforms", "releases", "debates", "builds", "studies", "visited", "was born in",
+         "is running", "were hanging", "announced", "improves", "criticized"]
+ADJECTIVES = ["artificial", "new", "global", "safe", "advanced", "striped", "better", "large",
+              "open", "public"]
+
+POSITIVE = ["great", "excellent", "wonderful", "moving", "superb", "fun", "best", "brilliant",
+            "enjoyable", "love"]
+NEGATIVE = ["bad", "awful", "boring", "worst", "dull", "waste", "terrible", "poor", "hate",
+            "mess"]
+NEUTRAL = ["film", "movie", "plot", "actor", "scene", "story", "director", "script", "ending",
+           "character", "camera", "music", "the", "a", "and", "of", "is", "was", "it", "this"]
+
+
+# ----------------------------------------------------
+# TEXT CORPUS
+# ----------------------------------------------------
+
+def sentence(rng):
+    """
+    One random English-looking sentence
+    """
+    subject = rng.choice([rng.choice(PEOPLE), rng.choice(ORGANIZATIONS),
+                          f"The {rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}"])
+    words = [subject, rng.choice(VERBS)]
+    if rng.random() < 0.5:
+        words.append(rng.choice(PLACES))
+    else:
+        words.append(f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}")
+    if rng.random() < 0.3:
+        words.append(f"in {rng.randint(1990, 2030)}")
+    if rng.random() < 0.3:
+        words.append(f", and {rng.choice(PEOPLE)} {rng.choice(VERBS)} {rng.choice(PLACES)}")
+    return " ".join(words).replace(" ,", ",") + rng.choice([".", ".", ".", "!", "?"])
+
+
+def text_corpus(documents, sentences_per_document=(3, 10), seed=0):
+    """
+    List of `documents` texts with 3-10 sentences each
+    """
+    rng = random.Random(seed)
+    low, high = sentences_per_document
+    return [" ".join(sentence(rng) for _ in range(rng.randint(low, high))) for _ in range(documents)]
+
+
+# ----------------------------------------------------
+# LABELED REVIEWS
+# ----------------------------------------------------
+
+def labeled_reviews(count, words_per_review=(100, 400), vocabulary=3000, seed=0):
+    """
+    [(list of words, 'pos' or 'neg'), ...], same shape as
+    the `documents` list of sentiment.py
+    """
+    rng = random.Random(seed)
+    filler = NEUTRAL + [f"w{i}" for i in range(vocabulary)]
+    reviews = []
+    for i in range(count):
+        label = "pos" if i % 2 == 0 else "neg"
+        own, other = (POSITIVE, NEGATIVE) if label == "pos" else (NEGATIVE, POSITIVE)
+        words = []
+        for _ in range(rng.randint(*words_per_review)):
+            r = rng.random()
+            if r < 0.04:
+                words.append(rng.choice(own))
+            elif r < 0.05:
+                words.append(rng.choice(other))
+            else:
+                words.append(rng.choice(filler))
+        reviews.append((words, label))
+    rng.shuffle(reviews)
+    return reviews
+
+
+def review_texts(count, seed=0):
+    """
+    Short review sentences for VADER (with caps, '!' and 'but')
+    """
+    rng = random.Random(seed)
+    templates = [
+        "The {n} was {a}!",
+        "I {v} this {n}, but the {n2} was {a2}.",
+        "Not {a} at all :(",
+        "The {n} is VERY {a} and the {n2} is {a2}!!!",
+        "{a} {n}, {a2} {n2}.",
+    ]
+    texts = []
+    for _ in range(count):
+        texts.append(rng.choice(templates).format(
+            n=rng.choice(NEUTRAL[:12]), n2=rng.choice(NEUTRAL[:12]),
+            a=rng.choice(POSITIVE + NEGATIVE), a2=rng.choice(POSITIVE + NEGATIVE),
+            v=rng.choice(["love", "hate", "liked", "enjoyed"]),
+        ))
+    return texts
+
+
+# ----------------------------------------------------
+# PATIENT TABLE
+# ----------------------------------------------------
+
+def patient_table(rows, cardinality=50, features=2, diseases=5, seed=0):
+    """
+    DataFrame with columns 'Symptom 1' ... 'Symptom <features>' and
+    'Disease'; every symptom column has `cardinality` possible values
+    """
+    rng = random.Random(seed)
+    values = [[f"S{f + 1}-{v:04d}" for v in range(cardinality)] for f in range(features)]
+    disease_names = [f"Disease-{d:02d}" for d in range(diseases)]
+
+    # Each disease prefers a few symptoms, so the models learn something
+    preferred = {disease: [rng.sample(column, max(1, cardinality // 5)) for column in values]
+                 for disease in disease_names}
+
+    data = {f"Symptom {f + 1}": [] for f in range(features)}
+    data["Disease"] = []
+    for _ in range(rows):
+        disease = rng.choice(disease_names)
+        for f in range(features):
+            pool = preferred[disease][f] if rng.random() < 0.7 else values[f]
+            data[f"Symptom {f + 1}"].append(rng.choice(pool))
+        data["Disease"].append(disease)
+    return pd.DataFrame(data)
@@ -0,0 +1,403 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Time every expensive stage of the repository on
+#    seeded synthetic data (see generators.py):
+#    - tokenization + filtering, POS tagging, lemmatization,
+#      NER, VADER scoring          (nltk_nlp_activity,
+#                                   sentiment-analysis-nltk)
+#    - NLTK Naive Bayes training / classification
+#    - disease model training / prediction (ml-disease-prediction)
+# 2. Report throughput (items/sec) and peak memory
+# 3. Write the results as JSON
+# 4. Compare with a stored baseline and flag regressions
+# ----------------------------------------------------
+#
+# Every benchmark runs in a FRESH process, so one benchmark's
+# memory (or loaded models) never changes another's numbers.
+# Peak memory = peak resident set size of that process.
+#
+# Benchmarks whose NLTK data is not installed (e.g. WordNet,
+# the NE chunker) are reported as "skipped", not as failures.
+#
+# USAGE:
+#   python benchmarks/run_benchmarks.py -o baseline.json
+#   python benchmarks/run_benchmarks.py --scale large --only tokenize pos_tag
+#   python benchmarks/run_benchmarks.py -o new.json --compare baseline.json --tolerance 0.10
+
+# argparse / json / os / platform / resource / sys / time: command line, results, measurements
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import time
+
+# multiprocessing: one fresh process per benchmark
+import multiprocessing
+
+# The project folders are plain script folders: make their
+# modules importable (also in the spawned benchmark processes)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for folder in ("nltk_nlp_activity", "sentiment-analysis-nltk", "ml-disease-prediction", "benchmarks"):
+    path = os.path.join(ROOT, folder)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import generators
+
+
+# ----------------------------------------------------
+# STEP 1: SCALES
+# ----------------------------------------------------
+
+SCALES = {
+    "small": {"documents": 200, "reviews": 400, "texts": 2000, "rows": 100000, "cardinality": 50},
+    "medium": {"documents": 2000, "reviews": 2000, "texts": 20000, "rows": 200000, "cardinality": 200},
+    "large": {"documents": 20000, "reviews": 10000, "texts": 200000, "rows": 2000000, "cardinality": 1000},
+}
+
+
+# ----------------------------------------------------
+# STEP 2: THE BENCHMARKS
+# ----------------------------------------------------
+# Each benchmark does its setup (data, models) and returns
+# work(): only work() is timed. work() returns the amounts
+# processed, e.g. {"tokens": 12345}; the runner turns them
+# into tokens_per_sec.
+
+def bench_tokenize(params):
+    from tokenization import clean_tokens, tokenize
+
+    texts = generators.text_corpus(params["documents"], seed=params["seed"])
+
+    def work():
+        tokens = sum(1 for text in texts for _ in clean_tokens(tokenize(text)))
+        return {"documents": len(texts), "tokens": tokens,
+                "megabytes": sum(len(text.encode("utf-8")) for text in texts) / 1e6}
+    return work
+
+
+def bench_pos_tag(params):
+    from batch_tagging import batched, flatten, get_tagger, tag_batch
+
+    texts = generators.text_corpus(params["documents"], seed=params["seed"])
+    get_tagger()
+
+    def work():
+        tokens = 0
+        for batch in batched(texts, 64):
+            tokens += sum(len(flatten(document)) for document in tag_batch(batch))
+        return {"documents": len(texts), "tokens": tokens}
+    return work
+
+
+def _tagged_tokens(params):
+    from batch_tagging import flatten, tag_documents
+
+    texts = generators.text_corpus(params["documents"], seed=params["seed"])
+    return [flatten(document) for document in tag_documents(texts)]
+
+
+def bench_lemmatize(params):
+    from nltk.stem import WordNetLemmatizer
+    from lemma_table import wordnet_pos
+
+    tagged = _tagged_tokens(params)
+    lemmatizer = WordNetLemmatizer()
+    lemmatizer.lemmatize("warm", "n")   # loads WordNet (not timed)
+
+    def work():
+        tokens = 0
+        for document in tagged:
+            for word, tag in document:
+                lemmatizer.lemmatize(word, wordnet_pos(tag))
+                tokens += 1
+        return {"tokens": tokens}
+    return work
+
+
+def bench_ner(params):
+    import nltk
+    from batch_tagging import get_tagger, split_document
+    from ner_exploration import extract_entities
+
+    texts = generators.text_corpus(params["documents"], seed=params["seed"])
+    sentences = get_tagger().tag_sents([s for text in texts for s in split_document(text)])
+    chunker = nltk.chunk.ne_chunker()
+
+    def work():
+        entities = sum(len(extract_entities(chunker.parse(sentence))) for sentence in sentences)
+        return {"sentences": len(sentences), "entities": entities}
+    return work
+
+
+def bench_vader(params):
+    from sentiment_analysis import get_analyzer
+
+    texts = generators.review_texts(params["texts"], seed=params["seed"])
+    analyzer = get_analyzer()
+
+    def work():
+        for text in texts:
+            analyzer.polarity_scores(text)
+        return {"texts": len(texts)}
+    return work
+
+
+def bench_vader_batch(params):
+    from vader_batch import get_batch_scorer
+
+    texts = generators.review_texts(params["texts"], seed=params["seed"])
+    scorer = get_batch_scorer()
+
+    def work():
+        for start in range(0, len(texts), 1000):
+            scorer.polarity_scores(texts[start:start + 1000])
+        return {"texts": len(texts)}
+    return work
+
+
+def _featuresets(params):
+    reviews = generators.labeled_reviews(params["reviews"], seed=params["seed"])
+    return [({word: True for word in words}, label) for words, label in reviews]
+
+
+def bench_nltk_nb_train(params):
+    from nltk.classify import NaiveBayesClassifier
+
+    featuresets = _featuresets(params)
+
+    def work():
+        NaiveBayesClassifier.train(featuresets)
+        return {"documents": len(featuresets)}
+    return work
+
+
+def bench_nltk_nb_classify(params):
+    from nltk.classify import NaiveBayesClassifier
+
+    featuresets = _featuresets(params)
+    split = len(featuresets) * 3 // 4
+    classifier = NaiveBayesClassifier.train(featuresets[:split])
+    test = [features for features, _ in featuresets[split:]]
+
+    def work():
+        classifier.classify_many(test)
+        return {"documents": len(test)}
+    return work
+
+
+def _disease_train(kind):
+    def bench(params):
+        from model_artifact import FEATURES, train
+
+        table = generators.patient_table(params["rows"], params["cardinality"], seed=params["seed"])
+
+        def work():
+            train(table, kind, FEATURES)
+            return {"rows": len(table)}
+        return work
+    return bench
+
+
+def _disease_predict(kind):
+    def bench(params):
+        from batch_predict import predict_chunk
+        from model_artifact import FEATURES, train
+
+        table = generators.patient_table(params["rows"], params["cardinality"], seed=params["seed"])
+        artifact = train(table, kind, FEATURES)
+        patients = generators.patient_table(params["rows"], params["cardinality"], seed=params["seed"] + 1)
+
+        def work():
+            for start in range(0, len(patients), 100000):
+                predict_chunk(patients.iloc[start:start + 100000], artifact, with_proba=True)
+            return {"rows": len(patients)}
+        return work
+    return bench
+
+
+BENCHMARKS = {
+    "tokenize": bench_tokenize,
+    "pos_tag": bench_pos_tag,
+    "lemmatize": bench_lemmatize,
+    "ner": bench_ner,
+    "vader": bench_vader,
+    "vader_batch": bench_vader_batch,
+    "nltk_nb_train": bench_nltk_nb_train,
+    "nltk_nb_classify": bench_nltk_nb_classify,
+    "disease_tree_train": _disease_train("tree"),
+    "disease_nb_train": _disease_train("nb"),
+    "disease_tree_predict": _disease_predict("tree"),
+    "disease_nb_predict": _disease_predict("nb"),
+}
+
+
+# ----------------------------------------------------
+# STEP 3: RUN ONE BENCHMARK IN A FRESH PROCESS
+# ----------------------------------------------------
+
+def peak_rss_mb():
+    # ru_maxrss is KB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _child(name, params, repeat, queue):
+    try:
+        work = BENCHMARKS[name](params)
+    except LookupError as e:
+        # NLTK data (WordNet, chunker, ...) is not installed
+        lines = [line.strip() for line in str(e).splitlines() if line.strip().startswith("Resource")]
+        queue.put({"skipped": lines[0] if lines else "missing NLTK data"})
+        return
+    except Exception as e:
+        queue.put({"error": f"setup failed: {e!r}"})
+        return
+
+    # Best of `repeat` runs: the least disturbed by other programs
+    setup_rss = peak_rss_mb()
+    seconds = None
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            amounts = work()
+            elapsed = time.perf_counter() - start
+            seconds = elapsed if seconds is None else min(seconds, elapsed)
+    except Exception as e:
+        queue.put({"error": f"run failed: {e!r}"})
+        return
+
+    queue.put({
+        "seconds": round(seconds, 4),
+        "amounts": amounts,
+        "rates": {f"{unit}_per_sec": round(amount / seconds, 2) if seconds else None
+                  for unit, amount in amounts.items()},
+        "setup_rss_mb": round(setup_rss, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    })
+
+
+def run_benchmark(name, params, repeat, timeout):
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_child, args=(name, params, repeat, queue))
+    process.start()
+
+    # Poll, so a child that dies without a result (killed, crashed)
+    # is reported at once instead of after the whole timeout
+    deadline = time.monotonic() + timeout
+    result = None
+    while result is None:
+        try:
+            result = queue.get(timeout=min(1.0, max(deadline - time.monotonic(), 0.01)))
+        except Exception:
+            if not process.is_alive():
+                # It may have put its result just before exiting
+                try:
+                    result = queue.get(timeout=1.0)
+                except Exception:
+                    result = {"error": f"process died without a result (exit code {process.exitcode})"}
+            elif time.monotonic() >= deadline:
+                result = {"error": f"no result within {timeout}s"}
+    process.join(5)
+    if process.is_alive():
+        process.terminate()
+    return result
+
+
+# ----------------------------------------------------
+# STEP 4: COMPARE WITH A BASELINE
+# ----------------------------------------------------
+
+def compare(current, baseline, tolerance):
+    """
+    Return a list of regression messages:
+    - a benchmark that had rates in the baseline now has none
+      (error, timeout or skipped)
+    - a rate (items/sec) dropped by more than `tolerance`
+    - the peak memory grew by more than `tolerance`
+    """
+    regressions = []
+    if current["params"] != baseline.get("params"):
+        print("WARNING: baseline was made with different parameters: "
+              f"{baseline.get('params')} vs {current['params']}")
+
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if not before or "rates" not in before:
+            continue
+        if "rates" not in result:
+            reason = result.get("error") or ("skipped: " + result["skipped"] if result.get("skipped") else "no result")
+            regressions.append(f"{name}: no rates any more ({reason})")
+            continue
+        for metric, value in result["rates"].items():
+            old = before["rates"].get(metric)
+            if old and value is not None and value < old * (1 - tolerance):
+                regressions.append(f"{name}: {metric} {old:,.1f} -> {value:,.1f} "
+                                   f"({(value / old - 1) * 100:+.1f}%)")
+        old_rss, new_rss = before.get("peak_rss_mb"), result.get("peak_rss_mb")
+        if old_rss and new_rss and new_rss > old_rss * (1 + tolerance):
+            regressions.append(f"{name}: peak_rss_mb {old_rss:.1f} -> {new_rss:.1f} "
+                               f"({(new_rss / old_rss - 1) * 100:+.1f}%)")
+    return regressions
+
+
+def print_table(results):
+    for name, result in results.items():
+        if "rates" in result:
+            rates = ", ".join(f"{metric} {value:,.1f}" for metric, value in result["rates"].items())
+            print(f"{name:<22} {result['seconds']:8.2f}s  peak {result['peak_rss_mb']:7.1f} MB  {rates}")
+        else:
+            print(f"{name:<22} {result.get('skipped') and 'skipped: ' + result['skipped'] or result.get('error')}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Repository-wide performance benchmarks.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="run only these benchmarks")
+    parser.add_argument("--seed", type=int, default=0)
+    for key in SCALES["small"]:
+        parser.add_argument(f"--{key}", type=int, help=f"override the scale's '{key}'")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark (the best one counts)")
+    parser.add_argument("--timeout", type=float, default=3600, help="seconds per benchmark")
+    parser.add_argument("-o", "--output", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON results of an earlier run")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="allowed slowdown / memory growth before it is a regression")
+    args = parser.parse_args()
+
+    params = dict(SCALES[args.scale], seed=args.seed)
+    for key in SCALES["small"]:
+        if getattr(args, key) is not None:
+            params[key] = getattr(args, key)
+
+    import nltk
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                    "cpus": os.cpu_count(), "nltk": nltk.__version__},
+        "params": params,
+        "repeat": args.repeat,
+        "results": {},
+    }
+    for name in args.only or BENCHMARKS:
+        report["results"][name] = run_benchmark(name, params, args.repeat, args.timeout)
+        print_table({name: report["results"][name]})
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"REGRESSIONS (tolerance {args.tolerance:.0%}):")
+            for message in regressions:
+                print(f"  {message}")
+            raise SystemExit(1)
+        print(f"No regressions against {args.compare} (tolerance {args.tolerance:.0%})")
@@ -0,0 +1,239 @@
+# ============================================================
+# BATCH DISEASE PREDICTION (MILLIONS OF PATIENTS)
+# ============================================================
+# decision_tree.py and naive_bayes.py answer ONE patient per
+# run: one input() prompt, one one-row DataFrame, one
+# encoder.transform and one model.predict call.
+#
+# This program predicts a WHOLE FILE of patients:
+# - reads a CSV or Parquet file in CHUNKS (memory stays flat)
+# - encodes every chunk with vectorized pandas operations
+# - predicts every chunk with ONE model.predict call
+# - writes the predictions (and optionally the probability
+#   of every disease) to a CSV or Parquet file
+# - flags rows with an UNKNOWN symptom instead of stopping
+#   the whole run with a ValueError
+# - reports rows/sec and peak memory
+#
+# The model comes from an artifact saved by model_artifact.py.
+#
+# USAGE:
+#   python model_artifact.py train --model tree -o disease_tree.model
+#   python batch_predict.py disease_tree.model patients.csv predictions.csv
+#   python batch_predict.py disease_nb.model patients.parquet out.parquet --proba
+#   python batch_predict.py disease_tree.model --make-sample patients.csv --rows 1000000
+# ============================================================
+
+
+# ------------------------------------------------------------
+# STEP 0: IMPORT REQUIRED LIBRARIES
+# ------------------------------------------------------------
+
+# argparse / os / random / resource / sys / time:
+# command line, sample data and the final report
+import argparse
+import os
+import random
+import resource
+import sys
+import time
+
+# NumPy / pandas: vectorized encoding and tabular data
+import numpy as np
+import pandas as pd
+
+# load_artifact: reads the fitted model + encoders
+# (KINDS: the models this file can encode for, not multi-hot ones)
+from model_artifact import KINDS, load_artifact
+
+
+# ------------------------------------------------------------
+# STEP 1: READ THE INPUT IN CHUNKS
+# ------------------------------------------------------------
+
+def read_chunks(path, columns, chunk_size):
+    """
+    Yield DataFrames of at most chunk_size rows
+    """
+    if path.endswith(".parquet"):
+        # pyarrow reads row batches without loading the whole file
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, dtype=str, chunksize=chunk_size)
+
+
+# ------------------------------------------------------------
+# STEP 2: VECTORIZED ENCODING
+# ------------------------------------------------------------
+# OrdinalEncoder gives every symptom its position in the sorted
+# list of known symptoms (encoder.categories_). A pandas Index
+# looks up a whole column at once (hash table) and gives -1
+# for a symptom the encoder has never seen.
+
+def encode_chunk(chunk, artifact):
+    """
+    Return (encoded matrix, boolean matrix "symptom unknown")
+    """
+    codes = np.column_stack([
+        pd.Index(categories).get_indexer(chunk[feature])
+        for feature, categories in zip(artifact['features'], artifact['encoder'].categories_)
+    ])
+    return codes.astype(np.float64), codes < 0
+
+
+# ------------------------------------------------------------
+# STEP 3: PREDICT ONE CHUNK
+# ------------------------------------------------------------
+
+def predict_chunk(chunk, artifact, with_proba=False):
+    """
+    Return the output DataFrame for one chunk:
+    input columns + Predicted Disease (+ probabilities) + Unknown Symptoms
+    """
+    features = artifact['features']
+    X_encoded, unknown = encode_chunk(chunk, artifact)
+    known = ~unknown.any(axis=1)
+    diseases = artifact['label_encoder'].classes_
+
+    result = chunk[features].reset_index(drop=True)
+
+    # Rows with an unknown symptom get no prediction
+    predicted = np.full(len(chunk), "", dtype=object)
+    if known.any():
+        predicted[known] = diseases[artifact['model'].predict(X_encoded[known])]
+    result['Predicted Disease'] = predicted
+
+    if with_proba:
+        proba = np.full((len(chunk), len(diseases)), np.nan)
+        if known.any():
+            proba[known] = artifact['model'].predict_proba(X_encoded[known])
+        for i, disease in enumerate(diseases):
+            result[f'P({disease})'] = proba[:, i]
+
+    # Which features were unknown, e.g. "Symptom 2"
+    # (only the flagged rows are looked at)
+    names = np.array(features, dtype=object)
+    flags = np.full(len(chunk), "", dtype=object)
+    for row in np.flatnonzero(~known):
+        flags[row] = ";".join(names[unknown[row]])
+    result['Unknown Symptoms'] = flags
+    return result
+
+
+# ------------------------------------------------------------
+# STEP 4: WRITE THE OUTPUT (CHUNK BY CHUNK)
+# ------------------------------------------------------------
+
+class OutputWriter:
+    """
+    Appends result chunks to a CSV or Parquet file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.parquet_writer = None
+        self.first = True
+
+    def write(self, frame):
+        if self.path.endswith(".parquet"):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self.parquet_writer is None:
+                self.parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self.parquet_writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="w" if self.first else "a", header=self.first, index=False)
+        self.first = False
+
+    def close(self):
+        if self.parquet_writer is not None:
+            self.parquet_writer.close()
+
+
+def predict_file(artifact, input_path, output_path, chunk_size=100000, with_proba=False):
+    """
+    Predict every row of input_path; returns (rows, rows with unknown symptoms)
+    """
+    writer = OutputWriter(output_path)
+    rows = flagged = 0
+    try:
+        for chunk in read_chunks(input_path, artifact['features'], chunk_size):
+            result = predict_chunk(chunk, artifact, with_proba)
+            writer.write(result)
+            rows += len(result)
+            flagged += int((result['Unknown Symptoms'] != "").sum())
+    finally:
+        writer.close()
+    return rows, flagged
+
+
+def peak_memory_mb():
+    """
+    Peak resident memory of this process (ru_maxrss is KB on Linux, bytes on macOS)
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# ------------------------------------------------------------
+# STEP 5: SAMPLE INPUT FOR TESTING
+# ------------------------------------------------------------
+
+def make_sample(artifact, path, rows, unknown_rate=0.01, seed=0):
+    """
+    Write `rows` random patients using the known symptoms
+    (and a few unknown ones)
+    """
+    rng = random.Random(seed)
+    options = [list(categories) for categories in artifact['encoder'].categories_]
+    chunk_size = 100000
+    writer = OutputWriter(path)
+    for start in range(0, rows, chunk_size):
+        count = min(chunk_size, rows - start)
+        frame = pd.DataFrame({
+            feature: [
+                "Unknown-symptom" if rng.random() < unknown_rate else rng.choice(values)
+                for _ in range(count)
+            ]
+            for feature, values in zip(artifact['features'], options)
+        })
+        writer.write(frame)
+    writer.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chunked batch prediction with a saved disease model.")
+    parser.add_argument("artifact", help="model saved by model_artifact.py")
+    parser.add_argument("input", nargs="?", help="CSV or Parquet file with the symptom columns")
+    parser.add_argument("output", nargs="?", help="CSV or Parquet file for the predictions")
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--proba", action="store_true", help="also write the probability of every disease")
+    parser.add_argument("--make-sample", metavar="PATH", help="write a random input file and exit")
+    parser.add_argument("--rows", type=int, default=1000000, help="rows for --make-sample")
+    args = parser.parse_args()
+
+    try:
+        artifact = load_artifact(args.artifact, expected_kind=KINDS)
+    except ValueError as e:
+        raise SystemExit(f"ERROR: {e}")
+
+    if args.make_sample:
+        make_sample(artifact, args.make_sample, args.rows)
+        print(f"Wrote {args.rows} patients to {args.make_sample}")
+    else:
+        if not (args.input and args.output):
+            parser.error("input and output files are required")
+        start = time.perf_counter()
+        rows, flagged = predict_file(artifact, args.input, args.output, args.chunk_size, args.proba)
+        elapsed = time.perf_counter() - start
+        print(f"Predicted {rows} rows in {elapsed:.2f}s "
+              f"({rows / elapsed if elapsed else 0:,.0f} rows/sec), "
+              f"{flagged} rows with unknown symptoms, "
+              f"peak memory {peak_memory_mb():.0f} MB", file=sys.stderr)
+        if os.path.exists(args.output):
+            print(f"Wrote {args.output}", file=sys.stderr)
@@ -0,0 +1,261 @@
+# ============================================================
+# "COMPILED" MODELS: PREDICTION AS A TABLE LOOKUP
+# ============================================================
+# A single prediction in decision_tree.py / naive_bayes.py goes
+# through pandas (one-row DataFrame), OrdinalEncoder.transform
+# and scikit-learn's predict machinery: tens to hundreds of
+# microseconds for what is really a tiny question.
+#
+# The features are LOW-CARDINALITY categories, so everything
+# can be computed in advance:
+#
+# 1. FULL TABLE (when the number of symptom combinations is
+#    tractable): predict EVERY combination once, with the real
+#    model, and store the predictions and probabilities in
+#    arrays. Works for DecisionTreeClassifier AND CategoricalNB.
+#
+#        index = code(Symptom 1) * n(Symptom 2) + code(Symptom 2)
+#        prediction = table[index]
+#
+# 2. GATHER TABLE (CategoricalNB, too many combinations):
+#    Naive Bayes adds one log-probability per feature, so we
+#    only need each feature's table:
+#
+#        score(disease) = log P(disease) + Σ log P(symptom_i | disease)
+#
+# 3. TREE WALK (DecisionTree, too many combinations):
+#    follow the fitted tree's arrays directly, no sklearn call.
+#
+# Every mode is checked for exact parity with the sklearn model.
+#
+# USAGE:
+#   python compiled_model.py check disease_tree.model
+#   python compiled_model.py bench disease_nb.model
+#   python compiled_model.py predict disease_nb.model Paralysis Vomiting
+# ============================================================
+
+
+# ------------------------------------------------------------
+# STEP 0: IMPORT REQUIRED LIBRARIES
+# ------------------------------------------------------------
+
+# argparse / itertools / math / random / time: command line, checks, timing
+import argparse
+import itertools
+import math
+import random
+import time
+
+# NumPy: the lookup tables
+import numpy as np
+
+# pandas: only for the sklearn reference path in the benchmark
+import pandas as pd
+
+# logsumexp: turns Naive Bayes scores into probabilities
+from scipy.special import logsumexp
+
+# load_artifact: reads the fitted model + encoders
+# (KINDS: the models this file can compile, not multi-hot ones)
+from model_artifact import KINDS, load_artifact
+
+# Above this many combinations the full table is not built
+MAX_COMBINATIONS = 1000000
+
+
+# ------------------------------------------------------------
+# STEP 1: COMPILE
+# ------------------------------------------------------------
+
+class CompiledModel:
+    """
+    predict(symptoms) / predict_proba(symptoms) without pandas or sklearn
+    """
+
+    def __init__(self, artifact, max_combinations=MAX_COMBINATIONS):
+        self.features = artifact['features']
+        self.diseases = list(artifact['label_encoder'].classes_)
+        model = artifact['model']
+
+        # symptom → code, one dictionary per feature
+        # (the same numbers OrdinalEncoder gives)
+        categories = artifact['encoder'].categories_
+        self.codes = [{symptom: code for code, symptom in enumerate(values)} for values in categories]
+        sizes = [len(values) for values in categories]
+
+        # Mixed-radix positions: the last feature changes fastest
+        self.strides = [math.prod(sizes[i + 1:]) for i in range(len(sizes))]
+
+        if math.prod(sizes) <= max_combinations:
+            self.mode = "table"
+            self._build_table(model, sizes)
+        elif artifact['kind'] == 'nb':
+            self.mode = "gather"
+            self.class_log_prior = model.class_log_prior_
+            self.feature_log_prob = [table.T.copy() for table in model.feature_log_prob_]
+        else:
+            self.mode = "tree"
+            tree = model.tree_
+            self.left = tree.children_left.tolist()
+            self.right = tree.children_right.tolist()
+            self.feature = tree.feature.tolist()
+            # The tree compares float32 values, so do we
+            self.threshold = tree.threshold.astype(np.float32).tolist()
+            values = tree.value[:, 0, :]
+            self.leaf_proba = values / values.sum(axis=1, keepdims=True)
+            self.leaf_prediction = [self.diseases[i] for i in values.argmax(axis=1)]
+
+    def _build_table(self, model, sizes):
+        """
+        Predict every combination of symptoms with the real model
+        """
+        combinations = np.indices(sizes).reshape(len(sizes), -1).T.astype(np.float64)
+        self.table_proba = model.predict_proba(combinations)
+        predicted = model.predict(combinations)
+        self.table_prediction = [self.diseases[i] for i in predicted]
+
+    # ---------- encoding ----------
+
+    def encode(self, symptoms):
+        """
+        Codes of one patient's symptoms
+        (ValueError for an unknown symptom or a wrong number of
+        symptoms, like OrdinalEncoder)
+        """
+        if len(symptoms) != len(self.codes):
+            raise ValueError(f"expected {len(self.codes)} symptoms ({', '.join(self.features)}), "
+                             f"got {len(symptoms)}")
+        try:
+            return [codes[symptom] for codes, symptom in zip(self.codes, symptoms)]
+        except KeyError as e:
+            raise ValueError(f"Found unknown category {e.args[0]!r}") from None
+
+    # ---------- prediction ----------
+
+    def predict(self, symptoms):
+        """
+        Disease name for one patient
+        """
+        codes = self.encode(symptoms)
+        if self.mode == "table":
+            return self.table_prediction[sum(c * s for c, s in zip(codes, self.strides))]
+        if self.mode == "gather":
+            return self.diseases[int(np.argmax(self._joint_log_likelihood(codes)))]
+        return self.leaf_prediction[self._leaf(codes)]
+
+    def predict_proba(self, symptoms):
+        """
+        Probability of every disease (order: self.diseases)
+        """
+        codes = self.encode(symptoms)
+        if self.mode == "table":
+            return self.table_proba[sum(c * s for c, s in zip(codes, self.strides))]
+        if self.mode == "gather":
+            jll = self._joint_log_likelihood(codes)
+            return np.exp(jll - logsumexp(jll))
+        return self.leaf_proba[self._leaf(codes)]
+
+    def _joint_log_likelihood(self, codes):
+        """
+        Same additions, in the same order, as CategoricalNB
+        """
+        jll = np.zeros(len(self.diseases))
+        for table, code in zip(self.feature_log_prob, codes):
+            jll += table[code]
+        return jll + self.class_log_prior
+
+    def _leaf(self, codes):
+        node = 0
+        while self.left[node] != -1:
+            if codes[self.feature[node]] <= self.threshold[node]:
+                node = self.left[node]
+            else:
+                node = self.right[node]
+        return node
+
+
+# ------------------------------------------------------------
+# STEP 2: PARITY CHECK
+# ------------------------------------------------------------
+
+def all_combinations(artifact, limit=100000, seed=0):
+    """
+    Every symptom combination, or `limit` random ones if there are more
+    """
+    categories = [list(values) for values in artifact['encoder'].categories_]
+    if math.prod(len(values) for values in categories) <= limit:
+        return [list(combination) for combination in itertools.product(*categories)]
+    rng = random.Random(seed)
+    return [[rng.choice(values) for values in categories] for _ in range(limit)]
+
+
+def check_parity(artifact, compiled):
+    """
+    Compare with encoder.transform + model.predict / predict_proba;
+    returns (checked, prediction mismatches, probability mismatches)
+    """
+    rows = all_combinations(artifact)
+    X = artifact['encoder'].transform(pd.DataFrame(rows, columns=artifact['features']))
+    expected = artifact['label_encoder'].inverse_transform(artifact['model'].predict(X))
+    expected_proba = artifact['model'].predict_proba(X)
+
+    wrong_prediction = wrong_proba = 0
+    for row, disease, proba in zip(rows, expected, expected_proba):
+        wrong_prediction += compiled.predict(row) != disease
+        wrong_proba += not np.array_equal(compiled.predict_proba(row), proba)
+    return len(rows), wrong_prediction, wrong_proba
+
+
+# ------------------------------------------------------------
+# STEP 3: BENCHMARK (ONE PATIENT AT A TIME)
+# ------------------------------------------------------------
+
+def benchmark(artifact, compiled, repeats=2000):
+    rows = all_combinations(artifact, limit=1000)
+    features = artifact['features']
+
+    def sklearn_path(row):
+        X_new_encoded = artifact['encoder'].transform(pd.DataFrame([row], columns=features))
+        predicted = artifact['model'].predict(X_new_encoded)
+        return artifact['label_encoder'].inverse_transform(predicted)[0]
+
+    for name, predict, count in (("sklearn (DataFrame + transform + predict)", sklearn_path, repeats // 10),
+                                 (f"compiled ({compiled.mode})", compiled.predict, repeats)):
+        start = time.perf_counter()
+        for i in range(count):
+            predict(rows[i % len(rows)])
+        elapsed = time.perf_counter() - start
+        print(f"{name:<42} {elapsed / count * 1e6:10.2f} µs per prediction")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lookup-table inference for the disease models.")
+    parser.add_argument("command", choices=["check", "bench", "predict"])
+    parser.add_argument("artifact", help="model saved by model_artifact.py")
+    parser.add_argument("symptoms", nargs="*", help="for predict: one value per feature")
+    parser.add_argument("--max-combinations", type=int, default=MAX_COMBINATIONS,
+                        help="largest full table to build (0 = always use the fallback)")
+    args = parser.parse_args()
+
+    try:
+        artifact = load_artifact(args.artifact, expected_kind=KINDS)
+    except ValueError as e:
+        raise SystemExit(f"ERROR: {e}")
+    start = time.perf_counter()
+    compiled = CompiledModel(artifact, args.max_combinations)
+    print(f"Compiled {artifact['kind']} model ({compiled.mode} mode) "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    if args.command == "check":
+        checked, wrong_prediction, wrong_proba = check_parity(artifact, compiled)
+        print(f"Checked {checked} combinations: {wrong_prediction} prediction mismatches, "
+              f"{wrong_proba} probability mismatches")
+        if wrong_prediction or wrong_proba:
+            raise SystemExit(1)
+    elif args.command == "bench":
+        benchmark(artifact, compiled)
+    else:
+        try:
+            print(f"Predicted Disease: {compiled.predict(args.symptoms)}")
+        except ValueError as e:
+            raise SystemExit(f"ERROR: Invalid symptoms entered.\nTechnical details: {e}")
@@ -32,96 +32,132 @@ from sklearn.tree import DecisionTreeClassifier
 # Converts target labels (diseases) into numeric form
 from sklearn.preprocessing import LabelEncoder, OrdinalEncoder
 
+# argparse: reads the optional --model argument
+import argparse
 
-# ------------------------------------------------------------
-# STEP 1: CREATE THE MEDICAL DATASET
-# ------------------------------------------------------------
-# This dataset represents HISTORICAL patient records.
-# Each row = one patient
-# Columns:
-# - Symptom 1
-# - Symptom 2
-# - Disease (TARGET / CLASS LABEL)
-
-data = pd.DataFrame({
-    'Symptom 1': [
-        'Diarrhea',
-        'Diarrhea',
-        'Paralysis',
-        'Paralysis',
-        'Paralysis'
-    ],
-    'Symptom 2': [
-        'Fever',
-        'Vomiting',
-        'Headache',
-        'Vomiting',
-        'Vomiting'
-    ],
-    'Disease': [
-        'Mesiopathy',
-        'Mesiopathy',
-        'Mesiopathy',
-        'Ritengitis',
-        'Ritengitis'
-    ]
-})
-
-# At this stage:
-# The model CANNOT work with text values
-# We must convert everything into numbers
+# load_artifact: reads a model saved by model_artifact.py
+from model_artifact import load_artifact
 
 
 # ------------------------------------------------------------
-# STEP 2: DATA PREPROCESSING (ENCODING)
+# SAVED MODEL (OPTIONAL)
 # ------------------------------------------------------------
+# With --model, STEPS 1-3 are skipped: the fitted model and
+# both encoders are loaded from an artifact made by
+#   python model_artifact.py train --model tree -o disease_tree.model
+# so startup does not depend on the size of the training data.
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--model", help="artifact saved by model_artifact.py")
+args = parser.parse_args()
+
+if args.model:
+    # A model of the other kind (or a multi-hot model) is refused
+    try:
+        artifact = load_artifact(args.model, expected_kind='tree')
+    except ValueError as e:
+        raise SystemExit(f"ERROR: {e}")
+    encoder = artifact['encoder']
+    label_encoder = artifact['label_encoder']
+    model = artifact['model']
+    features = artifact['features']
+
+    # Valid options = the categories the encoder has learned
+    symptom_options = artifact['encoder'].categories_
+
+else:
+    # ------------------------------------------------------------
+    # STEP 1: CREATE THE MEDICAL DATASET
+    # ------------------------------------------------------------
+    # This dataset represents HISTORICAL patient records.
+    # Each row = one patient
+    # Columns:
+    # - Symptom 1
+    # - Symptom 2
+    # - Disease (TARGET / CLASS LABEL)
+
+    data = pd.DataFrame({
+        'Symptom 1': [
+            'Diarrhea',
+            'Diarrhea',
+            'Paralysis',
+            'Paralysis',
+            'Paralysis'
+        ],
+        'Symptom 2': [
+            'Fever',
+            'Vomiting',
+            'Headache',
+            'Vomiting',
+            'Vomiting'
+        ],
+        'Disease': [
+            'Mesiopathy',
+            'Mesiopathy',
+            'Mesiopathy',
+            'Ritengitis',
+            'Ritengitis'
+        ]
+    })
 
-# Create encoder objects
-encoder = OrdinalEncoder()
-label_encoder = LabelEncoder()
+    # At this stage:
+    # The model CANNOT work with text values
+    # We must convert everything into numbers
 
-# FEATURES = INPUT VARIABLES
-# These are used to MAKE predictions
-features = ['Symptom 1', 'Symptom 2']
 
-# X = feature data (independent variables)
-X = data[features]
+    # ------------------------------------------------------------
+    # STEP 2: DATA PREPROCESSING (ENCODING)
+    # ------------------------------------------------------------
 
-# Convert text symptoms into numeric values
-# Example:
-# Diarrhea → 0
-# Paralysis → 1
-# Fever → 0
-# Vomiting → 1
-X_encoded = encoder.fit_transform(X)
+    # Create encoder objects
+    encoder = OrdinalEncoder()
+    label_encoder = LabelEncoder()
 
-# y = target variable (dependent variable)
-# This is what we want to predict
-y = data['Disease']
+    # FEATURES = INPUT VARIABLES
+    # These are used to MAKE predictions
+    features = ['Symptom 1', 'Symptom 2']
 
-# Convert disease names into numbers
-# Example:
-# Mesiopathy → 0
-# Ritengitis → 1
-y_encoded = label_encoder.fit_transform(y)
+    # X = feature data (independent variables)
+    X = data[features]
 
+    # Convert text symptoms into numeric values
+    # Example:
+    # Diarrhea → 0
+    # Paralysis → 1
+    # Fever → 0
+    # Vomiting → 1
+    X_encoded = encoder.fit_transform(X)
 
-# ------------------------------------------------------------
-# STEP 3: TRAIN THE DECISION TREE MODEL (ID3)
-# ------------------------------------------------------------
+    # y = target variable (dependent variable)
+    # This is what we want to predict
+    y = data['Disease']
+
+    # Convert disease names into numbers
+    # Example:
+    # Mesiopathy → 0
+    # Ritengitis → 1
+    y_encoded = label_encoder.fit_transform(y)
+
+
+    # ------------------------------------------------------------
+    # STEP 3: TRAIN THE DECISION TREE MODEL (ID3)
+    # ------------------------------------------------------------
+
+    # Create Decision Tree model
+    # criterion='entropy' means:
+    # - Use ENTROPY to measure impurity
+    # - Choose splits using INFORMATION GAIN
+    # This is exactly how ID3 works
+    model = DecisionTreeClassifier(criterion='entropy')
 
-# Create Decision Tree model
-# criterion='entropy' means:
-# - Use ENTROPY to measure impurity
-# - Choose splits using INFORMATION GAIN
-# This is exactly how ID3 works
-model = DecisionTreeClassifier(criterion='entropy')
+    # Train the model:
+    # The tree learns rules such as:
+    # IF Symptom 1 = Paralysis AND Symptom 2 = Vomiting
+    # THEN Disease = Ritengitis
+    model.fit(X_encoded, y_encoded)
 
-# Train the model:
-# The tree learns rules such as:
-# IF Symptom 1 = Paralysis AND Symptom 2 = Vomiting
-# THEN Disease = Ritengitis
-model.fit(X_encoded, y_encoded)
+    # Valid options = the symptoms seen in the training data
+    symptom_options = [data[feature].unique() for feature in features]
 
 
 # ------------------------------------------------------------
@@ -131,8 +167,8 @@ model.fit(X_encoded, y_encoded)
 print("\n--- INPUT FOR DISEASE PREDICTION ---")
 
 # Show valid options so user does not enter unknown symptoms
-print("Available Symptom 1 options:", data['Symptom 1'].unique())
-print("Available Symptom 2 options:", data['Symptom 2'].unique())
+print("Available Symptom 1 options:", symptom_options[0])
+print("Available Symptom 2 options:", symptom_options[1])
 
 try:
     # Take symptom input from the user
@@ -0,0 +1,148 @@
+# ============================================================
+# LOAD GENERATOR FOR prediction_service.py (LOCALHOST ONLY)
+# ============================================================
+# Opens many concurrent keep-alive connections to the local
+# prediction service, sends POST /predict requests with random
+# symptoms, and reports:
+# - requests/sec
+# - client-side latency p50 / p99
+# - the server's own /metrics (latency + batch-size histogram)
+#
+# USAGE:
+#   python prediction_service.py disease_tree.model --port 8080
+#   python load_generator.py --port 8080 --clients 64 --requests 200
+#   python load_generator.py --unix /tmp/disease.sock
+#   python load_generator.py --symptoms patients.csv
+#     (CSV with a header and one column per feature, e.g. from
+#      batch_predict.py --make-sample; rows are sent at random)
+# ============================================================
+
+
+# ------------------------------------------------------------
+# STEP 0: IMPORT REQUIRED LIBRARIES
+# ------------------------------------------------------------
+
+# argparse / asyncio / csv / json / random / time: command line, clients, report
+import argparse
+import asyncio
+import csv
+import json
+import random
+import time
+
+# NumPy: percentiles
+import numpy as np
+
+# Symptoms used when no --symptoms file is given
+SYMPTOM_1 = ['Diarrhea', 'Paralysis']
+SYMPTOM_2 = ['Fever', 'Headache', 'Vomiting']
+DEFAULT_PATIENTS = [[symptom_1, symptom_2] for symptom_1 in SYMPTOM_1 for symptom_2 in SYMPTOM_2]
+
+
+def read_patients(path):
+    """
+    Symptom lists from a CSV file: header row, then one patient per row
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        patients = [row for row in reader if row]
+    if not patients:
+        raise ValueError(f"{path} has no patients")
+    return patients
+
+
+# ------------------------------------------------------------
+# STEP 1: ONE HTTP CONNECTION
+# ------------------------------------------------------------
+
+async def connect(host, port, unix_path):
+    if unix_path:
+        return await asyncio.open_unix_connection(unix_path)
+    return await asyncio.open_connection(host, port)
+
+
+async def request(reader, writer, method, path, payload=None):
+    """
+    Send one request on an open connection, return (status, JSON body)
+    """
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+    )
+    await writer.drain()
+
+    status = int((await reader.readline()).split(b" ", 2)[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+# ------------------------------------------------------------
+# STEP 2: MANY CONCURRENT CLIENTS
+# ------------------------------------------------------------
+
+async def client(host, port, unix_path, requests, patients, seed, latencies, failures):
+    rng = random.Random(seed)
+    reader, writer = await connect(host, port, unix_path)
+    try:
+        for _ in range(requests):
+            symptoms = rng.choice(patients)
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, "POST", "/predict", {"symptoms": symptoms})
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                failures.append(status)
+    finally:
+        writer.close()
+
+
+async def run(host, port, unix_path, clients, requests, patients=DEFAULT_PATIENTS):
+    latencies, failures = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        client(host, port, unix_path, requests, patients, seed, latencies, failures)
+        for seed in range(clients)
+    ])
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array(latencies) * 1000
+    print(f"{len(latencies)} requests from {clients} clients in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:,.0f} requests/sec), {len(failures)} failures")
+    print(f"client latency: p50 {np.percentile(latencies, 50):.2f} ms, "
+          f"p99 {np.percentile(latencies, 99):.2f} ms")
+
+    reader, writer = await connect(host, port, unix_path)
+    _, metrics = await request(reader, writer, "GET", "/metrics")
+    writer.close()
+    print("server metrics:")
+    print(json.dumps(metrics, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Localhost load generator for prediction_service.py.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix", metavar="PATH", help="connect to a Unix socket instead of TCP")
+    parser.add_argument("--clients", type=int, default=64, help="concurrent connections")
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--symptoms", metavar="FILE",
+                        help="CSV of patients to send (default: random pairs of the example symptoms)")
+    args = parser.parse_args()
+
+    if args.host not in ("127.0.0.1", "localhost", "::1"):
+        parser.error("the load generator only targets localhost")
+    patients = DEFAULT_PATIENTS
+    if args.symptoms:
+        try:
+            patients = read_patients(args.symptoms)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"ERROR: {e}")
+    asyncio.run(run(args.host, args.port, args.unix, args.clients, args.requests, patients))
@@ -0,0 +1,264 @@
+# ============================================================
+# TRAIN ONCE, PREDICT MANY TIMES: SAVED MODEL ARTIFACTS
+# ============================================================
+# decision_tree.py and naive_bayes.py rebuild the dataset,
+# refit both encoders and refit the model on EVERY run, before
+# they can answer a single question.
+#
+# This program trains ONCE and saves everything prediction
+# needs in ONE file (the "artifact"):
+# - the fitted model (DecisionTreeClassifier or CategoricalNB)
+# - the fitted OrdinalEncoder (symptoms → numbers)
+# - the fitted LabelEncoder  (numbers → disease names)
+# - the feature names and a few facts about the training run
+#
+# Loading the artifact takes the same time whether the model
+# was trained on 5 patients or on 5 million.
+#
+# FILE FORMAT:
+# - line 1: JSON header (format version, SHA-256 checksum and
+#   size of the payload, scikit-learn version)
+# - rest:   the pickled payload
+# The checksum is verified BEFORE unpickling, so a truncated or
+# corrupted file is rejected. (Like any pickle, only load
+# artifacts you trained yourself.)
+#
+# USAGE:
+#   python model_artifact.py train --model tree -o disease_tree.model
+#   python model_artifact.py train --model nb --data patients.csv -o disease_nb.model
+#   python model_artifact.py predict disease_tree.model Paralysis Vomiting
+#   python model_artifact.py info disease_tree.model
+#   python decision_tree.py --model disease_tree.model
+# ============================================================
+
+
+# ------------------------------------------------------------
+# STEP 0: IMPORT REQUIRED LIBRARIES
+# ------------------------------------------------------------
+
+# argparse / hashlib / json / os / pickle / time / warnings:
+# command line, checksum, file format and messages
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import time
+import warnings
+
+# pandas: tabular data (same as the two scripts)
+import pandas as pd
+
+# scikit-learn: the models and the encoders
+import sklearn
+from sklearn.naive_bayes import CategoricalNB
+from sklearn.preprocessing import LabelEncoder, OrdinalEncoder
+from sklearn.tree import DecisionTreeClassifier
+
+# Increase when the payload layout changes
+FORMAT_VERSION = 1
+
+MAGIC = "disease-model"
+
+# Models with one OrdinalEncoder column per symptom (this file);
+# multi_hot.py saves "multi-hot-tree" / "multi-hot-nb" instead
+KINDS = ('tree', 'nb')
+
+FEATURES = ['Symptom 1', 'Symptom 2']
+TARGET = 'Disease'
+
+
+# ------------------------------------------------------------
+# STEP 1: TRAINING DATA
+# ------------------------------------------------------------
+
+def example_data():
+    """
+    The 5 historical patients of decision_tree.py / naive_bayes.py
+    """
+    return pd.DataFrame({
+        'Symptom 1': ['Diarrhea', 'Diarrhea', 'Paralysis', 'Paralysis', 'Paralysis'],
+        'Symptom 2': ['Fever', 'Vomiting', 'Headache', 'Vomiting', 'Vomiting'],
+        'Disease': ['Mesiopathy', 'Mesiopathy', 'Mesiopathy', 'Ritengitis', 'Ritengitis'],
+    })
+
+
+def read_table(path, columns=None):
+    """
+    Read a CSV or Parquet file (chosen by the extension)
+    """
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_csv(path, usecols=columns, dtype=str)
+
+
+# ------------------------------------------------------------
+# STEP 2: TRAIN (SAME STEPS AS THE TWO SCRIPTS)
+# ------------------------------------------------------------
+
+def make_model(kind):
+    """
+    'tree' → Decision Tree with entropy (ID3)
+    'nb'   → Categorical Naive Bayes
+    """
+    if kind == 'tree':
+        return DecisionTreeClassifier(criterion='entropy')
+    if kind == 'nb':
+        return CategoricalNB()
+    raise ValueError(f"unknown model kind: {kind!r} (use 'tree' or 'nb')")
+
+
+def train(data, kind, features=FEATURES, target=TARGET):
+    """
+    Fit both encoders and the model; return the artifact dictionary
+    """
+    encoder = OrdinalEncoder()
+    label_encoder = LabelEncoder()
+
+    X_encoded = encoder.fit_transform(data[features])
+    y_encoded = label_encoder.fit_transform(data[target])
+
+    model = make_model(kind)
+    model.fit(X_encoded, y_encoded)
+
+    return {
+        'kind': kind,
+        'features': list(features),
+        'target': target,
+        'encoder': encoder,
+        'label_encoder': label_encoder,
+        'model': model,
+        'training_rows': len(data),
+        'trained_at': time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+# ------------------------------------------------------------
+# STEP 3: SAVE / LOAD WITH A CHECKSUM
+# ------------------------------------------------------------
+
+def save_artifact(artifact, path):
+    payload = pickle.dumps(artifact, protocol=pickle.HIGHEST_PROTOCOL)
+    header = {
+        'magic': MAGIC,
+        'format_version': FORMAT_VERSION,
+        'sha256': hashlib.sha256(payload).hexdigest(),
+        'size': len(payload),
+        'sklearn_version': sklearn.__version__,
+        'kind': artifact['kind'],
+    }
+
+    # Write to a temporary file first: a crash never leaves
+    # a half-written artifact under the real name
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(json.dumps(header).encode("utf-8") + b"\n")
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return header
+
+
+def read_header(f, path):
+    try:
+        header = json.loads(f.readline())
+    except ValueError:
+        raise ValueError(f"{path} is not a disease model artifact")
+    if header.get('magic') != MAGIC:
+        raise ValueError(f"{path} is not a disease model artifact")
+    if header['format_version'] != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported artifact version {header['format_version']} "
+                         f"(this program reads version {FORMAT_VERSION})")
+    return header
+
+
+def load_artifact(path, expected_kind=None):
+    """
+    Read, verify and unpickle an artifact
+
+    expected_kind: a kind ('tree') or a tuple of kinds the caller
+    can use; any other kind is a ValueError (checked before unpickling)
+    """
+    with open(path, "rb") as f:
+        header = read_header(f, path)
+        if expected_kind is not None:
+            kinds = (expected_kind,) if isinstance(expected_kind, str) else tuple(expected_kind)
+            if header.get('kind') not in kinds:
+                raise ValueError(f"{path} holds a {header.get('kind')!r} model, "
+                                 f"expected {' or '.join(repr(kind) for kind in kinds)}")
+        payload = f.read()
+
+    if len(payload) != header['size'] or hashlib.sha256(payload).hexdigest() != header['sha256']:
+        raise ValueError(f"{path}: checksum mismatch (file is truncated or corrupted)")
+
+    if header['sklearn_version'] != sklearn.__version__:
+        warnings.warn(f"{path} was trained with scikit-learn {header['sklearn_version']}, "
+                      f"running {sklearn.__version__}")
+
+    artifact = pickle.loads(payload)
+    artifact['header'] = header
+    return artifact
+
+
+# ------------------------------------------------------------
+# STEP 4: PREDICT
+# ------------------------------------------------------------
+
+def predict(artifact, rows):
+    """
+    rows: list of symptom lists, one value per feature
+    Returns the predicted disease names
+    (raises ValueError for an unknown symptom, like the scripts)
+    """
+    new_patient_data = pd.DataFrame(rows, columns=artifact['features'])
+    X_new_encoded = artifact['encoder'].transform(new_patient_data)
+    predicted_encoded = artifact['model'].predict(X_new_encoded)
+    return list(artifact['label_encoder'].inverse_transform(predicted_encoded))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train, save and use disease model artifacts.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    train_cmd = sub.add_parser("train", help="fit a model and save it as an artifact")
+    train_cmd.add_argument("--model", choices=["tree", "nb"], required=True)
+    train_cmd.add_argument("--data", help="CSV/Parquet with the feature and target columns "
+                                          "(default: the 5 example patients)")
+    train_cmd.add_argument("--features", nargs="+", default=FEATURES)
+    train_cmd.add_argument("--target", default=TARGET)
+    train_cmd.add_argument("-o", "--output", required=True)
+
+    predict_cmd = sub.add_parser("predict", help="predict one patient from an artifact")
+    predict_cmd.add_argument("artifact")
+    predict_cmd.add_argument("symptoms", nargs="+", help="one value per feature, in order")
+
+    info_cmd = sub.add_parser("info", help="print the artifact header")
+    info_cmd.add_argument("artifact")
+    args = parser.parse_args()
+
+    if args.command == "train":
+        if args.data:
+            data = read_table(args.data, args.features + [args.target])
+        else:
+            data = example_data()
+        start = time.perf_counter()
+        header = save_artifact(train(data, args.model, args.features, args.target), args.output)
+        print(f"Trained {args.model} on {len(data)} rows in {time.perf_counter() - start:.2f}s")
+        print(f"Wrote {args.output} (sha256 {header['sha256'][:16]}..., {header['size']} bytes)")
+
+    elif args.command == "predict":
+        start = time.perf_counter()
+        try:
+            artifact = load_artifact(args.artifact, expected_kind=KINDS)
+        except ValueError as e:
+            raise SystemExit(f"ERROR: {e}")
+        loaded = time.perf_counter() - start
+        try:
+            disease = predict(artifact, [args.symptoms])[0]
+        except ValueError as e:
+            raise SystemExit(f"ERROR: Unknown symptom entered.\nTechnical details: {e}")
+        print(f"Predicted Disease: {disease}")
+        print(f"(artifact loaded in {loaded * 1000:.1f} ms)")
+
+    else:
+        with open(args.artifact, "rb") as f:
+            print(json.dumps(read_header(f, args.artifact), indent=2))
@@ -0,0 +1,360 @@
+# ============================================================
+# MANY SYMPTOMS PER PATIENT: SPARSE MULTI-HOT ENCODING
+# ============================================================
+# decision_tree.py and naive_bayes.py expect EXACTLY two
+# symptoms per patient (Symptom 1, Symptom 2). Real intake
+# records list ANY number of symptoms, taken from thousands
+# of possible values.
+#
+# MULTI-HOT ENCODING:
+# One column per known symptom, 1 if the patient has it:
+#
+#                 Fever  Headache  Vomiting  Paralysis ...
+#   patient 1  →    1       0         1          0
+#   patient 2  →    0       1         0          1
+#
+# With thousands of symptoms almost every value is 0, so only
+# the 1s are stored (scipy CSR sparse matrix): memory grows with
+# the number of symptoms patients ACTUALLY have, not with
+# (number of patients × number of possible symptoms).
+#
+# MODELS (both train and predict on the sparse matrix directly):
+# - Decision Tree (entropy / ID3), sklearn accepts sparse input
+# - Bernoulli Naive Bayes: the Naive Bayes variant for yes/no
+#   features (CategoricalNB needs one dense column per feature)
+#
+# INPUT: CSV with a symptom-list column, e.g.
+#   Symptoms,Disease
+#   Fever;Vomiting;Rash,Mesiopathy
+# or several one-symptom columns (--symptom-columns).
+#
+# USAGE:
+#   python multi_hot.py make-sample intake.csv --patients 1000000 --vocabulary 5000
+#   python multi_hot.py train --model nb --data intake.csv -o disease_nb_multi.model
+#   python multi_hot.py predict disease_nb_multi.model Fever Vomiting Rash
+#   python multi_hot.py bench intake.csv
+#   python multi_hot.py roundtrip          (save here, load from another program)
+# ============================================================
+
+
+# ------------------------------------------------------------
+# STEP 0: IMPORT REQUIRED LIBRARIES
+# ------------------------------------------------------------
+
+# argparse / csv / os / random / subprocess / sys / tempfile / time:
+# command line, input, sample data, round-trip check, timing
+import argparse
+import csv
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+# NumPy / SciPy: the sparse matrix
+import numpy as np
+from scipy import sparse
+
+# scikit-learn: models and the disease label encoder
+from sklearn.naive_bayes import BernoulliNB
+from sklearn.preprocessing import LabelEncoder
+from sklearn.tree import DecisionTreeClassifier
+
+# Artifacts with a checksum (see model_artifact.py)
+from model_artifact import load_artifact, save_artifact
+
+TARGET = 'Disease'
+
+
+# ------------------------------------------------------------
+# STEP 1: THE ENCODER
+# ------------------------------------------------------------
+
+class MultiHotEncoder:
+    """
+    Variable-length symptom lists → CSR matrix (patients × symptoms)
+    """
+
+    def __init__(self):
+        # symptom → column number
+        self.vocabulary = {}
+
+    def fit_transform(self, symptom_lists):
+        """
+        Learn the vocabulary and encode in ONE pass
+        (symptom_lists can be a stream)
+        """
+        return self._encode(symptom_lists, grow=True)[0]
+
+    def transform(self, symptom_lists):
+        """
+        Encode with the learned vocabulary; returns
+        (matrix, list of unknown symptoms per patient)
+        """
+        return self._encode(symptom_lists, grow=False)
+
+    def _encode(self, symptom_lists, grow):
+        indptr = [0]
+        indices = []
+        unknown = []
+        for symptoms in symptom_lists:
+            columns = set()
+            missing = []
+            for symptom in symptoms:
+                column = self.vocabulary.get(symptom)
+                if column is None:
+                    if grow:
+                        column = self.vocabulary[symptom] = len(self.vocabulary)
+                    else:
+                        missing.append(symptom)
+                        continue
+                columns.add(column)
+            indices.extend(sorted(columns))
+            indptr.append(len(indices))
+            unknown.append(missing)
+
+        # float32 is what the tree uses internally: no conversion copy
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32),
+             np.array(indices, dtype=np.int32),
+             np.array(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(self.vocabulary)),
+        )
+        return matrix, unknown
+
+    def symptoms(self):
+        """
+        Symptom names in column order
+        """
+        return list(self.vocabulary)
+
+
+# ------------------------------------------------------------
+# STEP 2: READ INTAKE RECORDS (STREAMING)
+# ------------------------------------------------------------
+
+def read_records(path, list_column='Symptoms', symptom_columns=None, target=TARGET, sep=';'):
+    """
+    Yield (symptom list, disease) for every row of a CSV file
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            if symptom_columns:
+                symptoms = [row[column] for column in symptom_columns if row[column]]
+            else:
+                symptoms = [s.strip() for s in row[list_column].split(sep) if s.strip()]
+            yield symptoms, row.get(target)
+
+
+# ------------------------------------------------------------
+# STEP 3: TRAIN AND PREDICT (NEVER DENSE)
+# ------------------------------------------------------------
+
+def make_model(kind):
+    if kind == 'tree':
+        return DecisionTreeClassifier(criterion='entropy')
+    if kind == 'nb':
+        # binarize=None: the matrix is already 0/1 (no copy)
+        return BernoulliNB(binarize=None)
+    raise ValueError(f"unknown model kind: {kind!r} (use 'tree' or 'nb')")
+
+
+def train(records, kind):
+    """
+    records: iterable of (symptom list, disease)
+    Returns the artifact dictionary
+    """
+    diseases = []
+
+    def symptom_lists():
+        for symptoms, disease in records:
+            diseases.append(disease)
+            yield symptoms
+
+    encoder = MultiHotEncoder()
+    X = encoder.fit_transform(symptom_lists())
+
+    label_encoder = LabelEncoder()
+    y_encoded = label_encoder.fit_transform(diseases)
+
+    model = make_model(kind)
+    model.fit(X, y_encoded)
+
+    return {
+        'kind': f'multi-hot-{kind}',
+        'features': ['Symptoms'],
+        'target': TARGET,
+        'encoder': encoder,
+        'label_encoder': label_encoder,
+        'model': model,
+        'training_rows': X.shape[0],
+        'symptoms_present': int(X.nnz),
+    }
+
+
+def predict(artifact, symptom_lists, with_proba=False):
+    """
+    Return (diseases, unknown symptoms per patient[, probabilities]);
+    unknown symptoms are ignored, not an error
+    """
+    X, unknown = artifact['encoder'].transform(symptom_lists)
+    diseases = artifact['label_encoder'].inverse_transform(artifact['model'].predict(X))
+    if with_proba:
+        return diseases, unknown, artifact['model'].predict_proba(X)
+    return diseases, unknown
+
+
+# ------------------------------------------------------------
+# STEP 4: SAMPLE DATA AND BENCHMARK
+# ------------------------------------------------------------
+
+def make_sample(path, patients, vocabulary, diseases=20, seed=0):
+    """
+    Random intake records: 1-8 symptoms per patient, each disease
+    has its own typical symptoms
+    """
+    rng = random.Random(seed)
+    symptoms = [f"Symptom-{i:05d}" for i in range(vocabulary)]
+    typical = {f"Disease-{d:02d}": rng.sample(symptoms, 10) for d in range(diseases)}
+    names = list(typical)
+    with open(path, "w", newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Symptoms', TARGET])
+        for _ in range(patients):
+            disease = rng.choice(names)
+            count = rng.randint(1, 8)
+            chosen = {rng.choice(typical[disease]) if rng.random() < 0.6 else rng.choice(symptoms)
+                      for _ in range(count)}
+            writer.writerow([";".join(sorted(chosen)), disease])
+
+
+def benchmark(path, kinds=("nb", "tree")):
+    start = time.perf_counter()
+    records = list(read_records(path))
+    print(f"Read {len(records)} patients in {time.perf_counter() - start:.2f}s")
+
+    for kind in kinds:
+        start = time.perf_counter()
+        artifact = train(records, kind)
+        fit_time = time.perf_counter() - start
+
+        X, _ = artifact['encoder'].transform(symptoms for symptoms, _ in records)
+        sparse_mb = (X.data.nbytes + X.indices.nbytes + X.indptr.nbytes) / 1e6
+        dense_mb = X.shape[0] * X.shape[1] * 4 / 1e6
+
+        start = time.perf_counter()
+        diseases, _ = predict(artifact, [symptoms for symptoms, _ in records])
+        predict_time = time.perf_counter() - start
+        accuracy = np.mean(diseases == np.array([disease for _, disease in records]))
+
+        print(f"{kind:<4} {X.shape[0]} patients x {X.shape[1]} symptoms, {X.nnz} present: "
+              f"sparse {sparse_mb:.1f} MB (dense would be {dense_mb:,.0f} MB)")
+        print(f"     train {fit_time:.2f}s, predict {len(records) / predict_time:,.0f} rows/sec, "
+              f"training accuracy {accuracy:.3f}")
+
+
+# ------------------------------------------------------------
+# STEP 5: ROUND TRIP (SAVE HERE, LOAD ELSEWHERE)
+# ------------------------------------------------------------
+# The artifact stores the MultiHotEncoder by its module name.
+# It must be "multi_hot.MultiHotEncoder" (not "__main__..."),
+# otherwise only this script could ever load it again.
+
+ROUNDTRIP_CODE = (
+    "import sys, model_artifact\n"
+    "artifact = model_artifact.load_artifact(sys.argv[1])\n"
+    "X, unknown = artifact['encoder'].transform([sys.argv[2:]])\n"
+    "print(artifact['label_encoder'].inverse_transform(artifact['model'].predict(X))[0])\n"
+)
+
+
+def roundtrip(kind="nb", patients=2000, vocabulary=200):
+    """
+    Train and save an artifact, load it in a fresh Python process
+    through model_artifact.py, and compare one prediction
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = os.path.join(tmp, "intake.csv")
+        model_path = os.path.join(tmp, "roundtrip.model")
+        make_sample(data_path, patients, vocabulary)
+        records = list(read_records(data_path))
+        artifact = train(records, kind)
+        save_artifact(artifact, model_path)
+
+        symptoms = records[0][0]
+        expected = predict(artifact, [symptoms])[0][0]
+        out = subprocess.run([sys.executable, "-c", ROUNDTRIP_CODE, model_path, *symptoms],
+                             cwd=here, capture_output=True, text=True)
+        if out.returncode != 0:
+            raise SystemExit(f"Round trip FAILED: the artifact does not load outside multi_hot.py\n{out.stderr}")
+        got = out.stdout.strip()
+        if got != expected:
+            raise SystemExit(f"Round trip FAILED: predicted {got!r} after loading, {expected!r} before")
+        print(f"Round trip OK: {type(artifact['encoder']).__module__}.MultiHotEncoder "
+              f"loaded by model_artifact.py, same prediction ({got})")
+
+
+if __name__ == "__main__":
+    # Use the functions of the IMPORTED module, so pickled encoders are
+    # multi_hot.MultiHotEncoder and load from any program (see STEP 5)
+    from multi_hot import predict, read_records, roundtrip, train
+
+    parser = argparse.ArgumentParser(description="Sparse multi-hot symptom models.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    train_cmd = sub.add_parser("train", help="train on intake records and save an artifact")
+    train_cmd.add_argument("--model", choices=["tree", "nb"], required=True)
+    train_cmd.add_argument("--data", required=True, help="CSV with a symptom list column and Disease")
+    train_cmd.add_argument("--list-column", default="Symptoms")
+    train_cmd.add_argument("--sep", default=";", help="separator inside the symptom list column")
+    train_cmd.add_argument("--symptom-columns", nargs="+",
+                           help="use several one-symptom columns instead (e.g. 'Symptom 1' 'Symptom 2')")
+    train_cmd.add_argument("-o", "--output", required=True)
+
+    predict_cmd = sub.add_parser("predict", help="predict one patient")
+    predict_cmd.add_argument("artifact")
+    predict_cmd.add_argument("symptoms", nargs="+")
+
+    sample_cmd = sub.add_parser("make-sample", help="write random intake records")
+    sample_cmd.add_argument("path")
+    sample_cmd.add_argument("--patients", type=int, default=100000)
+    sample_cmd.add_argument("--vocabulary", type=int, default=5000)
+
+    bench_cmd = sub.add_parser("bench", help="memory, train time and rows/sec on a CSV")
+    bench_cmd.add_argument("path")
+
+    roundtrip_cmd = sub.add_parser("roundtrip", help="check that a saved artifact loads from another program")
+    roundtrip_cmd.add_argument("--model", choices=["tree", "nb"], default="nb")
+    args = parser.parse_args()
+
+    if args.command == "train":
+        start = time.perf_counter()
+        artifact = train(read_records(args.data, args.list_column, args.symptom_columns, sep=args.sep),
+                         args.model)
+        save_artifact(artifact, args.output)
+        print(f"Trained {artifact['kind']} on {artifact['training_rows']} patients "
+              f"({artifact['symptoms_present']} symptoms present, "
+              f"{len(artifact['encoder'].vocabulary)} distinct) in {time.perf_counter() - start:.2f}s")
+        print(f"Wrote {args.output}")
+
+    elif args.command == "predict":
+        try:
+            artifact = load_artifact(args.artifact, expected_kind=("multi-hot-tree", "multi-hot-nb"))
+        except ValueError as e:
+            raise SystemExit(f"ERROR: {e}")
+        diseases, unknown = predict(artifact, [args.symptoms])
+        print(f"Predicted Disease: {diseases[0]}")
+        if unknown[0]:
+            print(f"Ignored unknown symptoms: {', '.join(unknown[0])}")
+
+    elif args.command == "make-sample":
+        make_sample(args.path, args.patients, args.vocabulary)
+        print(f"Wrote {args.patients} patients to {args.path}")
+
+    elif args.command == "roundtrip":
+        roundtrip(args.model)
+
+    else:
+        benchmark(args.path)
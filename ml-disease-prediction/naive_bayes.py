@@ -36,99 +36,135 @@ from sklearn.metrics import accuracy_score
 # Converts target class labels (Disease names) into numbers
 from sklearn.preprocessing import LabelEncoder, OrdinalEncoder
 
+# argparse: reads the optional --model argument
+import argparse
 
-# ------------------------------------------------------------
-# STEP 1: CREATE THE MEDICAL DATASET
-# ------------------------------------------------------------
-# This dataset represents historical medical records.
-#
-# Each row = one patient
-# Columns:
-# - Symptom 1
-# - Symptom 2
-# - Disease (TARGET CLASS)
-
-data = pd.DataFrame({
-    'Symptom 1': [
-        'Diarrhea',
-        'Diarrhea',
-        'Paralysis',
-        'Paralysis',
-        'Paralysis'
-    ],
-    'Symptom 2': [
-        'Fever',
-        'Vomiting',
-        'Headache',
-        'Vomiting',
-        'Vomiting'
-    ],
-    'Disease': [
-        'Mesiopathy',
-        'Mesiopathy',
-        'Mesiopathy',
-        'Ritengitis',
-        'Ritengitis'
-    ]
-})
-
-# IMPORTANT:
-# Naive Bayes requires numeric values
-# So text data must be encoded before training
+# load_artifact: reads a model saved by model_artifact.py
+from model_artifact import load_artifact
 
 
 # ------------------------------------------------------------
-# STEP 2: DATA PREPROCESSING (ENCODING)
+# SAVED MODEL (OPTIONAL)
 # ------------------------------------------------------------
+# With --model, STEPS 1-3 are skipped: the fitted model and
+# both encoders are loaded from an artifact made by
+#   python model_artifact.py train --model nb -o disease_nb.model
+# so startup does not depend on the size of the training data.
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--model", help="artifact saved by model_artifact.py")
+args = parser.parse_args()
+
+if args.model:
+    # A model of the other kind (or a multi-hot model) is refused
+    try:
+        artifact = load_artifact(args.model, expected_kind='nb')
+    except ValueError as e:
+        raise SystemExit(f"ERROR: {e}")
+    encoder = artifact['encoder']
+    label_encoder = artifact['label_encoder']
+    model = artifact['model']
+    features = artifact['features']
+
+    # Valid options = the categories the encoder has learned
+    symptom_options = artifact['encoder'].categories_
+
+else:
+    # ------------------------------------------------------------
+    # STEP 1: CREATE THE MEDICAL DATASET
+    # ------------------------------------------------------------
+    # This dataset represents historical medical records.
+    #
+    # Each row = one patient
+    # Columns:
+    # - Symptom 1
+    # - Symptom 2
+    # - Disease (TARGET CLASS)
+
+    data = pd.DataFrame({
+        'Symptom 1': [
+            'Diarrhea',
+            'Diarrhea',
+            'Paralysis',
+            'Paralysis',
+            'Paralysis'
+        ],
+        'Symptom 2': [
+            'Fever',
+            'Vomiting',
+            'Headache',
+            'Vomiting',
+            'Vomiting'
+        ],
+        'Disease': [
+            'Mesiopathy',
+            'Mesiopathy',
+            'Mesiopathy',
+            'Ritengitis',
+            'Ritengitis'
+        ]
+    })
 
-# Create encoder objects
-encoder = OrdinalEncoder()
-label_encoder = LabelEncoder()
+    # IMPORTANT:
+    # Naive Bayes requires numeric values
+    # So text data must be encoded before training
 
-# FEATURES (INPUT VARIABLES)
-# These are the predictors
-features = ['Symptom 1', 'Symptom 2']
 
-# X = feature data
-X = data[features]
+    # ------------------------------------------------------------
+    # STEP 2: DATA PREPROCESSING (ENCODING)
+    # ------------------------------------------------------------
 
-# Convert categorical symptom values into numbers
-# Example:
-# Diarrhea → 0
-# Paralysis → 1
-# Fever → 0
-# Vomiting → 1
-X_encoded = encoder.fit_transform(X)
+    # Create encoder objects
+    encoder = OrdinalEncoder()
+    label_encoder = LabelEncoder()
 
-# TARGET VARIABLE
-# This is what the model learns to predict
-y = data['Disease']
+    # FEATURES (INPUT VARIABLES)
+    # These are the predictors
+    features = ['Symptom 1', 'Symptom 2']
 
-# Encode disease labels into numbers
-# Example:
-# Mesiopathy → 0
-# Ritengitis → 1
-y_encoded = label_encoder.fit_transform(y)
+    # X = feature data
+    X = data[features]
 
+    # Convert categorical symptom values into numbers
+    # Example:
+    # Diarrhea → 0
+    # Paralysis → 1
+    # Fever → 0
+    # Vomiting → 1
+    X_encoded = encoder.fit_transform(X)
 
-# ------------------------------------------------------------
-# STEP 3: TRAIN THE CATEGORICAL NAIVE BAYES MODEL
-# ------------------------------------------------------------
+    # TARGET VARIABLE
+    # This is what the model learns to predict
+    y = data['Disease']
 
-# Create the Naive Bayes model
-#
-# Naive Bayes assumes:
-# 1. Features are independent
-# 2. Uses Bayes Theorem:
-#
-# P(Disease | Symptoms) =
-# (P(Symptoms | Disease) * P(Disease)) / P(Symptoms)
-#
-# The model calculates probabilities from training data
-model = CategoricalNB()
+    # Encode disease labels into numbers
+    # Example:
+    # Mesiopathy → 0
+    # Ritengitis → 1
+    y_encoded = label_encoder.fit_transform(y)
+
+
+    # ------------------------------------------------------------
+    # STEP 3: TRAIN THE CATEGORICAL NAIVE BAYES MODEL
+    # ------------------------------------------------------------
+
+    # Create the Naive Bayes model
+    #
+    # Naive Bayes assumes:
+    # 1. Features are independent
+    # 2. Uses Bayes Theorem:
+    #
+    # P(Disease | Symptoms) =
+    # (P(Symptoms | Disease) * P(Disease)) / P(Symptoms)
+    #
+    # The model calculates probabilities from training data
+    model = CategoricalNB()
+
+    # Train the model using encoded data
+    model.fit(X_encoded, y_encoded)
 
-# Train the model using encoded data
-model.fit(X_encoded, y_encoded)
+    # Valid options = the symptoms seen in the training data
+    symptom_options = [data[feature].unique() for feature in features]
 
 
 # ------------------------------------------------------------
@@ -138,8 +174,8 @@ model.fit(X_encoded, y_encoded)
 print("\n--- INPUT FOR DISEASE PREDICTION ---")
 
 # Display valid symptom options
-print("Available Symptom 1 options:", data['Symptom 1'].unique())
-print("Available Symptom 2 options:", data['Symptom 2'].unique())
+print("Available Symptom 1 options:", symptom_options[0])
+print("Available Symptom 2 options:", symptom_options[1])
 
 try:
     # Take symptom input from the user
@@ -0,0 +1,300 @@
+# ============================================================
+# LOCAL PREDICTION SERVICE WITH MICRO-BATCHING
+# ============================================================
+# decision_tree.py and naive_bayes.py ask ONE question through
+# input() and exit. This program keeps a saved model in memory
+# and answers many clients over HTTP (TCP port or Unix socket).
+#
+# MICRO-BATCHING:
+# Requests that arrive at (almost) the same time are put
+# together in ONE batch, and the batch is predicted with ONE
+# vectorized model.predict call (see batch_predict.py):
+# - a batch is sent as soon as it has --max-batch requests
+# - or when the oldest request has waited --max-wait-ms
+#
+# ENDPOINTS:
+#   POST /predict   {"symptoms": ["Paralysis", "Vomiting"]}
+#                   → {"disease": "Ritengitis", "unknown": []}
+#   GET  /metrics   latency p50 / p99, batch-size histogram
+#   GET  /health
+#
+# USAGE:
+#   python model_artifact.py train --model tree -o disease_tree.model
+#   python prediction_service.py disease_tree.model --port 8080
+#   python prediction_service.py disease_nb.model --unix /tmp/disease.sock
+#   python load_generator.py --port 8080 --clients 64 --requests 200
+# ============================================================
+
+
+# ------------------------------------------------------------
+# STEP 0: IMPORT REQUIRED LIBRARIES
+# ------------------------------------------------------------
+
+# argparse / asyncio / json / os / time: command line, server, messages
+import argparse
+import asyncio
+import json
+import os
+import time
+
+# Counter: batch-size histogram
+# deque: the most recent latencies
+from collections import Counter, deque
+
+# NumPy / pandas: percentiles and the batch DataFrame
+import numpy as np
+import pandas as pd
+
+# Saved model + vectorized chunk prediction
+from batch_predict import predict_chunk
+from model_artifact import KINDS, load_artifact
+
+
+# ------------------------------------------------------------
+# STEP 1: METRICS
+# ------------------------------------------------------------
+
+class Metrics:
+    """
+    Request latencies (most recent `window`) and batch sizes
+    """
+
+    def __init__(self, window=100000):
+        self.latencies = deque(maxlen=window)
+        self.batch_sizes = Counter()
+        self.requests = 0
+        self.errors = 0
+        self.started = time.time()
+
+    def report(self):
+        latencies = np.array(self.latencies) * 1000
+        percentiles = {}
+        if len(latencies):
+            for name, q in (("p50", 50), ("p90", 90), ("p99", 99), ("max", 100)):
+                percentiles[name] = round(float(np.percentile(latencies, q)), 3)
+        batches = sum(self.batch_sizes.values())
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "latency_ms": percentiles,
+            "batches": batches,
+            "mean_batch_size": round(self.requests / batches, 2) if batches else 0,
+            "batch_size_histogram": {str(size): count for size, count in sorted(self.batch_sizes.items())},
+        }
+
+
+# ------------------------------------------------------------
+# STEP 2: THE MICRO-BATCHER
+# ------------------------------------------------------------
+
+class MicroBatcher:
+    """
+    Collects single predictions into batches for predict_chunk()
+    """
+
+    def __init__(self, artifact, max_batch=64, max_wait=0.002, metrics=None):
+        self.artifact = artifact
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.metrics = metrics or Metrics()
+        self.queue = asyncio.Queue()
+
+    async def predict(self, symptoms):
+        """
+        Called once per request; waits for the batch result
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((symptoms, future))
+        return await future
+
+    async def run(self):
+        """
+        Forever: take one request, wait (at most max_wait) for
+        more, predict the whole batch at once
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Anything already queued joins without waiting
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            # The prediction runs on the event loop itself: for these
+            # small models a whole batch takes well under a millisecond
+            self.metrics.batch_sizes[len(batch)] += 1
+            try:
+                results = self.predict_batch([symptoms for symptoms, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def predict_batch(self, rows):
+        """
+        One vectorized prediction for all rows of the batch
+        """
+        chunk = pd.DataFrame(rows, columns=self.artifact['features'])
+        result = predict_chunk(chunk, self.artifact)
+        return [
+            {"disease": disease or None, "unknown": unknown.split(";") if unknown else []}
+            for disease, unknown in zip(result['Predicted Disease'], result['Unknown Symptoms'])
+        ]
+
+
+# ------------------------------------------------------------
+# STEP 3: A SMALL HTTP/1.1 SERVER (KEEP-ALIVE)
+# ------------------------------------------------------------
+
+STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+
+
+def parse_symptoms(body, features):
+    """
+    Accept {"symptoms": [...]} or {"Symptom 1": ..., "Symptom 2": ...}
+    """
+    request = json.loads(body)
+    if not isinstance(request, dict):
+        raise ValueError("expected a JSON object")
+    if "symptoms" in request:
+        symptoms = request["symptoms"]
+    else:
+        missing = [feature for feature in features if feature not in request]
+        if missing:
+            raise ValueError(f"missing symptoms: {missing}")
+        symptoms = [request[feature] for feature in features]
+    if not isinstance(symptoms, list) or len(symptoms) != len(features):
+        raise ValueError(f"expected {len(features)} symptoms: {features}")
+    return [str(symptom) for symptom in symptoms]
+
+
+async def respond(writer, status, payload):
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(
+        f"HTTP/1.1 {status} {STATUS[status]}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+    )
+    await writer.drain()
+
+
+def make_handler(batcher):
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+                    headers = {}
+                    while True:
+                        line = await reader.readline()
+                        if line in (b"\r\n", b"\n", b""):
+                            break
+                        name, _, value = line.decode("latin-1").partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                    length = int(headers.get("content-length", 0))
+                    if length < 0:
+                        raise ValueError(f"negative Content-Length: {length}")
+                except ValueError as e:
+                    # The framing is unknown, so answer and close the connection
+                    batcher.metrics.errors += 1
+                    await respond(writer, 400, {"error": f"malformed request: {e}"})
+                    break
+                body = await reader.readexactly(length)
+
+                start = time.perf_counter()
+                if method == "POST" and path == "/predict":
+                    try:
+                        symptoms = parse_symptoms(body, batcher.artifact['features'])
+                    except ValueError as e:
+                        batcher.metrics.errors += 1
+                        await respond(writer, 400, {"error": str(e)})
+                        continue
+                    try:
+                        result = await batcher.predict(symptoms)
+                    except Exception as e:
+                        batcher.metrics.errors += 1
+                        await respond(writer, 500, {"error": str(e)})
+                        continue
+                    batcher.metrics.latencies.append(time.perf_counter() - start)
+                    batcher.metrics.requests += 1
+                    await respond(writer, 200, result)
+                elif method == "GET" and path == "/metrics":
+                    await respond(writer, 200, batcher.metrics.report())
+                elif method == "GET" and path == "/health":
+                    await respond(writer, 200, {"status": "ok", "model": batcher.artifact['kind']})
+                else:
+                    await respond(writer, 404, {"error": f"no route for {method} {path}"})
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    return handle
+
+
+async def serve(artifact, host, port, unix_path, max_batch, max_wait):
+    batcher = MicroBatcher(artifact, max_batch, max_wait)
+    batch_task = asyncio.create_task(batcher.run())
+
+    handler = make_handler(batcher)
+    if unix_path:
+        if os.path.exists(unix_path):
+            os.remove(unix_path)
+        server = await asyncio.start_unix_server(handler, path=unix_path)
+        where = unix_path
+    else:
+        server = await asyncio.start_server(handler, host, port)
+        where = f"http://{host}:{port}"
+
+    print(f"Serving {artifact['kind']} model on {where} "
+          f"(max batch {max_batch}, max wait {max_wait * 1000:.1f} ms)")
+    async with server:
+        try:
+            await server.serve_forever()
+        finally:
+            batch_task.cancel()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-batching prediction service for a saved disease model.")
+    parser.add_argument("artifact", help="model saved by model_artifact.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    # Multi-hot models need their own encoder (see multi_hot.py)
+    try:
+        artifact = load_artifact(args.artifact, expected_kind=KINDS)
+    except ValueError as e:
+        raise SystemExit(f"ERROR: {e}")
+
+    try:
+        asyncio.run(serve(artifact, args.host, args.port, args.unix,
+                          args.max_batch, args.max_wait_ms / 1000))
+    except KeyboardInterrupt:
+        pass
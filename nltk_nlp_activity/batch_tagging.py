@@ -0,0 +1,238 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Tag MANY documents with Part-of-Speech (POS) tags, fast
+# 2. Split every document into sentences and tokens
+# 3. Tag the sentences in BATCHES with ONE tagger per process
+# 4. Spread the batches over a pool of worker processes
+# 5. Give back the tagged documents in the SAME order
+# ----------------------------------------------------
+#
+# WHY:
+# nltk.pos_tag(tokens) keeps one cached PerceptronTagger, but it
+# tags ONE sentence per call and runs in ONE process. The gain
+# here comes from:
+# - tag_sents: one call for a whole batch of sentences
+# - a pool of workers, each loading its tagger ONCE at startup
+#   (so the first batch does not pay for loading the weights)
+#
+# Used by topic_words.py, pos_based_lemmatization.py and
+# ner_exploration.py.
+#
+# USAGE (benchmark, tokens/sec per worker count):
+#   python batch_tagging.py --benchmark
+#   python batch_tagging.py articles.txt --benchmark --workers 1 2 4 8
+
+# argparse / os / random / time: command line and benchmark helpers
+import argparse
+import os
+import random
+import time
+
+# deque: keeps the batches that are being tagged, in order
+from collections import deque
+
+# Pool: runs the workers as separate processes
+from multiprocessing import Pool
+
+# PerceptronTagger: the model behind nltk.pos_tag
+from nltk.tag import PerceptronTagger
+
+# Sentence + word tokenization, exact (NLTK) or fast (see fast_tokenizer.py)
+from fast_tokenizer import MODES, get_mode, sentence_tokens, set_mode
+
+# Optional per-stage timing (see instrumentation.py)
+import instrumentation
+from instrumentation import stage
+
+
+# ----------------------------------------------------
+# STEP 1: ONE TAGGER PER PROCESS
+# ----------------------------------------------------
+
+_tagger = None
+
+
+def get_tagger():
+    """
+    Return this process's tagger, loading it the first time
+    """
+    global _tagger
+    if _tagger is None:
+        _tagger = PerceptronTagger()
+    return _tagger
+
+
+def tag_tokens(tokens):
+    """
+    Same result as nltk.pos_tag(tokens), but reuses the loaded tagger
+    """
+    tagger = get_tagger()
+    with stage("pos_tag", tokens=len(tokens)):
+        return tagger.tag(tokens)
+
+
+# ----------------------------------------------------
+# STEP 2: SPLIT A DOCUMENT INTO SENTENCES AND TOKENS
+# ----------------------------------------------------
+
+def split_document(text):
+    """
+    Return the document as a list of sentences,
+    each sentence being a list of tokens
+    """
+    with stage("tokenize") as s:
+        sentences = sentence_tokens(text)
+        s.tokens = sum(len(sentence) for sentence in sentences)
+    return sentences
+
+
+# ----------------------------------------------------
+# STEP 3: TAG A BATCH OF DOCUMENTS (RUNS IN A WORKER)
+# ----------------------------------------------------
+
+def tag_batch(texts):
+    """
+    Tag a list of documents with a single tag_sents call
+
+    Returns one item per document:
+    a list of tagged sentences [[(word, tag), ...], ...]
+    """
+    documents = [split_document(text) for text in texts]
+
+    # Put ALL sentences of the batch in one list ...
+    sentences = [sentence for document in documents for sentence in document]
+    tagger = get_tagger()
+    with stage("pos_tag", tokens=sum(len(sentence) for sentence in sentences)):
+        tagged = tagger.tag_sents(sentences)
+
+    # ... and cut the result back into documents
+    results = []
+    position = 0
+    for document in documents:
+        results.append(tagged[position:position + len(document)])
+        position += len(document)
+    return results
+
+
+def batched(items, batch_size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ----------------------------------------------------
+# STEP 4: TAG ALL DOCUMENTS (IN ORDER)
+# ----------------------------------------------------
+
+def tag_documents(texts, workers=1, batch_size=64):
+    """
+    Yield the tagged version of every text, in input order
+
+    texts can be any iterable (for example the lines of a file);
+    only a few batches per worker are in memory at a time
+    """
+    batches = batched(texts, batch_size)
+
+    # A single worker does not need a pool at all
+    if workers <= 1:
+        for batch in batches:
+            yield from tag_batch(batch)
+        return
+
+    # With instrumentation on, every batch comes back together
+    # with the worker's timings, which are added to ours
+    measured = instrumentation.enabled()
+
+    def result(task):
+        if not measured:
+            return task.get()
+        tagged, numbers = task.get()
+        instrumentation.merge(numbers)
+        return tagged
+
+    with Pool(processes=workers, initializer=instrumentation.init_worker, initargs=(get_tagger,)) as pool:
+        pending = deque()
+        for batch in batches:
+            if measured:
+                pending.append(pool.apply_async(instrumentation.run_measured, (tag_batch, batch)))
+            else:
+                pending.append(pool.apply_async(tag_batch, (batch,)))
+
+            # Wait for the OLDEST batch first -> output keeps input order
+            if len(pending) >= workers * 2:
+                yield from result(pending.popleft())
+
+        while pending:
+            yield from result(pending.popleft())
+
+
+def flatten(tagged_document):
+    """
+    Turn [[(word, tag), ...], ...] into one list [(word, tag), ...]
+    (the same shape as nltk.pos_tag returns)
+    """
+    return [pair for sentence in tagged_document for pair in sentence]
+
+
+# ----------------------------------------------------
+# STEP 5: BENCHMARK (TOKENS / SEC PER WORKER COUNT)
+# ----------------------------------------------------
+
+SAMPLE_SENTENCES = [
+    "Artificial intelligence and machine learning are transforming industries worldwide.",
+    "Barack Obama was born in Hawaii.",
+    "He was elected president of the USA.",
+    "The striped bats are hanging on their feet for best.",
+    "Companies like OpenAI, Google, and Meta are releasing new models.",
+    "Governments in the United States and Europe are debating regulations.",
+]
+
+
+def synthetic_documents(count, seed=0):
+    """
+    Build `count` documents of 3-8 sentences each
+    """
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(SAMPLE_SENTENCES, k=rng.randint(3, 8))) for _ in range(count)]
+
+
+def benchmark(texts, worker_counts, batch_size):
+    texts = list(texts)
+    print(f"{len(texts)} documents, batch size {batch_size}, cores available: {os.cpu_count()}")
+    for workers in worker_counts:
+        start = time.perf_counter()
+        tokens = sum(len(flatten(doc)) for doc in tag_documents(texts, workers, batch_size))
+        elapsed = time.perf_counter() - start
+        print(f"workers={workers:<2} tokens={tokens} time={elapsed:6.2f}s tokens/sec={tokens / elapsed:,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batched, multi-process POS tagging.")
+    parser.add_argument("path", nargs="?", help="file with one document per line")
+    parser.add_argument("--workers", type=int, nargs="+", default=[os.cpu_count() or 1])
+    parser.add_argument("--tokenizer", choices=MODES, default=get_mode(),
+                        help="exact = nltk.word_tokenize, fast = fast_tokenizer.py (default: $NLP_TOKENIZER or exact)")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--benchmark", action="store_true",
+                        help="report tokens/sec for every --workers value")
+    parser.add_argument("--documents", type=int, default=5000,
+                        help="synthetic documents to generate when no file is given")
+    args = parser.parse_args()
+    set_mode(args.tokenizer)
+
+    if args.path:
+        with open(args.path, encoding="utf-8") as f:
+            texts = [line for line in f if line.strip()]
+    else:
+        texts = synthetic_documents(args.documents)
+
+    if args.benchmark:
+        benchmark(texts, args.workers, args.batch_size)
+    else:
+        for tagged in tag_documents(texts, args.workers[0], args.batch_size):
+            print(flatten(tagged))
@@ -0,0 +1,214 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Evaluate the sentiment classifier with k-fold
+#    (and repeated k-fold) cross-validation
+# 2. Build the features ONCE for all folds
+# 3. Share them with the worker processes WITHOUT copying
+#    them for every fold (shared memory)
+# 4. Train and evaluate the folds in parallel
+# 5. Report mean / standard deviation of the accuracy
+#    and the time taken by every fold
+# ----------------------------------------------------
+#
+# WHY:
+# sentiment.py makes ONE random 1500 / 500 split, so its accuracy
+# changes a lot from run to run.
+#
+# HOW:
+# - All reviews become one CSR matrix over the whole vocabulary
+#   (sparse_nb.py). Its three arrays are copied ONCE into shared
+#   memory; every worker maps them and sees the same bytes.
+# - A fold never slices the matrix: the training counts are
+#   Y_train.T @ X, where Y_train has rows only for training
+#   documents. Words that no training document contains are
+#   ignored, exactly like NaiveBayesClassifier does.
+#
+# USAGE:
+#   python crossval.py                         (10 folds, all cores)
+#   python crossval.py --folds 5 --repeats 3   (repeated 5-fold)
+#   python crossval.py --token-cache movie_reviews_cache --workers 4
+
+# argparse / os / random / statistics / time: command line, folds, report
+import argparse
+import os
+import random
+import statistics
+import time
+
+# Pool: runs the folds in separate processes
+# shared_memory: the feature matrix, shared by all workers
+from multiprocessing import Pool, shared_memory
+
+# NumPy / SciPy: arrays and the sparse matrix
+import numpy as np
+from scipy import sparse
+
+# The vectorized Naive Bayes engine
+from sparse_nb import SparseNaiveBayes, build_vocabulary, count_matrix, load_movie_reviews, to_matrix
+
+
+# ----------------------------------------------------
+# STEP 1: BUILD THE FEATURES ONCE
+# ----------------------------------------------------
+
+def load_features(token_cache=None):
+    """
+    Return (CSR matrix of all reviews, label ids, label names, vocabulary)
+    """
+    if token_cache:
+        from token_cache import TokenCache
+
+        cache = TokenCache(token_cache)
+        vocabulary = {word: i for i, word in enumerate(cache.vocab)}
+        return cache.matrix(), np.asarray(cache.labels, dtype=np.int64), cache.label_names, vocabulary
+
+    documents = load_movie_reviews()
+    vocabulary = build_vocabulary(d for d, _ in documents)
+    label_names = list(dict.fromkeys(c for _, c in documents))
+    labels = np.array([label_names.index(c) for _, c in documents], dtype=np.int64)
+    return to_matrix((d for d, _ in documents), vocabulary), labels, label_names, vocabulary
+
+
+# ----------------------------------------------------
+# STEP 2: SHARE THE MATRIX WITH THE WORKERS
+# ----------------------------------------------------
+
+def share_arrays(arrays):
+    """
+    Copy every array into a shared memory block;
+    returns the blocks and a picklable description of them
+    """
+    blocks, description = [], {}
+    for name, array in arrays.items():
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+        blocks.append(block)
+        description[name] = (block.name, array.shape, array.dtype.str)
+    return blocks, description
+
+
+_shared = {}
+
+
+def install(X, labels, label_names, vocabulary):
+    _shared.update(X=X, labels=labels, label_names=label_names, vocabulary=vocabulary)
+
+
+def init_worker(description, shape, label_names, vocabulary):
+    """
+    Runs once per worker: map the shared arrays (no copy)
+    """
+    arrays = {}
+    for name, (block_name, array_shape, dtype) in description.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        _shared.setdefault("blocks", []).append(block)
+        arrays[name] = np.ndarray(array_shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+    X = sparse.csr_matrix((arrays["data"], arrays["indices"], arrays["indptr"]), shape=shape, copy=False)
+    install(X, arrays["labels"], label_names, vocabulary)
+
+
+# ----------------------------------------------------
+# STEP 3: ONE FOLD (RUNS IN A WORKER)
+# ----------------------------------------------------
+
+def make_folds(documents, folds, repeats, seed):
+    """
+    [(repeat, fold, test row numbers), ...]
+    every repeat uses its own shuffle
+    """
+    tasks = []
+    for repeat in range(repeats):
+        order = list(range(documents))
+        random.Random(seed + repeat).shuffle(order)
+        for fold, test_rows in enumerate(np.array_split(np.array(order), folds)):
+            tasks.append((repeat, fold, np.sort(test_rows)))
+    return tasks
+
+
+def run_fold(task, model="nltk"):
+    """
+    Train on every document outside the fold, test on the fold;
+    returns (repeat, fold, accuracy, seconds)
+    """
+    repeat, fold, test_rows = task
+    start = time.perf_counter()
+    X, labels = _shared["X"], _shared["labels"]
+
+    # Training counts: test documents simply get no label row
+    train = np.ones(len(labels), dtype=bool)
+    train[test_rows] = False
+    label_ids = np.where(train, labels, len(_shared["label_names"]))
+    counts, doc_counts = count_matrix(X, label_ids, len(_shared["label_names"]) + 1)
+
+    # Labels in order of first appearance in the training documents
+    # (this decides ties, exactly as in NaiveBayesClassifier)
+    order = list(dict.fromkeys(labels[train].tolist()))
+    classifier = SparseNaiveBayes(model).fit_counts(
+        counts[order], doc_counts[order], [_shared["label_names"][i] for i in order], _shared["vocabulary"])
+
+    predicted = np.array(order)[classifier.log_scores(X[test_rows]).argmax(axis=1)]
+    accuracy = float((predicted == labels[test_rows]).mean())
+    return repeat, fold, accuracy, time.perf_counter() - start
+
+
+def _run_fold_star(args):
+    return run_fold(*args)
+
+
+# ----------------------------------------------------
+# STEP 4: ALL FOLDS (IN PARALLEL)
+# ----------------------------------------------------
+
+def cross_validate(X, labels, label_names, vocabulary, folds=10, repeats=1, workers=1, seed=0, model="nltk"):
+    """
+    Return [(repeat, fold, accuracy, seconds), ...]
+    """
+    tasks = [(task, model) for task in make_folds(X.shape[0], folds, repeats, seed)]
+    X = X.tocsr()
+
+    # A single worker does not need a pool (or shared memory) at all
+    if workers <= 1:
+        install(X, labels, label_names, vocabulary)
+        return [_run_fold_star(task) for task in tasks]
+
+    blocks, description = share_arrays(
+        {"data": X.data, "indices": X.indices, "indptr": X.indptr, "labels": labels})
+    try:
+        with Pool(processes=workers, initializer=init_worker,
+                  initargs=(description, X.shape, label_names, vocabulary)) as pool:
+            return pool.map(_run_fold_star, tasks, chunksize=1)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel (repeated) k-fold cross-validation.")
+    parser.add_argument("--folds", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--model", choices=["nltk", "bernoulli", "multinomial"], default="nltk")
+    parser.add_argument("--token-cache", metavar="DIR", help="read the reviews from token_cache.py's cache")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    X, labels, label_names, vocabulary = load_features(args.token_cache)
+    print(f"Features: {X.shape[0]} documents x {X.shape[1]} words "
+          f"({time.perf_counter() - start:.2f}s, built once)")
+
+    start = time.perf_counter()
+    results = cross_validate(X, labels, label_names, vocabulary, args.folds, args.repeats,
+                             args.workers, args.seed, args.model)
+    wall = time.perf_counter() - start
+
+    for repeat, fold, accuracy, seconds in results:
+        print(f"repeat {repeat} fold {fold:<2} accuracy {accuracy:.3f} time {seconds:.3f}s")
+
+    accuracies = [accuracy for _, _, accuracy, _ in results]
+    stddev = statistics.stdev(accuracies) if len(accuracies) > 1 else 0.0
+    print(f"Accuracy: {statistics.mean(accuracies):.4f} +/- {stddev:.4f} "
+          f"({len(results)} folds, {args.workers} workers)")
+    print(f"Wall time {wall:.2f}s, sum of fold times {sum(r[3] for r in results):.2f}s")
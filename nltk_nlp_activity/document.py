@@ -0,0 +1,208 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Wrap ONE text in a Document object
+# 2. Compute its layers only when they are asked for
+#    (lazily), and only ONCE (memoized):
+#    sentences → tokens → POS tags → lemmas
+#                                  → NE tree → entities
+#                                  → noun counts
+# 3. Let topic_words.py, pos_based_lemmatization.py and
+#    ner_exploration.py share the same tokens and tags
+# 4. Run all three analyses over a corpus with each
+#    expensive stage at most once per document
+# ----------------------------------------------------
+#
+# WHY:
+# Each script ran its own word_tokenize + pos_tag. Asking for
+# nouns, lemmas AND entities of one text paid for tokenizing
+# and tagging three times.
+#
+#   document = Document(text)
+#   document.noun_counts     # tokenizes + tags
+#   document.lemmas          # reuses the tags, only lemmatizes
+#   document.entities()      # reuses the tags, only chunks
+#
+# The layers give the same results as the separate scripts
+# (same tokenizer, same tagger, same chunker, same lemmatizer).
+#
+# USAGE (combined run, one document per line):
+#   python document.py articles.txt
+#   python document.py articles.txt --analyses nouns entities
+#   NLP_METRICS=- python document.py articles.txt    (stage counts, see instrumentation.py)
+
+# Import the NLTK library (the NE chunker model)
+import nltk
+
+# argparse: command line options
+import argparse
+
+# Counter: noun, lemma and entity counts
+from collections import Counter
+
+# cached_property: computes a layer the first time it is read
+from functools import cached_property
+
+# Shared stages: sentence splitting + tagging (batch_tagging.py),
+# the optional result cache (result_cache.py), the lemma table
+# (lemma_table.py) and per-stage timing (instrumentation.py)
+from batch_tagging import split_document, tag_tokens
+from fast_tokenizer import MODES, get_mode, set_mode
+from instrumentation import stage
+from lemma_table import default_lemmatizer, wordnet_pos
+from result_cache import cached
+
+
+# ----------------------------------------------------
+# STEP 1: MODELS SHARED BY ALL DOCUMENTS (LOADED ONCE)
+# ----------------------------------------------------
+
+_chunker = None
+_lemmatizer = None
+
+
+def get_chunker():
+    """
+    The model behind nltk.ne_chunk (which reloads it on every call)
+    """
+    global _chunker
+    if _chunker is None:
+        _chunker = nltk.chunk.ne_chunker()
+    return _chunker
+
+
+def get_lemmatizer():
+    """
+    The lemma table if it has been built, otherwise WordNetLemmatizer
+    """
+    global _lemmatizer
+    if _lemmatizer is None:
+        _lemmatizer = default_lemmatizer()
+    return _lemmatizer
+
+
+# ----------------------------------------------------
+# STEP 2: THE DOCUMENT AND ITS LAYERS
+# ----------------------------------------------------
+
+class Document:
+    """
+    One text; every layer is computed on first use and then kept
+    """
+
+    def __init__(self, text, doc_id=None, lemmatizer=None):
+        self.text = text
+        self.doc_id = doc_id
+        self.lemmatizer = lemmatizer
+
+    @cached_property
+    def sentences(self):
+        """
+        [[token, ...], ...] one list of tokens per sentence
+        """
+        return split_document(self.text)
+
+    @cached_property
+    def tokens(self):
+        """
+        All tokens (the same list nltk.word_tokenize(text) gives,
+        or the fast tokenizer's with NLP_TOKENIZER=fast)
+        """
+        return [token for sentence in self.sentences for token in sentence]
+
+    @cached_property
+    def pos_tags(self):
+        """
+        [(word, tag), ...] like nltk.pos_tag(tokens)
+        """
+        tokens = self.tokens
+        return cached("pos_tag", nltk.__version__, tokens, lambda: tag_tokens(tokens))
+
+    @cached_property
+    def lemmas(self):
+        """
+        One lemma per token, using the token's POS tag
+        """
+        lemmatizer = self.lemmatizer or get_lemmatizer()
+        with stage("lemmatize", tokens=len(self.pos_tags)):
+            return [lemmatizer.lemmatize(word, wordnet_pos(tag)) for word, tag in self.pos_tags]
+
+    @cached_property
+    def ne_tree(self):
+        """
+        The named-entity tree, like nltk.ne_chunk(pos_tags)
+        """
+        pos_tags = self.pos_tags
+
+        def chunk():
+            with stage("ne_chunk", tokens=len(pos_tags)):
+                return get_chunker().parse(pos_tags)
+
+        return cached("ne_chunk", nltk.__version__, pos_tags, chunk)
+
+    def entities(self, labels=('PERSON', 'GPE')):
+        """
+        [(entity, label), ...] from the NE tree
+        """
+        # Imported here: ner_exploration.py itself uses Document
+        from ner_exploration import extract_entities
+        return extract_entities(self.ne_tree, labels)
+
+    @cached_property
+    def nouns(self):
+        """
+        The words tagged NN, NNS, NNP or NNPS
+        """
+        # Imported here: topic_words.py itself uses Document
+        from topic_words import select_nouns
+        return select_nouns(self.pos_tags)
+
+    @cached_property
+    def noun_counts(self):
+        return Counter(self.nouns)
+
+
+# ----------------------------------------------------
+# STEP 3: COMBINED RUN OVER A CORPUS
+# ----------------------------------------------------
+
+ANALYSES = ("nouns", "lemmas", "entities")
+
+
+def analyze_corpus(texts, analyses=ANALYSES):
+    """
+    Count nouns, lemmas and entities over all texts;
+    each document is tokenized and tagged once,
+    whatever the number of analyses
+    """
+    totals = {name: Counter() for name in analyses}
+    documents = 0
+    for text in texts:
+        if not text.strip():
+            continue
+        document = Document(text)
+        if "nouns" in totals:
+            totals["nouns"].update(document.noun_counts)
+        if "lemmas" in totals:
+            totals["lemmas"].update(document.lemmas)
+        if "entities" in totals:
+            totals["entities"].update(document.entities())
+        documents += 1
+    return documents, totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Nouns, lemmas and entities with shared tokens and tags.")
+    parser.add_argument("path", help="file with one document per line")
+    parser.add_argument("--analyses", nargs="+", choices=ANALYSES, default=list(ANALYSES))
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--tokenizer", choices=MODES, default=get_mode(),
+                        help="exact = nltk.word_tokenize, fast = fast_tokenizer.py (default: $NLP_TOKENIZER or exact)")
+    args = parser.parse_args()
+    set_mode(args.tokenizer)
+
+    with open(args.path, encoding="utf-8") as f:
+        documents, totals = analyze_corpus(f, args.analyses)
+
+    print(f"{documents} documents")
+    for name, counts in totals.items():
+        print(f"{name}: {counts.most_common(args.top)}")
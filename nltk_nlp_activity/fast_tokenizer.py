@@ -0,0 +1,401 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. A FAST alternative to nltk.word_tokenize:
+#    - one precompiled regular expression instead of
+#      Punkt + the Treebank tokenizer's ~30 substitutions
+#    - the tokens of every distinct "chunk" (text between
+#      spaces) are remembered, so a repeated word costs
+#      one dictionary lookup
+# 2. The SAME tokens as word_tokenize on the common cases:
+#    punctuation, quotes, clitics (n't, 's, 'll ...),
+#    numbers (3.88, 3,36), ellipses, dashes, "cannot", "gonna"
+# 3. A switch between the exact and the fast tokenizer for
+#    all scripts (NLP_TOKENIZER=fast or --tokenizer fast)
+# 4. A differential check (agreement with word_tokenize)
+#    and a benchmark (MB/sec)
+# ----------------------------------------------------
+#
+# HOW word_tokenize WORKS (what we reproduce):
+# a) Punkt splits the text into sentences
+# b) every sentence goes through the Treebank regexes:
+#    - "?", "!", ";", "$", "(", ... become separate tokens
+#    - "," and ":" too, unless a digit follows (3,36)
+#    - a period is split off ONLY at the end of the sentence
+#      ("Mr." and "e.g." stay as they are inside a sentence)
+#    - "don't" → "do" "n't", "she's" → "she" "'s"
+#    - " → `` (opening) or '' (closing)
+#
+# SENTENCES: a chunk ending in . ? ! ends a sentence, except
+# after a known abbreviation (Punkt's own list is used when it
+# is installed), an initial ("J.") or an ellipsis ("...").
+# Punkt also learns from orthographic statistics, so a few rare
+# cases differ: "python fast_tokenizer.py check" measures how often.
+#
+# USAGE:
+#   python fast_tokenizer.py check                       (built-in differential corpus)
+#   python fast_tokenizer.py check --corpus articles.txt (+ one document per line)
+#   python fast_tokenizer.py bench --corpus articles.txt (MB/sec, exact vs fast)
+#   python fast_tokenizer.py tokenize "Don't stop, Mr. Smith."
+#   NLP_TOKENIZER=fast python topic_words.py articles.txt
+
+# argparse / difflib / os / random / re / time: command line, comparison,
+# switch, regexes, benchmark
+import argparse
+import difflib
+import os
+import random
+import re
+import time
+
+# Import the NLTK library (the exact tokenizer, Punkt's abbreviation list)
+import nltk
+
+
+# ----------------------------------------------------
+# STEP 1: ONE REGEX FOR A WHOLE CHUNK
+# ----------------------------------------------------
+
+# Characters that are always a token of their own
+SPLIT_CHARS = "?!;@#$%&*()\\[\\]{}<>«»“”‘’„‒-―"
+
+PIECE = re.compile(rf"""
+    \.{{2,}}                        # ellipsis ...
+  | --                              # double dash
+  | `+                              # `` opening quotes
+  | ''|"                            # double quotes
+  | [{SPLIT_CHARS}]                 # ? ! ; $ ( ) ...
+  | [:,](?!\d)                      # , and : unless a digit follows
+  | (?P<word>                       # a word:
+        [^\s{SPLIT_CHARS}:,"`.'-]   #   ordinary characters
+      | [:,](?=\d)                  #   3,36 and 10:30
+      | \.(?!\.)                    #   single periods (e.g.)
+      | -(?!-)                      #   single hyphens
+      | '(?!')                      #   apostrophes (don't, O'Neil)
+    )+
+  | \S                              # anything else
+""", re.VERBOSE)
+
+# A leading apostrophe that is a quote, not a clitic ('hello vs 's)
+LEADING_QUOTE = re.compile(r"(?i)'(?!(?:re|ve|ll|m|t|s|d|n)\b)(?=\w)")
+
+# Clitics split off the end of a word, in Treebank's order
+CLITICS_1 = re.compile(r"(?<=[^' ])('[sS]|'[mM]|'[dD]|')$")
+CLITICS_2 = re.compile(r"(?<=[^' ])('ll|'LL|'re|'RE|'ve|'VE|n't|N'T)$")
+
+# "cannot" → "can" "not", "gonna" → "gon" "na", ... (same regexes as NLTK)
+CONTRACTION_HINT = re.compile(r"(?i)cannot|d'ye|gimme|gonna|gotta|lemme|more'n|wanna|'tis|'twas")
+CONTRACTIONS = [re.compile(pattern) for pattern in
+                nltk.tokenize.destructive.MacIntyreContractions.CONTRACTIONS2
+                + nltk.tokenize.destructive.MacIntyreContractions.CONTRACTIONS3]
+
+# Closing characters allowed after a sentence-final period: end.) end."
+FINAL_PERIOD = re.compile(r"^(.*[^.])\.([\])}>\"'»”’]*)$")
+
+
+def split_word(word):
+    """
+    Treebank's clitic and contraction rules for one word
+    """
+    tokens = []
+    if word[0] == "'" and LEADING_QUOTE.match(word):
+        tokens.append("'")
+        word = word[1:]
+
+    ending = []
+    match = CLITICS_1.search(word)
+    if match:
+        ending.insert(0, match.group(1))
+        word = word[:match.start()]
+    match = CLITICS_2.search(word)
+    if match:
+        ending.insert(0, match.group(1))
+        word = word[:match.start()]
+
+    if CONTRACTION_HINT.search(word):
+        padded = f" {word} "
+        for regexp in CONTRACTIONS:
+            padded = regexp.sub(r" \1 \2 ", padded)
+        tokens.extend(padded.split())
+    elif word:
+        tokens.append(word)
+    return tokens + ending
+
+
+def chunk_tokens(chunk, after=" "):
+    """
+    Tokens of one chunk (no spaces inside); `after` is the
+    character just before the chunk (for opening quotes)
+    """
+    tokens = []
+    previous = after
+    for match in PIECE.finditer(chunk):
+        piece = match.group()
+        if piece == '"' or piece == "''":
+            # Opening after a space or an opening bracket, closing otherwise
+            # ('' at the very start of a sentence stays '')
+            opening = previous in "([{< " or (previous == "^" and piece == '"')
+            tokens.append("``" if opening else "''")
+        elif match.lastgroup == "word":
+            tokens.extend(split_word(piece))
+        else:
+            tokens.append(piece)
+        previous = chunk[match.end() - 1]
+    return tokens
+
+
+# ----------------------------------------------------
+# STEP 2: SENTENCES AND TOKENS
+# ----------------------------------------------------
+
+# The tokens of every distinct chunk are kept here
+# (cleared when it gets large)
+_cache = {}
+_CACHE_LIMIT = 500000
+
+# Punkt's abbreviation list (lowercase, without the final period)
+_abbreviations = None
+FALLBACK_ABBREVIATIONS = {"mr", "mrs", "ms", "dr", "prof", "st", "jr", "sr", "vs", "etc",
+                          "e.g", "i.e", "inc", "ltd", "co", "corp", "no", "jan", "feb", "mar",
+                          "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec"}
+
+SENTENCE_END = re.compile(r"[.?!][\])}\"'»”’]*$")
+
+# What Punkt calls a number (2026. 3.5. -1,000.)
+NUMBER = re.compile(r"^-?[\.,]?\d[\d,\.-]*$")
+
+
+def get_abbreviations():
+    global _abbreviations
+    if _abbreviations is None:
+        try:
+            _abbreviations = set(nltk.tokenize._get_punkt_tokenizer("english")._params.abbrev_types)
+        except LookupError:
+            _abbreviations = FALLBACK_ABBREVIATIONS
+    return _abbreviations
+
+
+def ends_sentence(chunk, next_chunk):
+    """
+    Does a sentence end after this chunk? (Punkt's main rules)
+    """
+    match = SENTENCE_END.search(chunk)
+    if not match:
+        return False
+    end = chunk[:match.start() + 1]
+    if end[-1] != ".":
+        return True                     # ? or !
+    word = end[:-1]
+    if word.endswith("."):
+        return False                    # ellipsis
+    if len(word) == 1 and word.isalpha():
+        return False                    # initial: J. R. R. Tolkien
+    if NUMBER.match(word) and (next_chunk[0].islower() or next_chunk[0] in ";:,.!?"):
+        return False                    # "in 2026. the ..." (not a sentence start)
+    return word.lower() not in get_abbreviations()
+
+
+def sentences(text):
+    """
+    [[token, ...], ...] like [word_tokenize(s) for s in sent_tokenize(text)]
+    """
+    if len(_cache) > _CACHE_LIMIT:
+        _cache.clear()
+
+    result = []
+    current = []
+    chunks = text.split()
+    last = len(chunks) - 1
+    for i, chunk in enumerate(chunks):
+        # '' at the very start of a sentence stays a closing quote
+        after = "^" if not current and chunk.startswith("''") else " "
+
+        if i == last or ends_sentence(chunk, chunks[i + 1]):
+            # Treebank splits the period at the end of a sentence only
+            match = FINAL_PERIOD.match(chunk)
+            if match:
+                current.extend(chunk_tokens(match.group(1), after))
+                current.append(".")
+                current.extend(chunk_tokens(match.group(2), after="."))
+            else:
+                current.extend(chunk_tokens(chunk, after))
+            result.append(current)
+            current = []
+        elif after == "^":
+            current.extend(chunk_tokens(chunk, after))
+        else:
+            tokens = _cache.get(chunk)
+            if tokens is None:
+                tokens = _cache[chunk] = chunk_tokens(chunk)
+            current.extend(tokens)
+    return result
+
+
+def tokenize(text):
+    """
+    Fast version of nltk.word_tokenize(text)
+    """
+    return [token for sentence in sentences(text) for token in sentence]
+
+
+# ----------------------------------------------------
+# STEP 3: THE SWITCH (EXACT OR FAST)
+# ----------------------------------------------------
+
+MODES = ("exact", "fast")
+
+
+def get_mode():
+    mode = os.environ.get("NLP_TOKENIZER", "exact")
+    if mode not in MODES:
+        raise ValueError(f"NLP_TOKENIZER must be one of {MODES}, not {mode!r}")
+    return mode
+
+
+def set_mode(mode):
+    """
+    Choose the tokenizer for this process AND its workers
+    (they inherit the environment)
+    """
+    if mode not in MODES:
+        raise ValueError(f"tokenizer must be one of {MODES}, not {mode!r}")
+    os.environ["NLP_TOKENIZER"] = mode
+
+
+def word_tokenize(text):
+    """
+    nltk.word_tokenize or the fast tokenizer, depending on the switch
+    """
+    if get_mode() == "fast":
+        return tokenize(text)
+    return nltk.word_tokenize(text)
+
+
+def sentence_tokens(text):
+    """
+    [[token, ...], ...] one list per sentence, depending on the switch
+    """
+    if get_mode() == "fast":
+        return sentences(text)
+    return [nltk.word_tokenize(sentence) for sentence in nltk.sent_tokenize(text)]
+
+
+# ----------------------------------------------------
+# STEP 4: DIFFERENTIAL CHECK
+# ----------------------------------------------------
+
+DIFFERENTIAL_CORPUS = [
+    "Artificial intelligence continues transforming industries in 2025.",
+    "Companies like OpenAI, Google, and Meta are releasing new models.",
+    "Barack Obama was born in Hawaii. He was elected president of the USA.",
+    "The striped bats are hanging on their feet for best.",
+    "Good muffins cost $3.88 (roughly 3,36 euros) in New York. Please buy me two of them. Thanks.",
+    "I don't know. She's here, isn't she? They'll come; we've waited!",
+    "He said, \"This is great.\" Then he left.",
+    "\"Hello,\" she said. \"Are you coming?\"",
+    "Mr. Smith went to Washington. Dr. Jones stayed home.",
+    "It was 10:30 when we met at 5 p.m. in the U.S. office.",
+    "Wait... what? No -- never!!",
+    "The price rose 20% to $1,000,000 & more.",
+    "I cannot believe you're gonna do that. Gimme a break.",
+    "Email me @ home #1 or see (the appendix) [section 2] {note}.",
+    "The kids' toys were everywhere.",
+    "'Hello there,' he whispered.",
+    "Rock 'n' roll is here to stay.",
+    "Is it e.g. a test? Yes.",
+    "J. R. R. Tolkien wrote books.",
+    "She asked: why not?",
+    "It's 3.5 times faster, isn't it?",
+    "Prices: $5, $10, and $20.",
+    "“Smart quotes” and ‘single ones’ appear too.",
+    "Well-known state-of-the-art methods work.",
+    "He shouted \"Stop!\" and ran.",
+    "Ends with an abbreviation like etc.",
+    "Temperatures hit 40°C in the south.",
+    "We'd've gone if we could've.",
+]
+
+
+def generated_corpus(count=2000, seed=0):
+    """
+    Extra sentences built from the corpus above (shuffled pairs)
+    """
+    rng = random.Random(seed)
+    return [" ".join(rng.sample(DIFFERENTIAL_CORPUS, rng.randint(1, 4))) for _ in range(count)]
+
+
+def check(texts):
+    """
+    Compare with nltk.word_tokenize; returns
+    (documents, identical documents, tokens, differing tokens, examples)
+    """
+    documents = identical = tokens = differing = 0
+    examples = []
+    for text in texts:
+        expected = nltk.word_tokenize(text)
+        got = tokenize(text)
+        documents += 1
+        tokens += len(expected)
+        if got == expected:
+            identical += 1
+            continue
+        # Count the tokens that do not line up
+        matcher = difflib.SequenceMatcher(a=expected, b=got, autojunk=False)
+        matched = sum(block.size for block in matcher.get_matching_blocks())
+        differing += len(expected) - matched
+        if len(examples) < 10:
+            examples.append((text, expected, got))
+    return documents, identical, tokens, differing, examples
+
+
+# ----------------------------------------------------
+# STEP 5: BENCHMARK (MB/SEC)
+# ----------------------------------------------------
+
+def benchmark(texts, repeats=3):
+    texts = list(texts)
+    megabytes = sum(len(text.encode("utf-8")) for text in texts) / 1e6
+    print(f"{len(texts)} documents, {megabytes:.2f} MB")
+
+    for name, function in (("exact (word_tokenize)", nltk.word_tokenize), ("fast", tokenize)):
+        best = None
+        for _ in range(repeats):
+            _cache.clear()
+            start = time.perf_counter()
+            tokens = sum(len(function(text)) for text in texts)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{name:<22} {best:7.2f}s  {megabytes / best:8.2f} MB/sec  {tokens / best:12,.0f} tokens/sec")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fast word_tokenize replacement, parity check and benchmark.")
+    parser.add_argument("command", choices=["check", "bench", "tokenize"])
+    parser.add_argument("text", nargs="?", help="for tokenize")
+    parser.add_argument("--corpus", help="file with one document per line")
+    parser.add_argument("--min-agreement", type=float, default=0.0,
+                        help="check: fail if fewer documents than this fraction are identical")
+    args = parser.parse_args()
+
+    def corpus():
+        texts = DIFFERENTIAL_CORPUS + generated_corpus()
+        if args.corpus:
+            with open(args.corpus, encoding="utf-8") as f:
+                texts += [line for line in f if line.strip()]
+        return texts
+
+    if args.command == "tokenize":
+        print(tokenize(args.text or ""))
+    elif args.command == "bench":
+        if args.corpus:
+            with open(args.corpus, encoding="utf-8") as f:
+                benchmark([line for line in f if line.strip()])
+        else:
+            benchmark(generated_corpus(20000))
+    else:
+        documents, identical, tokens, differing, examples = check(corpus())
+        print(f"{identical}/{documents} documents identical ({identical / documents:.2%}), "
+              f"{differing}/{tokens} tokens differ ({differing / tokens if tokens else 0:.3%})")
+        for text, expected, got in examples:
+            print(f"\n  text:  {text!r}\n  exact: {expected}\n  fast:  {got}")
+        if identical / documents < args.min_agreement:
+            raise SystemExit(1)
@@ -0,0 +1,353 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Find KNOWN entities (countries, cities, customers, people)
+#    with a gazetteer: lists of names per label
+#    (PERSON, GPE, ORGANIZATION)
+# 2. Match every name, also multi-token names like
+#    "Barack Obama" or "the United Nations", in ONE linear scan
+#    over the tokens (Aho-Corasick automaton)
+# 3. Skip pos_tag + ne_chunk for sentences whose capitalized
+#    words are ALL covered by the gazetteer
+# 4. Measure entities/sec and precision / recall against
+#    running ne_chunk alone
+# ----------------------------------------------------
+#
+# AHO-CORASICK (on tokens instead of characters):
+# All names are stored in one tree of tokens (a trie):
+#
+#   (root) ─ Barack ─ Obama             → PERSON
+#          ─ New ─ York                 → GPE
+#                └ York ─ Times         → ORGANIZATION
+#
+# Every node also gets a "failure link": where to continue when
+# the next token does not match. The scan never goes back, so
+# its cost grows with the length of the text, not with the
+# number of names in the gazetteer.
+#
+# GAZETTEER FILE (tab separated, one name per line, tokens
+# separated by spaces as in ne_chunk's output):
+#   PERSON<TAB>Barack Obama
+#   GPE<TAB>Hawaii
+#   ORGANIZATION<TAB>New York Times
+#
+# USAGE:
+#   python gazetteer.py build news.txt -o entities.tsv      (names found by ne_chunk)
+#   python gazetteer.py find entities.tsv "Barack Obama visited New York."
+#   python gazetteer.py evaluate entities.tsv news.txt       (vs ne_chunk alone)
+#   python ner_corpus.py news/ --gazetteer entities.tsv      (fast path in the corpus run)
+
+# argparse / time: command line and timing
+import argparse
+import time
+
+# Counter: entity counts (precision / recall use multiset overlap)
+# deque: breadth-first walk when the failure links are built
+from collections import Counter, deque
+
+# Shared stages: sentence splitting + tagging (batch_tagging.py),
+# the stopword list (tokenization.py) and per-stage timing
+# (instrumentation.py); the chunker comes from document.py
+from batch_tagging import split_document, tag_tokens
+from instrumentation import count, stage
+from tokenization import get_stop_words
+
+LABELS = ('PERSON', 'GPE', 'ORGANIZATION')
+
+
+# ----------------------------------------------------
+# STEP 1: THE AUTOMATON
+# ----------------------------------------------------
+
+class Gazetteer:
+    """
+    Token-level Aho-Corasick automaton: name → label
+    """
+
+    def __init__(self):
+        # One entry per node
+        self.children = [{}]      # token → child node
+        self.fail = [0]           # failure link
+        self.label = [None]       # label of the name ending here (or None)
+        self.depth = [0]          # number of tokens from the root
+        self.match_link = [0]     # nearest shorter name ending here (via failure links)
+        self.names = 0
+        self.built = False
+
+    def add(self, name, label):
+        """
+        Add a name (a string of space-separated tokens, or a list of tokens)
+        """
+        tokens = name.split() if isinstance(name, str) else list(name)
+        if not tokens:
+            return
+        node = 0
+        for token in tokens:
+            child = self.children[node].get(token)
+            if child is None:
+                child = len(self.children)
+                self.children[node][token] = child
+                self.children.append({})
+                self.fail.append(0)
+                self.label.append(None)
+                self.depth.append(self.depth[node] + 1)
+                self.match_link.append(0)
+            node = child
+        if self.label[node] is None:
+            self.names += 1
+            self.label[node] = label
+        self.built = False
+
+    def build(self):
+        """
+        Compute the failure links (breadth first: parents before children)
+        """
+        queue = deque()
+        for child in self.children[0].values():
+            self.fail[child] = 0
+            self.match_link[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for token, child in self.children[node].items():
+                # Longest proper suffix of child's path that is also in the trie
+                fallback = self.fail[node]
+                while fallback and token not in self.children[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.children[fallback].get(token, 0)
+                if self.fail[child] == child:
+                    self.fail[child] = 0
+                target = self.fail[child]
+                self.match_link[child] = target if self.label[target] is not None else self.match_link[target]
+                queue.append(child)
+        self.built = True
+        return self
+
+    def __len__(self):
+        return self.names
+
+    # ---------- matching ----------
+
+    def matches(self, tokens):
+        """
+        Every name occurrence: [(start, end, label), ...] (end exclusive)
+        """
+        if not self.built:
+            self.build()
+        children, fail, label, depth, match_link = (self.children, self.fail, self.label,
+                                                    self.depth, self.match_link)
+        found = []
+        node = 0
+        for position, token in enumerate(tokens):
+            while node and token not in children[node]:
+                node = fail[node]
+            node = children[node].get(token, 0)
+
+            # The name ending here, and the shorter ones inside it
+            hit = node if label[node] is not None else match_link[node]
+            while hit:
+                found.append((position + 1 - depth[hit], position + 1, label[hit]))
+                hit = match_link[hit]
+        return found
+
+    def find(self, tokens):
+        """
+        Leftmost-longest, non-overlapping names: [(start, end, label), ...]
+        """
+        chosen = []
+        covered_until = 0
+        for start, end, name_label in sorted(self.matches(tokens), key=lambda m: (m[0], -m[1])):
+            if start >= covered_until:
+                chosen.append((start, end, name_label))
+                covered_until = end
+        return chosen
+
+    # ---------- file ----------
+
+    @classmethod
+    def load(cls, path):
+        gazetteer = cls()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if not line.strip() or line.startswith("#"):
+                    continue
+                name_label, _, name = line.partition("\t")
+                gazetteer.add(name, name_label)
+        return gazetteer.build()
+
+
+# ----------------------------------------------------
+# STEP 2: THE FAST PATH AHEAD OF ne_chunk
+# ----------------------------------------------------
+
+def capitalized_positions(tokens):
+    """
+    Positions of words that COULD be entities: capitalized,
+    and not a capitalized common word ("The", "He", "It")
+    """
+    stop_words = get_stop_words()
+    return [i for i, token in enumerate(tokens)
+            if token[:1].isupper() and token.lower() not in stop_words]
+
+
+def covers(tokens, found):
+    """
+    True when every capitalized word is inside one of the found names
+    """
+    covered = set()
+    for start, end, _ in found:
+        covered.update(range(start, end))
+    return all(i in covered for i in capitalized_positions(tokens))
+
+
+def name_entities(tokens, found, labels=LABELS):
+    """
+    Found names in extract_entities' format: [(entity, label), ...]
+    """
+    return [(" ".join(tokens[start:end]), name_label)
+            for start, end, name_label in found if name_label in labels]
+
+
+def sentence_entities(tokens, gazetteer, labels=LABELS):
+    """
+    Entities of one tokenized sentence: from the gazetteer alone when it
+    covers every capitalized word, otherwise from pos_tag + ne_chunk.
+    Returns (entities, True if the chunker was needed)
+    """
+    with stage("gazetteer", tokens=len(tokens)):
+        found = gazetteer.find(tokens)
+        skip = covers(tokens, found)
+
+    if skip:
+        count("chunker_skipped", "gazetteer")
+        return name_entities(tokens, found, labels), False
+
+    count("chunker_used", "gazetteer")
+    return chunker_entities(tokens, labels), True
+
+
+def chunker_entities(tokens, labels=LABELS):
+    """
+    The reference: pos_tag + ne_chunk for every sentence
+    """
+    # Imported here: only needed when the chunker runs
+    from document import get_chunker
+    from ner_exploration import extract_entities
+
+    pos_tags = tag_tokens(tokens)
+    with stage("ne_chunk", tokens=len(pos_tags)):
+        tree = get_chunker().parse(pos_tags)
+    return extract_entities(tree, labels)
+
+
+# ----------------------------------------------------
+# STEP 3: BUILD A GAZETTEER FROM ne_chunk'S OUTPUT
+# ----------------------------------------------------
+
+def build_from_corpus(texts, labels=LABELS, min_count=2):
+    """
+    Names that ne_chunk finds at least min_count times,
+    each with its most frequent label: [(label, name), ...]
+    """
+    counts = Counter()
+    for text in texts:
+        for tokens in split_document(text):
+            counts.update(chunker_entities(tokens, labels))
+
+    best = {}
+    for (name, name_label), n in counts.most_common():
+        if n >= min_count and name not in best:
+            best[name] = name_label
+    return sorted((name_label, name) for name, name_label in best.items())
+
+
+# ----------------------------------------------------
+# STEP 4: EVALUATION (VS ne_chunk ALONE)
+# ----------------------------------------------------
+
+def evaluate(texts, gazetteer, labels=LABELS):
+    """
+    Run both pipelines on the same tokens; returns a report dictionary
+    """
+    sentences = [tokens for text in texts for tokens in split_document(text)]
+
+    # Load the models before timing anything
+    chunker_entities(["Warm", "up"], labels)
+
+    start = time.perf_counter()
+    reference = [Counter(chunker_entities(tokens, labels)) for tokens in sentences]
+    reference_seconds = time.perf_counter() - start
+
+    skipped = 0
+    start = time.perf_counter()
+    fast = []
+    for tokens in sentences:
+        entities, chunked = sentence_entities(tokens, gazetteer, labels)
+        fast.append(Counter(entities))
+        skipped += not chunked
+    fast_seconds = time.perf_counter() - start
+
+    true_positives = sum(sum((expected & got).values()) for expected, got in zip(reference, fast))
+    predicted = sum(sum(got.values()) for got in fast)
+    relevant = sum(sum(expected.values()) for expected in reference)
+    return {
+        "sentences": len(sentences),
+        "chunker_skipped": skipped,
+        "reference_entities": relevant,
+        "fast_entities": predicted,
+        "precision": true_positives / predicted if predicted else 1.0,
+        "recall": true_positives / relevant if relevant else 1.0,
+        "reference_seconds": reference_seconds,
+        "fast_seconds": fast_seconds,
+        "reference_entities_per_sec": relevant / reference_seconds if reference_seconds else 0.0,
+        "fast_entities_per_sec": predicted / fast_seconds if fast_seconds else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aho-Corasick gazetteer ahead of ne_chunk.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build_cmd = sub.add_parser("build", help="gazetteer from the names ne_chunk finds in a corpus")
+    build_cmd.add_argument("corpus", help="file with one document per line")
+    build_cmd.add_argument("-o", "--output", required=True)
+    build_cmd.add_argument("--min-count", type=int, default=2)
+
+    find_cmd = sub.add_parser("find", help="gazetteer matches in one text")
+    find_cmd.add_argument("gazetteer")
+    find_cmd.add_argument("text")
+
+    eval_cmd = sub.add_parser("evaluate", help="entities/sec and precision / recall vs ne_chunk")
+    eval_cmd.add_argument("gazetteer")
+    eval_cmd.add_argument("corpus", help="file with one document per line")
+
+    for command in (build_cmd, eval_cmd):
+        command.add_argument("--labels", nargs="+", default=list(LABELS))
+    args = parser.parse_args()
+
+    if args.command == "build":
+        with open(args.corpus, encoding="utf-8") as f:
+            names = build_from_corpus(f, tuple(args.labels), args.min_count)
+        with open(args.output, "w", encoding="utf-8") as f:
+            for name_label, name in names:
+                f.write(f"{name_label}\t{name}\n")
+        print(f"Wrote {len(names)} names to {args.output}")
+
+    elif args.command == "find":
+        gazetteer = Gazetteer.load(args.gazetteer)
+        for tokens in split_document(args.text):
+            for start, end, name_label in gazetteer.find(tokens):
+                print(f"{' '.join(tokens[start:end])}\t{name_label}")
+
+    else:
+        gazetteer = Gazetteer.load(args.gazetteer)
+        with open(args.corpus, encoding="utf-8") as f:
+            report = evaluate([line for line in f if line.strip()], gazetteer, tuple(args.labels))
+        print(f"{report['sentences']} sentences, gazetteer of {len(gazetteer)} names, "
+              f"chunker skipped for {report['chunker_skipped']} "
+              f"({report['chunker_skipped'] / max(report['sentences'], 1):.1%})")
+        print(f"ne_chunk alone      {report['reference_entities']:7d} entities "
+              f"{report['reference_seconds']:7.2f}s  {report['reference_entities_per_sec']:10,.0f} entities/sec")
+        print(f"gazetteer + chunker {report['fast_entities']:7d} entities "
+              f"{report['fast_seconds']:7.2f}s  {report['fast_entities_per_sec']:10,.0f} entities/sec")
+        print(f"precision {report['precision']:.3f}  recall {report['recall']:.3f} (vs ne_chunk alone)")
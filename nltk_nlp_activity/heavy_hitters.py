@@ -0,0 +1,134 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Count the most frequent words of an ENDLESS stream
+#    with a FIXED amount of memory
+# 2. Use the Space-Saving algorithm (Metwally et al., 2005)
+# 3. Return results in the same shape as Counter.most_common(k)
+# ----------------------------------------------------
+#
+# WHY:
+# An exact Counter keeps one entry for EVERY distinct token.
+# On week-long streams full of typos, URLs and IDs it never
+# stops growing. SpaceSaving keeps at most `capacity` words.
+#
+# HOW IT WORKS:
+# - While there is room, every new word gets its own counter
+# - When full, a new word REPLACES the word with the smallest
+#   count, and inherits that count (+1). The inherited part is
+#   remembered as the word's possible error.
+#
+# ERROR BOUNDS (N = total number of words seen, m = capacity):
+# - A reported count is never too small:
+#       true_count <= count <= true_count + error <= true_count + N / m
+# - Every word whose true count is larger than N / m is
+#   guaranteed to be in the table (no frequent word is lost)
+# - error(word) gives the exact over-estimate bound for each word
+#
+# MEMORY:
+# Two dictionary entries + one heap entry per tracked word:
+# roughly 250-300 bytes per slot in CPython, so capacity=100_000
+# stays around 30 MB whatever the stream length.
+
+# heapq: finds the word with the smallest count quickly
+import heapq
+
+
+class SpaceSaving:
+    """
+    Approximate word counter with a fixed number of slots
+    (drop-in replacement for Counter.update / most_common)
+    """
+
+    def __init__(self, capacity=100000):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+
+        # Min-heap of (count, word). Entries can be out of date
+        # (the word was incremented later); they are fixed lazily
+        self.heap = []
+
+    # ---------- counting ----------
+
+    def add(self, word, count=1):
+        """
+        Count one occurrence (or `count` occurrences) of word
+        """
+        self.total += count
+
+        # Already tracked: just increment
+        if word in self.counts:
+            self.counts[word] += count
+            return
+
+        # Free slot: start a new exact counter
+        if len(self.counts) < self.capacity:
+            self.counts[word] = count
+            self.errors[word] = 0
+            heapq.heappush(self.heap, (count, word))
+            return
+
+        # Full: replace the word with the smallest count
+        smallest, victim = self._pop_min()
+        del self.counts[victim]
+        del self.errors[victim]
+        self.counts[word] = smallest + count
+        self.errors[word] = smallest
+        heapq.heappush(self.heap, (smallest + count, word))
+
+    def _pop_min(self):
+        """
+        Remove and return the (count, word) with the smallest CURRENT count
+        """
+        while True:
+            count, word = heapq.heappop(self.heap)
+            current = self.counts.get(word)
+            if current == count:
+                return count, word
+            if current is not None:
+                # Stale entry: put the word back with its real count
+                heapq.heappush(self.heap, (current, word))
+
+    def update(self, words):
+        """
+        Same as Counter.update: accepts an iterable of words
+        or a mapping {word: count}
+        """
+        if hasattr(words, "items"):
+            for word, count in words.items():
+                self.add(word, count)
+        else:
+            for word in words:
+                self.add(word)
+
+    # ---------- results ----------
+
+    def most_common(self, k=None):
+        """
+        Return [(word, count), ...] sorted by count,
+        same shape as Counter.most_common(k)
+        """
+        if k is None:
+            return sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return heapq.nlargest(k, self.counts.items(), key=lambda item: item[1])
+
+    def error(self, word):
+        """
+        Maximum amount by which the count of word may be too high
+        """
+        return self.errors.get(word, self.max_error())
+
+    def max_error(self):
+        """
+        Global bound on the over-estimate of any count: N / m
+        """
+        return self.total / self.capacity
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __getitem__(self, word):
+        return self.counts.get(word, 0)
@@ -0,0 +1,293 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Keep a Naive Bayes model as COUNTS only
+#    (documents per label, documents per label and word)
+# 2. partial_fit: add a new batch of labeled reviews
+#    without looking at the old ones again
+# 3. merge: add up two models trained on different shards
+# 4. save / load the counts, so the next update starts
+#    from where the last one stopped
+# ----------------------------------------------------
+#
+# WHY:
+# sentiment.py trains NaiveBayesClassifier from scratch on the
+# whole training set. New labeled reviews arrive every day, and
+# retraining on the full history gets slower every day.
+#
+# Naive Bayes only needs counts, and counts can simply be added:
+#   train(A) + train(B) == train(A and B)
+# So an update costs time proportional to the NEW reviews only,
+# and the result is exactly the model trained on everything
+# (same predictions as NaiveBayesClassifier, see sparse_nb.py).
+#
+# USAGE:
+#   python incremental_nb.py update model.npz --jsonl new_reviews.jsonl
+#   python incremental_nb.py merge model.npz shard1.npz shard2.npz
+#   python incremental_nb.py show model.npz
+#   python incremental_nb.py check        (parity with NaiveBayesClassifier)
+
+# argparse / json / os / time: command line, files and timing
+import argparse
+import json
+import os
+import time
+
+# NumPy: the count arrays
+import numpy as np
+
+# The vectorized engine: CSR documents + Naive Bayes from counts
+from sparse_nb import SparseNaiveBayes, count_matrix, to_matrix
+
+# 2: the vocabulary is stored as a JSON array (was newline separated)
+FORMAT_VERSION = 2
+
+
+class IncrementalNaiveBayes:
+    """
+    Count-based Naive Bayes: partial_fit / merge / save / load
+    """
+
+    def __init__(self, model="nltk"):
+        self.model = model
+        self.vocabulary = {}
+        self.labels = []
+
+        # counts[l, w]: documents of label l containing word w
+        # (the arrays have spare columns; only the first
+        # len(vocabulary) are used)
+        self.counts = np.zeros((0, 0), dtype=np.int64)
+        self.doc_counts = np.zeros(0, dtype=np.int64)
+        self._classifier = None
+
+    # ---------- growing the tables ----------
+
+    def _add_labels(self, labels):
+        for label in labels:
+            if label not in self.labels:
+                self.labels.append(label)
+        if len(self.labels) > len(self.doc_counts):
+            extra = len(self.labels) - len(self.doc_counts)
+            self.doc_counts = np.concatenate([self.doc_counts, np.zeros(extra, dtype=np.int64)])
+            self.counts = np.vstack([self.counts, np.zeros((extra, self.counts.shape[1]), dtype=np.int64)])
+
+    def _add_words(self, words):
+        for word in words:
+            if word not in self.vocabulary:
+                self.vocabulary[word] = len(self.vocabulary)
+
+        # Double the number of columns when full, so a long series
+        # of small updates does not copy the counts every time
+        if len(self.vocabulary) > self.counts.shape[1]:
+            columns = max(len(self.vocabulary), 2 * self.counts.shape[1], 1024)
+            grown = np.zeros((len(self.labels), columns), dtype=np.int64)
+            grown[:, :self.counts.shape[1]] = self.counts
+            self.counts = grown
+
+    # ---------- training ----------
+
+    def partial_fit(self, documents, labels):
+        """
+        Add a batch: documents = lists of words, labels = one per document
+        """
+        documents = list(documents)
+        labels = list(labels)
+        self._add_labels(labels)
+        self._add_words(word for words in documents for word in words)
+
+        X = to_matrix(documents, self.vocabulary)
+        label_ids = np.array([self.labels.index(label) for label in labels], dtype=np.int64)
+        counts, doc_counts = count_matrix(X, label_ids, len(self.labels))
+
+        self.counts[:, :counts.shape[1]] += counts.astype(np.int64)
+        self.doc_counts += doc_counts.astype(np.int64)
+        self._classifier = None
+        return self
+
+    def merge(self, other):
+        """
+        Add the counts of another model (trained on other documents)
+        """
+        if other.model != self.model:
+            raise ValueError(f"cannot merge a {other.model!r} model into a {self.model!r} model")
+        self._add_labels(other.labels)
+        self._add_words(other.words())
+
+        # Column / row of every word / label of `other` in this model
+        rows = np.array([self.labels.index(label) for label in other.labels], dtype=np.int64)
+        columns = np.array([self.vocabulary[word] for word in other.words()], dtype=np.int64)
+        if len(rows) and len(columns):
+            self.counts[np.ix_(rows, columns)] += other.counts[:, :len(columns)]
+        self.doc_counts[rows] += other.doc_counts
+        self._classifier = None
+        return self
+
+    def words(self):
+        """
+        The vocabulary as a list, indexed by word id
+        """
+        return list(self.vocabulary)
+
+    # ---------- using the model ----------
+
+    def classifier(self):
+        """
+        SparseNaiveBayes built from the current counts
+        (rebuilt only after an update)
+        """
+        if self._classifier is None:
+            self._classifier = SparseNaiveBayes(self.model).fit_counts(
+                self.counts[:, :len(self.vocabulary)], self.doc_counts, self.labels, self.vocabulary)
+        return self._classifier
+
+    def classify_many(self, documents):
+        return self.classifier().classify_many(to_matrix(documents, self.vocabulary))
+
+    def accuracy(self, documents, labels):
+        return self.classifier().accuracy(to_matrix(documents, self.vocabulary), list(labels))
+
+    def show_most_informative_features(self, n=10):
+        self.classifier().show_most_informative_features(n)
+
+    # ---------- persistence ----------
+
+    def save(self, path):
+        """
+        Write the counts (no pickle: plain arrays + JSON text;
+        the vocabulary is a JSON array, so any word round-trips)
+        """
+        header = {"version": FORMAT_VERSION, "model": self.model, "labels": self.labels}
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                header=np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8),
+                vocabulary=np.frombuffer(json.dumps(list(self.vocabulary)).encode("utf-8"), dtype=np.uint8),
+                counts=self.counts[:, :len(self.vocabulary)],
+                doc_counts=self.doc_counts,
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            header = json.loads(data["header"].tobytes().decode("utf-8"))
+            if header["version"] != FORMAT_VERSION:
+                raise ValueError(f"{path}: unsupported model version {header['version']}")
+            words = json.loads(data["vocabulary"].tobytes().decode("utf-8"))
+            model = cls(header["model"])
+            model.labels = header["labels"]
+            model.vocabulary = {word: i for i, word in enumerate(words)}
+            model.counts = data["counts"].astype(np.int64)
+            model.doc_counts = data["doc_counts"].astype(np.int64)
+        return model
+
+    @classmethod
+    def load_or_create(cls, path, model="nltk"):
+        return cls.load(path) if os.path.exists(path) else cls(model)
+
+
+# ----------------------------------------------------
+# PARITY CHECK: UPDATES + MERGE == NaiveBayesClassifier
+# ----------------------------------------------------
+
+def check_parity(documents, train_size=1500, batches=5):
+    """
+    Train shard A in `batches` partial_fit calls, shard B in one,
+    merge, save and reload: predictions and informative features
+    must match NaiveBayesClassifier trained on A + B at once
+    """
+    import tempfile
+    from nltk.classify import NaiveBayesClassifier
+
+    train, test = documents[:train_size], documents[train_size:]
+    half = train_size // 2
+
+    shard_a = IncrementalNaiveBayes()
+    step = max(1, half // batches)
+    for start in range(0, half, step):
+        batch = train[start:min(start + step, half)]
+        shard_a.partial_fit([d for d, _ in batch], [c for _, c in batch])
+    shard_b = IncrementalNaiveBayes().partial_fit([d for d, _ in train[half:]], [c for _, c in train[half:]])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "model.npz")
+        shard_a.merge(shard_b).save(path)
+        model = IncrementalNaiveBayes.load(path)
+
+    reference = NaiveBayesClassifier.train([({word: True for word in d}, c) for d, c in train])
+    expected = [reference.classify({word: True for word in d}) for d, _ in test]
+    got = model.classify_many([d for d, _ in test])
+    same_features = (model.classifier().most_informative_features(100)
+                     == reference.most_informative_features(100))
+    return sum(e != g for e, g in zip(expected, got)), same_features
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incremental (count-based) Naive Bayes.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    update = sub.add_parser("update", help="add labeled reviews to a model file (created if missing)")
+    update.add_argument("model_path")
+    source = update.add_mutually_exclusive_group(required=True)
+    source.add_argument("--jsonl", help="JSONL reviews with 'text' and 'label'")
+    source.add_argument("--token-cache", metavar="DIR", help="cache built by token_cache.py")
+    update.add_argument("--batch-size", type=int, default=10000)
+    update.add_argument("--model", choices=["nltk", "bernoulli", "multinomial"], default="nltk")
+
+    merge = sub.add_parser("merge", help="add up model files")
+    merge.add_argument("output")
+    merge.add_argument("inputs", nargs="+")
+
+    show = sub.add_parser("show", help="print the most informative features")
+    show.add_argument("model_path")
+    show.add_argument("-n", type=int, default=10)
+
+    sub.add_parser("check", help="parity with NaiveBayesClassifier on movie_reviews")
+    args = parser.parse_args()
+
+    if args.command == "update":
+        from token_cache import TokenCache, jsonl_records
+
+        model = IncrementalNaiveBayes.load_or_create(args.model_path, args.model)
+        if args.jsonl:
+            records = ((words, label) for _, words, label in jsonl_records(args.jsonl))
+        else:
+            cache = TokenCache(args.token_cache)
+            records = ((cache.words(i), cache.label(i)) for i in range(len(cache)))
+
+        start = time.perf_counter()
+        added = 0
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) == args.batch_size:
+                model.partial_fit([d for d, _ in batch], [c for _, c in batch])
+                added += len(batch)
+                batch = []
+        if batch:
+            model.partial_fit([d for d, _ in batch], [c for _, c in batch])
+            added += len(batch)
+        model.save(args.model_path)
+        print(f"Added {added} documents in {time.perf_counter() - start:.2f}s; "
+              f"model has {int(model.doc_counts.sum())} documents, {len(model.vocabulary)} words")
+
+    elif args.command == "merge":
+        model = IncrementalNaiveBayes.load(args.inputs[0])
+        for path in args.inputs[1:]:
+            try:
+                model.merge(IncrementalNaiveBayes.load(path))
+            except ValueError as e:
+                raise SystemExit(f"ERROR: {path}: {e}")
+        model.save(args.output)
+        print(f"Wrote {args.output}: {int(model.doc_counts.sum())} documents, {len(model.vocabulary)} words")
+
+    elif args.command == "show":
+        IncrementalNaiveBayes.load(args.model_path).show_most_informative_features(args.n)
+
+    else:
+        from sparse_nb import load_movie_reviews
+
+        mismatches, same_features = check_parity(load_movie_reviews())
+        print(f"Prediction mismatches: {mismatches}, same informative features: {same_features}")
+        if mismatches or not same_features:
+            raise SystemExit(1)
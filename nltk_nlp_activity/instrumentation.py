@@ -0,0 +1,334 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Measure every stage of the NLP pipelines
+#    (tokenize → pos_tag → ne_chunk / lemmatize / count)
+#    - wall time
+#    - number of calls
+#    - tokens processed
+# 2. Count events such as result-cache hits and misses
+# 3. Export the numbers as
+#    - a JSON summary
+#    - a Prometheus textfile (node_exporter textfile collector)
+# 4. Cost (almost) nothing when it is switched off
+# ----------------------------------------------------
+#
+# When a batch runs slowly, the summary shows WHERE the time
+# goes: the tagger, the chunker, the lemmatizer, ...
+#
+# Instrumentation is OPT-IN (like the result cache):
+#   NLP_METRICS=summary.json python topic_words.py articles.txt
+#   NLP_METRICS=- python ner_exploration.py          ('-' = print to stderr)
+#   NLP_METRICS_TEXTFILE=/var/lib/node_exporter/textfile/nlp.prom \
+#       python ner_corpus.py news/ --index entities.sqlite
+# The files are written when the program exits.
+#
+# In the code:
+#   with stage("pos_tag") as s:
+#       tagged = tagger.tag(tokens)
+#       s.tokens = len(tokens)
+#
+# Switched off, stage() returns one shared do-nothing object:
+# no clock is read and nothing is stored.
+#
+# Worker processes keep their own numbers; run_measured() sends
+# them back with each result so the parent can merge() them.
+# Pools start their workers with init_worker(), which drops the
+# numbers a forked worker inherited from the parent (otherwise
+# they would be sent back and counted twice).
+#
+# USAGE (cost per stage() call, on and off):
+#   python instrumentation.py --overhead
+
+# argparse / atexit / json / os / sys / time: switches, export, timing
+import argparse
+import atexit
+import json
+import os
+import sys
+import time
+
+# Counter: event counts such as cache hits
+from collections import Counter
+
+
+# ----------------------------------------------------
+# STEP 1: THE NUMBERS
+# ----------------------------------------------------
+
+# stage name → [calls, seconds, tokens]
+_stages = {}
+
+# (event name, stage name) → count
+_counters = Counter()
+
+_enabled = False
+
+
+def enabled():
+    return _enabled
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def record(name, seconds, tokens=0, calls=1):
+    """
+    Add one (or `calls`) measurements to a stage
+    """
+    entry = _stages.get(name)
+    if entry is None:
+        entry = _stages[name] = [0, 0.0, 0]
+    entry[0] += calls
+    entry[1] += seconds
+    entry[2] += tokens
+
+
+def count(name, stage="", n=1):
+    """
+    Count an event, e.g. count("cache_hits", "pos_tag")
+    """
+    if _enabled:
+        _counters[name, stage] += n
+
+
+# ----------------------------------------------------
+# STEP 2: MEASURING A STAGE
+# ----------------------------------------------------
+
+class _Stage:
+    __slots__ = ("name", "tokens", "start")
+
+    def __init__(self, name, tokens):
+        self.name = name
+        self.tokens = tokens
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self.start, self.tokens)
+        return False
+
+
+class _NoStage:
+    """
+    What stage() returns when instrumentation is off
+    (s.tokens = ... still works, and is ignored)
+    """
+    __slots__ = ("tokens",)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_STAGE = _NoStage()
+
+
+def stage(name, tokens=0):
+    """
+    with stage("ne_chunk", tokens=len(tagged)): ...
+    """
+    if _enabled:
+        return _Stage(name, tokens)
+    return _NO_STAGE
+
+
+# ----------------------------------------------------
+# STEP 3: NUMBERS FROM WORKER PROCESSES
+# ----------------------------------------------------
+
+def drain():
+    """
+    Return this process's numbers and start again from zero
+    """
+    snapshot = {
+        "stages": {name: list(entry) for name, entry in _stages.items()},
+        "counters": [[name, stage_name, n] for (name, stage_name), n in _counters.items()],
+    }
+    _stages.clear()
+    _counters.clear()
+    return snapshot
+
+
+def merge(snapshot):
+    """
+    Add numbers returned by drain() (in another process)
+    """
+    for name, (calls, seconds, tokens) in snapshot["stages"].items():
+        record(name, seconds, tokens, calls)
+    for name, stage_name, n in snapshot["counters"]:
+        _counters[name, stage_name] += n
+
+
+def init_worker(setup=None, *args):
+    """
+    Pool initializer: forget the parent's numbers (copied by fork),
+    then run the pool's own initializer setup(*args)
+    """
+    drain()
+    if setup is not None:
+        setup(*args)
+
+
+def run_measured(func, *args):
+    """
+    Runs in a worker: call func(*args) with instrumentation on
+    and return (result, numbers) for the parent to merge()
+    """
+    enable()
+    result = func(*args)
+    return result, drain()
+
+
+# ----------------------------------------------------
+# STEP 4: EXPORT
+# ----------------------------------------------------
+
+def summary():
+    """
+    The numbers as a JSON-ready dictionary
+    """
+    stages = {}
+    for name, (calls, seconds, tokens) in sorted(_stages.items(), key=lambda item: -item[1][1]):
+        stages[name] = {
+            "calls": calls,
+            "seconds": round(seconds, 6),
+            "tokens": tokens,
+            "mean_ms": round(seconds / calls * 1000, 4) if calls else 0.0,
+            "tokens_per_sec": round(tokens / seconds, 1) if seconds and tokens else None,
+        }
+    counters = {}
+    for (name, stage_name), n in sorted(_counters.items()):
+        counters.setdefault(name, {})[stage_name or "all"] = n
+    return {
+        "script": os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else "python",
+        "pid": os.getpid(),
+        "finished": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "stages": stages,
+        "counters": counters,
+    }
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def prometheus_text(prefix="nlp"):
+    """
+    The numbers in the Prometheus text exposition format
+    """
+    script = _label(summary()["script"])
+    lines = []
+
+    metrics = (
+        ("stage_seconds_total", "Wall time spent in each pipeline stage.", 1),
+        ("stage_calls_total", "Number of times each pipeline stage ran.", 0),
+        ("stage_tokens_total", "Tokens processed by each pipeline stage.", 2),
+    )
+    for metric, help_text, column in metrics:
+        lines.append(f"# HELP {prefix}_{metric} {help_text}")
+        lines.append(f"# TYPE {prefix}_{metric} counter")
+        for name, entry in sorted(_stages.items()):
+            lines.append(f'{prefix}_{metric}{{script="{script}",stage="{_label(name)}"}} {entry[column]}')
+
+    for event in sorted({name for name, _ in _counters}):
+        lines.append(f"# HELP {prefix}_{event}_total Count of {event.replace('_', ' ')}.")
+        lines.append(f"# TYPE {prefix}_{event}_total counter")
+        for (name, stage_name), n in sorted(_counters.items()):
+            if name == event:
+                lines.append(f'{prefix}_{event}_total{{script="{script}",stage="{_label(stage_name)}"}} {n}')
+
+    lines.append(f"# HELP {prefix}_last_run_timestamp_seconds When the numbers were written.")
+    lines.append(f"# TYPE {prefix}_last_run_timestamp_seconds gauge")
+    lines.append(f'{prefix}_last_run_timestamp_seconds{{script="{script}"}} {time.time():.3f}')
+    return "\n".join(lines) + "\n"
+
+
+def _write(path, text):
+    # Write then rename: the collector never reads a half-written file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def export_json(path):
+    text = json.dumps(summary(), indent=2)
+    if path == "-":
+        print(text, file=sys.stderr)
+    else:
+        _write(path, text + "\n")
+
+
+def export_prometheus(path):
+    _write(path, prometheus_text())
+
+
+# ----------------------------------------------------
+# STEP 5: OPT-IN THROUGH THE ENVIRONMENT
+# ----------------------------------------------------
+
+_json_path = os.environ.get("NLP_METRICS")
+_textfile_path = os.environ.get("NLP_METRICS_TEXTFILE")
+
+
+def _export_at_exit():
+    # Only the process that switched it on writes (not forked workers)
+    if os.getpid() != _owner_pid:
+        return
+    if _json_path:
+        export_json(_json_path)
+    if _textfile_path:
+        export_prometheus(_textfile_path)
+
+
+if _json_path or _textfile_path:
+    enable()
+    _owner_pid = os.getpid()
+    atexit.register(_export_at_exit)
+
+
+# ----------------------------------------------------
+# STEP 6: OVERHEAD CHECK
+# ----------------------------------------------------
+
+def overhead(calls=1000000):
+    """
+    Nanoseconds per `with stage(...)` block, off and on
+    """
+    was_enabled = _enabled
+    results = {}
+    for name, switch in (("off", disable), ("on", enable)):
+        switch()
+        start = time.perf_counter()
+        for _ in range(calls):
+            with stage("overhead", tokens=1):
+                pass
+        results[name] = (time.perf_counter() - start) / calls * 1e9
+    _stages.pop("overhead", None)
+    (enable if was_enabled else disable)()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-stage timing and counters for the NLP scripts.")
+    parser.add_argument("--overhead", action="store_true", help="measure the cost of one stage() call")
+    parser.add_argument("--calls", type=int, default=1000000)
+    args = parser.parse_args()
+
+    if args.overhead:
+        for name, ns in overhead(args.calls).items():
+            print(f"instrumentation {name:<3}: {ns:8.1f} ns per stage() block")
+    else:
+        parser.print_help()
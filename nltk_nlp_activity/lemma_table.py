@@ -0,0 +1,307 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Precompute lemmas ONCE: (word, WordNet POS) -> lemma
+# 2. Save them as a compact, memory-mappable file
+# 3. Look lemmas up at run time without loading WordNet
+#    (WordNet + morphy are only used for words not in the table)
+# 4. Check that the lemmatization pipeline gives the same lemmas
+#    with the table as without it
+# ----------------------------------------------------
+#
+# WHY:
+# WordNetLemmatizer.lemmatize() loads the whole WordNet corpus the
+# first time it is called, and then runs morphy (suffix rules +
+# dictionary lookups) for every single token.
+#
+# FILE FORMAT (lemma_table.bin):
+#   8 bytes   magic  b"LEMTAB1\0"
+#   4 bytes   N = number of entries (unsigned int)
+#   4*(N+1)   offsets of the entries inside the data block
+#             (all integers little-endian, whatever the machine)
+#   data      entries "pos<TAB>word<NUL>lemma", SORTED by "pos<TAB>word"
+#
+# Because the entries are sorted, a lookup is a binary search
+# directly in the memory-mapped file: nothing has to be parsed
+# or loaded when the program starts.
+#
+# USAGE:
+#   python lemma_table.py build                     (WordNet vocabulary)
+#   python lemma_table.py build --corpus news.txt   (+ our own vocabulary)
+#   python lemma_table.py check --corpus news.txt   (Document.lemmas with vs without the table)
+
+# argparse / os / struct / sys / mmap: command line and binary file handling
+import argparse
+import mmap
+import os
+import struct
+import sys
+
+# array: the offsets are read as a typed array of unsigned ints
+from array import array
+
+# bisect: binary search over the sorted entries
+from bisect import bisect_left
+
+
+# ----------------------------------------------------
+# STEP 1: TABLE-DRIVEN TAG MAPPING
+# ----------------------------------------------------
+# NLTK POS tags (like NN, VB, JJ) are different
+# from WordNet POS tags (NOUN, VERB, ADJ, ADV)
+#
+# The WordNet constants are plain letters. Writing them here
+# (instead of reading wordnet.ADJ, ...) avoids loading WordNet
+# just to convert a tag.
+#
+#   J... (JJ, JJR, JJS)       → "a" (adjective)
+#   V... (VB, VBD, VBG, ...)  → "v" (verb)
+#   N... (NN, NNS, NNP)       → "n" (noun)
+#   R... (RB, RBR, RBS)       → "r" (adverb)
+#   anything else             → "n" (treated as a noun)
+TAG_TO_WORDNET = {"J": "a", "V": "v", "N": "n", "R": "r"}
+
+
+def wordnet_pos(tag):
+    return TAG_TO_WORDNET.get(tag[:1], "n")
+
+
+# ----------------------------------------------------
+# STEP 2: BUILD THE TABLE
+# ----------------------------------------------------
+
+MAGIC = b"LEMTAB1\0"
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lemma_table.bin")
+
+
+def wordnet_vocabulary():
+    """
+    Yield (word, pos) for every WordNet lemma name
+    and every irregular form in WordNet's exception lists
+    (e.g. "feet" -> "foot", "went" -> "go")
+    """
+    from nltk.corpus import wordnet
+
+    for pos in "nvar":
+        for name in wordnet.all_lemma_names(pos):
+            yield name, pos
+        for form in wordnet._exception_map[pos]:
+            yield form, pos
+
+
+def corpus_vocabulary(path):
+    """
+    Yield (word, pos) for every tagged token of a text file
+    (one document per line)
+    """
+    from batch_tagging import flatten, tag_documents
+
+    with open(path, encoding="utf-8") as f:
+        for tagged in tag_documents(f):
+            for word, tag in flatten(tagged):
+                yield word, wordnet_pos(tag)
+
+
+def build_table(pairs, path=TABLE_PATH, lemmatizer=None):
+    """
+    Lemmatize every distinct (word, pos) once with WordNet
+    (or `lemmatizer`) and write the sorted table;
+    returns the number of entries
+    """
+    if lemmatizer is None:
+        from nltk.stem import WordNetLemmatizer
+        lemmatizer = WordNetLemmatizer()
+    entries = {}
+    for word, pos in pairs:
+        key = f"{pos}\t{word}".encode("utf-8")
+        if key not in entries and b"\0" not in key:
+            entries[key] = lemmatizer.lemmatize(word, pos).encode("utf-8")
+
+    offsets = array("I", [0])
+    data = bytearray()
+    for key in sorted(entries):
+        data += key + b"\0" + entries[key]
+        offsets.append(len(data))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(entries)))
+        f.write(offsets.tobytes())
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(entries)
+
+
+# ----------------------------------------------------
+# STEP 3: LOOK UP LEMMAS (MEMORY-MAPPED)
+# ----------------------------------------------------
+
+class _SortedKeys:
+    """
+    Read-only view of the sorted keys, for bisect
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self):
+        return self.table.count
+
+    def __getitem__(self, i):
+        entry = self.table.entry(i)
+        return entry[:entry.index(b"\0")]
+
+
+class LemmaTable:
+    """
+    (word, WordNet POS) -> lemma, served from the memory-mapped table,
+    with WordNetLemmatizer (morphy) as the fallback for misses
+    """
+
+    def __init__(self, path=TABLE_PATH):
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:8] != MAGIC:
+            raise ValueError(f"{path} is not a lemma table")
+        self.count = struct.unpack_from("<I", self.data, 8)[0]
+
+        # Offsets as unsigned ints, read straight from the mapped file
+        # (little-endian machines); big-endian ones read a swapped copy
+        header = 12
+        raw = memoryview(self.data)[header:header + 4 * (self.count + 1)]
+        if sys.byteorder == "little":
+            self.offsets = raw.cast("I")
+        else:
+            offsets = array("I", raw.tobytes())
+            offsets.byteswap()
+            raw.release()
+            self.offsets = memoryview(offsets)
+        self.base = header + 4 * (self.count + 1)
+        self.keys = _SortedKeys(self)
+
+        # Small per-process memo: repeated words skip the binary search
+        self.memo = {}
+        self.lemmatizer = None
+        self.hits = 0
+        self.misses = 0
+
+    def entry(self, i):
+        return self.data[self.base + self.offsets[i]:self.base + self.offsets[i + 1]]
+
+    def lookup(self, word, pos):
+        """
+        Return the lemma stored in the table, or None
+        """
+        key = f"{pos}\t{word}".encode("utf-8")
+        i = bisect_left(self.keys, key)
+        if i < self.count:
+            entry = self.entry(i)
+            stored_key, _, lemma = entry.partition(b"\0")
+            if stored_key == key:
+                return lemma.decode("utf-8")
+        return None
+
+    def lemmatize(self, word, pos="n"):
+        """
+        Same result as WordNetLemmatizer().lemmatize(word, pos)
+        """
+        memo_key = (word, pos)
+        if memo_key in self.memo:
+            return self.memo[memo_key]
+
+        lemma = self.lookup(word, pos)
+        if lemma is not None:
+            self.hits += 1
+        else:
+            # Miss: fall back to WordNet's morphy (loads WordNet only now)
+            self.misses += 1
+            if self.lemmatizer is None:
+                from nltk.stem import WordNetLemmatizer
+                self.lemmatizer = WordNetLemmatizer()
+            lemma = self.lemmatizer.lemmatize(word, pos)
+
+        self.memo[memo_key] = lemma
+        return lemma
+
+    def close(self):
+        self.offsets.release()
+        self.data.close()
+        self.file.close()
+
+
+def default_lemmatizer(path=TABLE_PATH):
+    """
+    The table if it has been built, otherwise WordNetLemmatizer
+    (both have the same lemmatize(word, pos) method)
+    """
+    if os.path.exists(path):
+        return LemmaTable(path)
+    from nltk.stem import WordNetLemmatizer
+    return WordNetLemmatizer()
+
+
+# ----------------------------------------------------
+# STEP 4: PARITY CHECK
+# ----------------------------------------------------
+
+def check_parity(texts, path=TABLE_PATH, reference=None):
+    """
+    Lemmatize tagged text the way pos_based_lemmatization.py does
+    (Document.lemmas), once WITH the table and once WITHOUT it
+    (plain WordNetLemmatizer, or `reference`), and compare token
+    by token; returns (tokens checked, mismatches)
+    """
+    # Imported here: document.py itself imports this module
+    from document import Document
+
+    if reference is None:
+        from nltk.stem import WordNetLemmatizer
+        reference = WordNetLemmatizer()
+    table = LemmaTable(path)
+    checked = 0
+    mismatches = []
+    for text in texts:
+        if not text.strip():
+            continue
+        with_table = Document(text, lemmatizer=table)
+        without_table = Document(text, lemmatizer=reference)
+        for (word, tag), expected, got in zip(with_table.pos_tags, without_table.lemmas, with_table.lemmas):
+            checked += 1
+            if got != expected:
+                mismatches.append((word, tag, expected, got))
+    table.close()
+    return checked, mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or check the precompiled lemma table.")
+    parser.add_argument("command", choices=["build", "check"])
+    parser.add_argument("--corpus", help="text file whose vocabulary is added to the table")
+    parser.add_argument("--no-wordnet", action="store_true",
+                        help="only use the corpus vocabulary (smaller table)")
+    parser.add_argument("-o", "--output", default=TABLE_PATH)
+    args = parser.parse_args()
+
+    def vocabulary():
+        if not args.no_wordnet:
+            yield from wordnet_vocabulary()
+        if args.corpus:
+            yield from corpus_vocabulary(args.corpus)
+
+    if args.command == "build":
+        size = build_table(vocabulary(), args.output)
+        print(f"Wrote {args.output} ({size} entries)")
+    else:
+        if not args.corpus:
+            parser.error("check needs --corpus (the text to lemmatize)")
+        if not os.path.exists(args.output):
+            parser.error(f"{args.output} does not exist (run 'python lemma_table.py build' first)")
+        with open(args.corpus, encoding="utf-8") as f:
+            checked, mismatches = check_parity(f, args.output)
+        print(f"Checked {checked} tagged tokens: {len(mismatches)} mismatches")
+        for word, tag, expected, got in mismatches[:20]:
+            print(f"  {word!r} ({tag}): without table={expected!r} with table={got!r}")
+        if mismatches:
+            raise SystemExit(1)
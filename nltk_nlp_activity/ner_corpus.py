@@ -0,0 +1,289 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Run Named Entity Recognition over a WHOLE CORPUS in one pass
+#    (a directory of .txt files, or a JSONL stream of {"id", "text"})
+# 2. Use every CPU core: documents are processed in batches
+#    by a pool of workers
+# 3. Load the tagger and the NE chunker ONCE per worker
+# 4. Build an entity index: (entity, label) -> documents + count
+#    and write it to disk as we go (SQLite)
+# ----------------------------------------------------
+#
+# WHY:
+# nltk.ne_chunk() loads the maxent chunker model on EVERY call,
+# and ner_exploration.py handles only one text per run.
+#
+# USAGE:
+#   python ner_corpus.py news/ --index entities.sqlite --workers 8
+#   python ner_corpus.py articles.jsonl --index entities.sqlite
+#   python ner_corpus.py news/ --index entities.sqlite --gazetteer entities.tsv
+#   python ner_corpus.py --index entities.sqlite --top PERSON 20
+
+# Import the NLTK library
+import nltk
+
+# argparse / json / os / sqlite3 / sys / time: input, output and timing
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+
+# Counter: entity counts inside one document
+# deque: batches that are currently being processed, in order
+from collections import Counter, deque
+
+# Pool: runs the workers as separate processes
+from multiprocessing import Pool
+
+# Shared steps: sentence splitting + batched tagging (batch_tagging.py)
+# and the PERSON / GPE extraction loop (ner_exploration.py)
+from batch_tagging import get_tagger, split_document
+from fast_tokenizer import MODES, get_mode, set_mode
+from ner_exploration import extract_entities
+
+# Optional gazetteer fast path (see gazetteer.py)
+from gazetteer import Gazetteer, covers, name_entities
+
+# Optional per-stage timing (see instrumentation.py)
+import instrumentation
+from instrumentation import stage
+
+
+# ----------------------------------------------------
+# STEP 1: READ THE CORPUS
+# ----------------------------------------------------
+
+def read_documents(source, id_field="id", text_field="text"):
+    """
+    Yield (doc_id, text) for every document
+    - a directory: every .txt file is one document (id = file name)
+    - a .jsonl file or '-' (stdin): one JSON object per line
+    """
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.endswith(".txt"):
+                with open(os.path.join(source, name), encoding="utf-8") as f:
+                    yield name, f.read()
+        return
+
+    stream = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        for index, line in enumerate(stream):
+            if line.strip():
+                record = json.loads(line)
+                yield str(record.get(id_field, index)), record[text_field]
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def batched(items, batch_size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ----------------------------------------------------
+# STEP 2: WORKER (TAGGER + CHUNKER LOADED ONCE)
+# ----------------------------------------------------
+
+_chunker = None
+_labels = ('PERSON', 'GPE')
+_gazetteer = None
+
+
+def init_worker(labels, gazetteer_path=None):
+    """
+    Runs once per worker: load both models (and the gazetteer,
+    if any) and remember the labels
+    """
+    global _chunker, _labels, _gazetteer
+    get_tagger()
+    _chunker = nltk.chunk.ne_chunker()
+    _labels = tuple(labels)
+    _gazetteer = Gazetteer.load(gazetteer_path) if gazetteer_path else None
+
+
+def process_batch(batch):
+    """
+    Return [(doc_id, Counter({(entity, label): count})), ...]
+    for a batch of (doc_id, text) pairs
+    """
+    tagger = get_tagger()
+    results = []
+    for doc_id, text in batch:
+        found = Counter()
+        sentences = split_document(text)
+
+        # Sentences whose capitalized words are all known names
+        # skip the tagger and the chunker
+        if _gazetteer is not None:
+            remaining = []
+            for sentence in sentences:
+                with stage("gazetteer", tokens=len(sentence)):
+                    names = _gazetteer.find(sentence)
+                    skip = covers(sentence, names)
+                if skip:
+                    found.update(name_entities(sentence, names, _labels))
+                    instrumentation.count("chunker_skipped", "gazetteer")
+                else:
+                    remaining.append(sentence)
+            sentences = remaining
+
+        with stage("pos_tag", tokens=sum(len(sentence) for sentence in sentences)):
+            tagged_sentences = tagger.tag_sents(sentences)
+        for tagged_sentence in tagged_sentences:
+            with stage("ne_chunk", tokens=len(tagged_sentence)):
+                tree = _chunker.parse(tagged_sentence)
+            found.update(extract_entities(tree, _labels))
+        instrumentation.count("documents", "ne_chunk")
+        results.append((doc_id, found))
+    return results
+
+
+def process_corpus(documents, workers, batch_size, labels, gazetteer_path=None):
+    """
+    Yield (doc_id, entity counter) for every document
+    """
+    batches = batched(documents, batch_size)
+
+    if workers <= 1:
+        init_worker(labels, gazetteer_path)
+        for batch in batches:
+            yield from process_batch(batch)
+        return
+
+    # With instrumentation on, the workers send their timings back
+    measured = instrumentation.enabled()
+
+    def result(task):
+        if not measured:
+            return task.get()
+        found, numbers = task.get()
+        instrumentation.merge(numbers)
+        return found
+
+    with Pool(processes=workers, initializer=instrumentation.init_worker,
+              initargs=(init_worker, labels, gazetteer_path)) as pool:
+        pending = deque()
+        for batch in batches:
+            if measured:
+                pending.append(pool.apply_async(instrumentation.run_measured, (process_batch, batch)))
+            else:
+                pending.append(pool.apply_async(process_batch, (batch,)))
+            if len(pending) >= workers * 2:
+                yield from result(pending.popleft())
+        while pending:
+            yield from result(pending.popleft())
+
+
+# ----------------------------------------------------
+# STEP 3: THE ENTITY INDEX (ON DISK)
+# ----------------------------------------------------
+# One row per (entity, label, document) with the number of
+# mentions in that document. Totals are sums over the rows;
+# indexing a document again first deletes its old rows, so it
+# never double counts or keeps entities that are gone.
+
+class EntityIndex:
+
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS postings ("
+            " entity TEXT, label TEXT, doc_id TEXT, count INTEGER NOT NULL,"
+            " PRIMARY KEY (entity, label, doc_id))"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS postings_label ON postings(label, entity)")
+        # Re-indexing a document deletes its rows by doc_id (see add)
+        self.db.execute("CREATE INDEX IF NOT EXISTS postings_doc ON postings(doc_id)")
+
+    def add(self, doc_id, found):
+        """
+        Add the entities of one document, replacing any earlier
+        postings of doc_id (same transaction; not committed yet)
+        """
+        self.db.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self.db.executemany(
+            "INSERT INTO postings VALUES (?, ?, ?, ?)",
+            [(entity, label, doc_id, count) for (entity, label), count in found.items()],
+        )
+
+    def commit(self):
+        self.db.commit()
+
+    def top(self, label, k):
+        """
+        Most frequent entities of one label:
+        [(entity, total mentions, number of documents), ...]
+        """
+        return self.db.execute(
+            "SELECT entity, SUM(count), COUNT(*) FROM postings WHERE label = ? "
+            "GROUP BY entity ORDER BY SUM(count) DESC LIMIT ?",
+            (label, k),
+        ).fetchall()
+
+    def documents(self, entity, label):
+        return [row[0] for row in self.db.execute(
+            "SELECT doc_id FROM postings WHERE entity = ? AND label = ?", (entity, label)
+        )]
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+
+# ----------------------------------------------------
+# STEP 4: COMMAND LINE PROGRAM
+# ----------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel NER over a corpus with an on-disk entity index.")
+    parser.add_argument("source", nargs="?", help="directory of .txt files, .jsonl file, or '-' for stdin")
+    parser.add_argument("--index", default="entities.sqlite", help="entity index file (SQLite)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=32, help="documents per worker task")
+    parser.add_argument("--labels", nargs="+", default=['PERSON', 'GPE'])
+    parser.add_argument("--gazetteer", metavar="FILE",
+                        help="known names (see gazetteer.py); covered sentences skip pos_tag + ne_chunk")
+    parser.add_argument("--commit-every", type=int, default=1000, help="documents between index commits")
+    parser.add_argument("--top", nargs=2, metavar=("LABEL", "K"),
+                        help="print the K most frequent entities of LABEL from the index")
+    parser.add_argument("--tokenizer", choices=MODES, default=get_mode(),
+                        help="exact = nltk.word_tokenize, fast = fast_tokenizer.py (default: $NLP_TOKENIZER or exact)")
+    args = parser.parse_args()
+    set_mode(args.tokenizer)
+
+    index = EntityIndex(args.index)
+
+    if args.source:
+        start = time.perf_counter()
+        documents = 0
+        for doc_id, found in process_corpus(read_documents(args.source), args.workers,
+                                            args.batch_size, args.labels, args.gazetteer):
+            index.add(doc_id, found)
+            documents += 1
+
+            # Written incrementally: a crash keeps everything committed so far
+            if documents % args.commit_every == 0:
+                index.commit()
+        index.commit()
+        elapsed = time.perf_counter() - start
+        print(f"Indexed {documents} documents in {elapsed:.1f}s "
+              f"({documents / elapsed if elapsed else 0:,.1f} docs/sec, {args.workers} workers)",
+              file=sys.stderr)
+
+    if args.top:
+        label, k = args.top[0], int(args.top[1])
+        for entity, count, doc_count in index.top(label, k):
+            print(f"{entity}\t{count}\t{doc_count} documents")
+
+    index.close()
@@ -6,14 +6,11 @@
 # 4. Extract only PERSON and GPE entities
 # ----------------------------------------------------
 
-# Import the NLTK library
-# NLTK provides tools for NLP tasks such as NER
-import nltk
-
-# Import ne_chunk function
-# ne_chunk performs Named Entity Recognition
-# It groups words into entities like PERSON, GPE, ORGANIZATION
-from nltk import ne_chunk
+# Import the Document (see document.py)
+# Tokens, POS tags and the NE tree are computed once per text
+# (and shared with the noun and lemma scripts); the NE chunker
+# model is loaded once instead of on every ne_chunk call
+from document import Document
 
 
 # ----------------------------------------------------
@@ -25,63 +22,72 @@ text = "Barack Obama was born in Hawaii. He was elected president of the USA."
 
 
 # ----------------------------------------------------
-# STEP 2: TOKENIZATION
+# STEP 5: EXTRACT PERSON AND GPE ENTITIES
 # ----------------------------------------------------
+# (defined as a function so that ner_corpus.py can reuse it)
 
-# Split the text into individual words
-# Example output: ['Barack', 'Obama', 'was', 'born', 'in', 'Hawaii', '.']
-token = nltk.word_tokenize(text)
+def extract_entities(tree, labels=('PERSON', 'GPE')):
 
+    # Create an empty list to store extracted entities
+    entities = []
 
-# ----------------------------------------------------
-# STEP 3: PART-OF-SPEECH TAGGING
-# ----------------------------------------------------
+    # Loop through each item in the NER tree
+    for subtree in tree:
 
-# Assign POS tags to each token
-# Example: ('Barack', 'NNP'), ('Obama', 'NNP')
-pos_tags = nltk.pos_tag(token)
+        # Check if the item is a named entity subtree
+        # Named entities have a "label" attribute
+        if hasattr(subtree, 'label'):
 
+            # Only keep PERSON and GPE entities
+            if subtree.label() in labels:
 
-# ----------------------------------------------------
-# STEP 4: NAMED ENTITY RECOGNITION (NER)
-# ----------------------------------------------------
+                # Combine words that form the entity
+                # Example: ['Barack', 'Obama'] → "Barack Obama"
+                entity = " ".join([leaf[0] for leaf in subtree.leaves()])
 
-# ne_chunk builds a tree structure
-# It groups tokens into named entities
-# Example labels: PERSON, GPE, ORGANIZATION
-tree = ne_chunk(pos_tags)
+                # Store entity with its label
+                entities.append((entity, subtree.label()))
 
+    return entities
 
-# ----------------------------------------------------
-# STEP 5: EXTRACT PERSON AND GPE ENTITIES
-# ----------------------------------------------------
 
-# Create an empty list to store extracted entities
-entities = []
+if __name__ == "__main__":
 
-# Loop through each item in the NER tree
-for subtree in tree:
+    document = Document(text)
 
-    # Check if the item is a named entity subtree
-    # Named entities have a "label" attribute
-    if hasattr(subtree, 'label'):
+    # ----------------------------------------------------
+    # STEP 2: TOKENIZATION
+    # ----------------------------------------------------
 
-        # Only keep PERSON and GPE entities
-        if subtree.label() in ['PERSON', 'GPE']:
+    # Split the text into individual words
+    # Example output: ['Barack', 'Obama', 'was', 'born', 'in', 'Hawaii', '.']
+    token = document.tokens
 
-            # Combine words that form the entity
-            # Example: ['Barack', 'Obama'] → "Barack Obama"
-            entity = " ".join([leaf[0] for leaf in subtree.leaves()])
+    # ----------------------------------------------------
+    # STEP 3: PART-OF-SPEECH TAGGING
+    # ----------------------------------------------------
 
-            # Store entity with its label
-            entities.append((entity, subtree.label()))
+    # Assign POS tags to each token
+    # Example: ('Barack', 'NNP'), ('Obama', 'NNP')
+    pos_tags = document.pos_tags
 
+    # ----------------------------------------------------
+    # STEP 4: NAMED ENTITY RECOGNITION (NER)
+    # ----------------------------------------------------
 
-# ----------------------------------------------------
-# STEP 6: OUTPUT
-# ----------------------------------------------------
+    # The NE chunker (the model behind ne_chunk) builds a tree
+    # It groups tokens into named entities
+    # Example labels: PERSON, GPE, ORGANIZATION
+    tree = document.ne_tree
+
+    # Collect the PERSON and GPE entities (STEP 5)
+    entities = extract_entities(tree)
+
+    # ----------------------------------------------------
+    # STEP 6: OUTPUT
+    # ----------------------------------------------------
 
-# Print extracted named entities
-# Example output:
-# [('Barack Obama', 'PERSON'), ('Hawaii', 'GPE'), ('USA', 'GPE')]
-print(entities)
+    # Print extracted named entities
+    # Example output:
+    # [('Barack Obama', 'PERSON'), ('Hawaii', 'GPE'), ('USA', 'GPE')]
+    print(entities)
@@ -0,0 +1,153 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Send a text to the resident NLP server (nlp_server.py)
+#    and print tokens / tags / entities / lemmas / nouns / top words
+# 2. Start in milliseconds: this program does NOT import NLTK,
+#    the server has all models loaded already
+# 3. Benchmark: cold (load everything, answer once) vs warm
+#    (ask the running server)
+# ----------------------------------------------------
+#
+# USAGE:
+#   python nlp_server.py &
+#   python nlp_client.py tags "Barack Obama was born in Hawaii."
+#   python nlp_client.py entities lemmas "Barack Obama was born in Hawaii."
+#   echo "long text ..." | python nlp_client.py top_words -
+#   python nlp_client.py stats
+#   python nlp_client.py bench --repeats 5
+
+# argparse / json / os / socket / subprocess / sys / time:
+# the client only needs the standard library
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+LAYERS = ("tokens", "tags", "entities", "lemmas", "nouns", "top_words")
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def default_socket_path():
+    return os.environ.get("NLP_SERVER_SOCKET") or f"/tmp/nlp-{os.getuid()}.sock"
+
+
+# ----------------------------------------------------
+# STEP 1: TALK TO THE SERVER
+# ----------------------------------------------------
+
+class Client:
+    """
+    One connection, any number of requests
+    """
+
+    def __init__(self, path=None, timeout=60):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(path or default_socket_path())
+        self.stream = self.sock.makefile("rb")
+
+    def request(self, message):
+        self.sock.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        line = self.stream.readline()
+        if not line:
+            raise ConnectionError("the server closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response
+
+    def analyze(self, text, layers=("tags",), **options):
+        return self.request(dict(options, text=text, layers=list(layers)))
+
+    def close(self):
+        self.stream.close()
+        self.sock.close()
+
+
+# ----------------------------------------------------
+# STEP 2: BENCHMARK (COLD VS WARM)
+# ----------------------------------------------------
+
+SENTENCE = "Barack Obama was born in Hawaii."
+
+
+def run_seconds(command):
+    start = time.perf_counter()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL, cwd=HERE)
+    return time.perf_counter() - start
+
+
+def benchmark(path, layers, repeats):
+    """
+    cold: a new Python process imports NLTK, loads the models and answers
+    warm: a new client process asks the running server
+    request: one request on an open connection (no process start)
+    """
+    cold = [run_seconds([sys.executable, "nlp_server.py", "--once", SENTENCE, "--layers", *layers])
+            for _ in range(repeats)]
+    warm = [run_seconds([sys.executable, "nlp_client.py", "--socket", path, *layers, SENTENCE])
+            for _ in range(repeats)]
+
+    client = Client(path)
+    client.analyze(SENTENCE, layers)
+    requests = []
+    for _ in range(max(repeats, 100)):
+        start = time.perf_counter()
+        client.analyze(SENTENCE, layers)
+        requests.append(time.perf_counter() - start)
+    client.close()
+
+    requests.sort()
+    print(f"layers: {', '.join(layers)} | text: {SENTENCE!r}")
+    print(f"cold  (new process, load models)  median {sorted(cold)[len(cold) // 2] * 1000:9.1f} ms")
+    print(f"warm  (new client process)        median {sorted(warm)[len(warm) // 2] * 1000:9.1f} ms")
+    print(f"warm  (request on open connection) p50 {requests[len(requests) // 2] * 1000:9.2f} ms, "
+          f"p99 {requests[int(len(requests) * 0.99)] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Client for the resident NLP server (nlp_server.py).")
+    parser.add_argument("words", nargs="+", metavar="LAYER... TEXT",
+                        help=f"layers ({', '.join(LAYERS)}) then the text ('-' = stdin); "
+                             "or 'stats' / 'bench'")
+    parser.add_argument("--socket", default=default_socket_path())
+    parser.add_argument("--top", type=int, default=10, help="for nouns / top_words")
+    parser.add_argument("--labels", nargs="+", default=["PERSON", "GPE"], help="for entities")
+    parser.add_argument("--repeats", type=int, default=5, help="for bench")
+    parser.add_argument("--json", action="store_true", help="print the raw JSON response")
+    args = parser.parse_args()
+
+    command = args.words[0]
+    try:
+        if command == "bench":
+            benchmark(args.socket, args.words[1:] or ["tags"], args.repeats)
+            raise SystemExit(0)
+
+        client = Client(args.socket)
+        if command == "stats":
+            print(json.dumps(client.request({"command": "stats"}), indent=2))
+            raise SystemExit(0)
+
+        *layers, text = args.words
+        if not layers or any(layer not in LAYERS for layer in layers):
+            parser.error(f"give one or more layers ({', '.join(LAYERS)}) before the text")
+        if text == "-":
+            text = sys.stdin.read()
+
+        response = client.analyze(text, layers, top=args.top, labels=args.labels)
+        client.close()
+    except (FileNotFoundError, ConnectionRefusedError):
+        raise SystemExit(f"ERROR: no server on {args.socket} (start it with: python nlp_server.py)")
+    except RuntimeError as e:
+        raise SystemExit(f"ERROR: {e}")
+
+    if args.json:
+        print(json.dumps(response, ensure_ascii=False))
+    else:
+        # Same shapes as the individual scripts print
+        for layer in layers:
+            value = [tuple(item) if isinstance(item, list) else item for item in response[layer]]
+            print(value if len(layers) == 1 else f"{layer}: {value}")
@@ -0,0 +1,223 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Load the NLTK models ONCE and keep them in memory:
+#    - Punkt sentence tokenizer
+#    - averaged perceptron POS tagger
+#    - maxent NE chunker
+#    - WordNet (or the lemma table, see lemma_table.py)
+# 2. Answer requests from local programs over a Unix socket
+#    (see nlp_client.py): tokens, tags, entities, lemmas,
+#    nouns, top words
+# ----------------------------------------------------
+#
+# WHY:
+# Every run of tokenization.py / topic_words.py / ner_exploration.py /
+# pos_based_lemmatization.py imports NLTK and loads the models again.
+# For one short sentence that takes seconds; the work itself
+# takes milliseconds. The resident server pays the loading once.
+#
+# PROTOCOL (one JSON object per line, both ways):
+#   → {"text": "Barack Obama was born in Hawaii.", "layers": ["tags", "entities"]}
+#   ← {"tags": [["Barack", "NNP"], ...], "entities": [["Barack Obama", "PERSON"], ...]}
+#   → {"command": "stats"}
+#   ← {"requests": 12, "uptime_seconds": 60.2, "models": {...}}
+# Errors come back as {"error": "..."}.
+#
+# The socket is created with owner-only permissions (local use only).
+#
+# USAGE:
+#   python nlp_server.py                       (socket: $NLP_SERVER_SOCKET or /tmp/nlp-<uid>.sock)
+#   python nlp_server.py --socket /tmp/nlp.sock
+#   python nlp_server.py --once "Barack Obama was born in Hawaii." --layers entities
+#                                              (no server: load, answer, exit = the "cold" path)
+
+# argparse / asyncio / json / os / sys / time: command line, server, messages
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+# Shared layers and models (see document.py, batch_tagging.py,
+# tokenization.py): the same results as the individual scripts
+import nltk
+from batch_tagging import get_tagger
+from document import Document, get_chunker, get_lemmatizer
+from tokenization import count_words
+
+LAYERS = ("tokens", "tags", "entities", "lemmas", "nouns", "top_words")
+
+
+def default_socket_path():
+    return os.environ.get("NLP_SERVER_SOCKET") or f"/tmp/nlp-{os.getuid()}.sock"
+
+
+def short_error(e):
+    """
+    One line of an error (NLTK's missing-data message is a whole box)
+    """
+    lines = [line.strip() for line in str(e).splitlines() if line.strip()]
+    resource = [line for line in lines if line.startswith("Resource")]
+    return (resource or lines or [type(e).__name__])[0]
+
+
+# ----------------------------------------------------
+# STEP 1: LOAD THE MODELS (ONCE)
+# ----------------------------------------------------
+
+def load_models():
+    """
+    Load every model now instead of on the first request;
+    returns {model: seconds or "missing: ..."}
+    """
+    loaders = {
+        "punkt": lambda: nltk.sent_tokenize("Warm up. Punkt is loaded now."),
+        "tagger": get_tagger,
+        "ne_chunker": get_chunker,
+        # WordNet is loaded lazily by its first lookup
+        "lemmatizer": lambda: get_lemmatizer().lemmatize("models", "n"),
+    }
+    models = {}
+    for name, load in loaders.items():
+        start = time.perf_counter()
+        try:
+            load()
+            models[name] = round(time.perf_counter() - start, 3)
+        except LookupError as e:
+            # Missing NLTK data: the layers that need it answer with an error
+            models[name] = f"missing: {short_error(e)}"
+    return models
+
+
+# ----------------------------------------------------
+# STEP 2: ANSWER ONE REQUEST
+# ----------------------------------------------------
+
+def analyze(request):
+    """
+    {"text": ..., "layers": [...], "top": 10, "labels": [...]} → {layer: result}
+    """
+    text = request.get("text")
+    if not isinstance(text, str):
+        raise ValueError('expected {"text": "...", "layers": [...]}')
+    layers = request.get("layers") or ["tags"]
+    if not isinstance(layers, list) or not all(isinstance(layer, str) for layer in layers):
+        raise ValueError('"layers" must be a list of layer names')
+    unknown = [layer for layer in layers if layer not in LAYERS]
+    if unknown:
+        raise ValueError(f"unknown layers {unknown}, choose from {list(LAYERS)}")
+    top = request.get("top", 10)
+    if not isinstance(top, int) or isinstance(top, bool) or top < 0:
+        raise ValueError('"top" must be a non-negative integer')
+    labels = request.get("labels") or ['PERSON', 'GPE']
+    if not isinstance(labels, list) or not all(isinstance(label, str) for label in labels):
+        raise ValueError('"labels" must be a list of entity labels')
+
+    # One Document per request: tokens and tags are shared by all layers
+    document = Document(text)
+    result = {}
+    for layer in layers:
+        if layer == "tokens":
+            result[layer] = document.tokens
+        elif layer == "tags":
+            result[layer] = document.pos_tags
+        elif layer == "entities":
+            result[layer] = document.entities(tuple(labels))
+        elif layer == "lemmas":
+            result[layer] = document.lemmas
+        elif layer == "nouns":
+            result[layer] = document.noun_counts.most_common(top)
+        else:
+            # Same counting as tokenization.py (lowercase, no stopwords / punctuation)
+            result[layer] = count_words([text]).most_common(top)
+    return result
+
+
+class Server:
+
+    def __init__(self, models):
+        self.models = models
+        self.requests = 0
+        self.errors = 0
+        self.started = time.time()
+
+    def handle_message(self, line):
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("expected a JSON object")
+            if request.get("command") == "stats":
+                return {"requests": self.requests, "errors": self.errors,
+                        "uptime_seconds": round(time.time() - self.started, 1), "models": self.models}
+            result = analyze(request)
+            self.requests += 1
+            return result
+        except (ValueError, LookupError) as e:
+            self.errors += 1
+            return {"error": short_error(e)}
+        except Exception as e:
+            # Never drop the connection without an answer
+            self.errors += 1
+            return {"error": f"{type(e).__name__}: {short_error(e)}"}
+
+    async def handle(self, reader, writer):
+        # A client can send many requests on one connection
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = self.handle_message(line)
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+# ----------------------------------------------------
+# STEP 3: THE UNIX SOCKET SERVER
+# ----------------------------------------------------
+
+async def serve(path, models):
+    server_state = Server(models)
+    if os.path.exists(path):
+        os.remove(path)
+
+    # Owner-only permissions on the socket file
+    old_umask = os.umask(0o177)
+    try:
+        server = await asyncio.start_unix_server(server_state.handle, path=path, limit=64 * 1024 * 1024)
+    finally:
+        os.umask(old_umask)
+
+    print(f"Serving on {path} (models: {models})", file=sys.stderr)
+    async with server:
+        try:
+            await server.serve_forever()
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resident NLP worker on a Unix socket.")
+    parser.add_argument("--socket", default=default_socket_path())
+    parser.add_argument("--once", metavar="TEXT", help="answer one request without a server, then exit")
+    parser.add_argument("--layers", nargs="+", choices=LAYERS, default=["tags"])
+    args = parser.parse_args()
+
+    if args.once is not None:
+        server_state = Server({})
+        print(json.dumps(server_state.handle_message(json.dumps({"text": args.once, "layers": args.layers})),
+                         ensure_ascii=False))
+    else:
+        start = time.perf_counter()
+        models = load_models()
+        print(f"Models loaded in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+        try:
+            asyncio.run(serve(args.socket, models))
+        except KeyboardInterrupt:
+            pass
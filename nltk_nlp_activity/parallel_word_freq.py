@@ -0,0 +1,209 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Count word frequencies of a LARGE file on several CPU cores
+# 2. Each worker process counts its own share (shard) of the file
+# 3. Merge the per-worker counters pairwise (tree reduction)
+# 4. Pick the top-k words with a heap instead of sorting everything
+# 5. Benchmark the speedup with 1 / 2 / 4 / 8 workers
+# ----------------------------------------------------
+#
+# The tokenizing and filtering rules are exactly the ones in
+# tokenization.py (tokenize -> clean_tokens -> Counter), so the
+# result is the same as:  python tokenization.py corpus.txt
+#
+# USAGE:
+#   python parallel_word_freq.py corpus.txt --workers 4
+#   python parallel_word_freq.py --benchmark --size-mb 50
+
+# argparse: command line options
+# heapq: top-k selection in O(n log k)
+# os: file size and cpu count
+# random / tempfile / time: benchmark helpers
+import argparse
+import heapq
+import os
+import random
+import tempfile
+import time
+
+# Counter: word -> count
+from collections import Counter
+
+# Pool: runs the workers as separate processes
+from multiprocessing import Pool
+
+# Reuse the exact cleaning / counting rules of tokenization.py
+from tokenization import count_words, iter_chunks
+
+
+# ----------------------------------------------------
+# STEP 1: SPLIT THE FILE INTO SHARDS
+# ----------------------------------------------------
+
+def shard_offsets(path, shards):
+    """
+    Split the file into byte ranges of about equal size,
+    moving every cut forward to the next line boundary
+    """
+    size = os.path.getsize(path)
+    cuts = [0]
+    with open(path, "rb") as f:
+        for i in range(1, shards):
+            f.seek(max(size * i // shards, cuts[-1]))
+            f.readline()
+            cuts.append(min(f.tell(), size))
+    cuts.append(size)
+    return [(start, stop) for start, stop in zip(cuts, cuts[1:]) if stop > start]
+
+
+def count_shard(task):
+    """
+    Worker: read ONE byte range of the file itself (memory-mapped)
+    and count it into ONE local counter
+
+    Only the small counter is sent back to the parent,
+    never the text
+    """
+    path, start, stop, chunk_bytes = task
+    return count_words(iter_chunks(path, chunk_bytes, start, stop))
+
+
+# ----------------------------------------------------
+# STEP 2: MERGE COUNTERS (TREE REDUCTION)
+# ----------------------------------------------------
+
+def merge_pair(pair):
+    """
+    Merge two counters into the first one
+    """
+    left, right = pair
+    left.update(right)
+    return left
+
+
+def tree_reduce(counters, pool=None):
+    """
+    Merge counters pairwise, level by level:
+    8 counters -> 4 -> 2 -> 1
+
+    With a pool, the merges of one level run in parallel
+    """
+    counters = list(counters)
+    if not counters:
+        return Counter()
+    while len(counters) > 1:
+        pairs = [(counters[i], counters[i + 1]) for i in range(0, len(counters) - 1, 2)]
+        leftover = [counters[-1]] if len(counters) % 2 else []
+        if pool is not None and len(pairs) > 1:
+            merged = pool.map(merge_pair, pairs)
+        else:
+            merged = [merge_pair(pair) for pair in pairs]
+        counters = merged + leftover
+    return counters[0]
+
+
+# ----------------------------------------------------
+# STEP 3: TOP-K WITH A HEAP
+# ----------------------------------------------------
+
+def top_k(freq, k):
+    """
+    Return the k most common words, same shape and order
+    as Counter.most_common(k), without sorting the whole vocabulary
+    """
+    return heapq.nlargest(k, freq.items(), key=lambda item: item[1])
+
+
+# ----------------------------------------------------
+# STEP 4: PARALLEL COUNT OF A FILE
+# ----------------------------------------------------
+
+def parallel_count(path, workers, chunk_bytes=4 * 1024 * 1024):
+    """
+    Count all words of the file with the given number of workers
+
+    The file is split into one shard per worker; every worker keeps
+    one local counter and the counters are merged at the end
+    """
+    if workers <= 1:
+        return count_words(iter_chunks(path, chunk_bytes))
+
+    tasks = [(path, start, stop, chunk_bytes) for start, stop in shard_offsets(path, workers)]
+    with Pool(processes=workers) as pool:
+        return tree_reduce(pool.map(count_shard, tasks), pool)
+
+
+# ----------------------------------------------------
+# STEP 5: SCALING BENCHMARK
+# ----------------------------------------------------
+
+def write_synthetic_corpus(path, size_mb, seed=0):
+    """
+    Write a random English-like corpus of about size_mb megabytes
+    (Zipf-like word distribution, 15 words per line)
+    """
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(50000)]
+    common = ["the", "of", "and", "to", "in", "is", "that", "for", "it", "with"]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+
+    target = size_mb * 1024 * 1024
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < target:
+            words = rng.choices(vocabulary, weights, k=200) + rng.choices(common, k=100)
+            rng.shuffle(words)
+            lines = []
+            for start in range(0, len(words), 15):
+                lines.append(" ".join(words[start:start + 15]).capitalize() + ".")
+            block = "\n".join(lines) + "\n"
+            f.write(block)
+            written += len(block)
+
+
+def benchmark(size_mb, worker_counts, k=20):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corpus.txt")
+        write_synthetic_corpus(path, size_mb)
+        print(f"Synthetic corpus: {size_mb} MB, cores available: {os.cpu_count()}")
+
+        baseline = None
+        reference = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            freq = parallel_count(path, workers)
+            top_k(freq, k)
+            elapsed = time.perf_counter() - start
+
+            # Every run must produce exactly the same counts as 1 worker
+            baseline = baseline or elapsed
+            reference = reference or freq
+            status = "OK" if freq == reference else "MISMATCH"
+            print(
+                f"workers={workers:<2} time={elapsed:7.2f}s "
+                f"speedup={baseline / elapsed:5.2f}x "
+                f"MB/s={size_mb / elapsed:7.2f} top-{k} {status}"
+            )
+
+
+# ----------------------------------------------------
+# STEP 6: COMMAND LINE PROGRAM
+# ----------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Multi-core word frequency count.")
+    parser.add_argument("path", nargs="?", help="text file to analyze")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--benchmark", action="store_true",
+                        help="run the 1/2/4/8 worker scaling benchmark")
+    parser.add_argument("--size-mb", type=int, default=20,
+                        help="benchmark corpus size in MB (default: 20)")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.size_mb, [1, 2, 4, 8], args.top)
+    elif args.path:
+        print(top_k(parallel_count(args.path, args.workers), args.top))
+    else:
+        parser.error("give a file to analyze or use --benchmark")
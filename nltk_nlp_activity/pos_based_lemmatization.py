@@ -6,17 +6,16 @@
 # 4. Lemmatize each word using its correct POS
 # ----------------------------------------------------
 
-# Import the NLTK library
-# NLTK provides tools for Natural Language Processing
-import nltk
+# Import the precompiled lemma table (see lemma_table.py)
+from lemma_table import LemmaTable, default_lemmatizer
 
-# Import WordNetLemmatizer
-# Lemmatizer reduces words to their base (dictionary) form
-from nltk.stem import WordNetLemmatizer
+# Import the Document (see document.py)
+# Tokens and POS tags are computed once per text and shared
+# with the noun and entity scripts
+from document import Document
 
-# Import WordNet corpus
-# WordNet defines grammatical categories like noun, verb, adjective, adverb
-from nltk.corpus import wordnet
+# Import the optional per-stage timing (see instrumentation.py)
+import instrumentation
 
 
 # ----------------------------------------------------
@@ -24,7 +23,12 @@ from nltk.corpus import wordnet
 # ----------------------------------------------------
 
 # Initialize the lemmatizer
-lemmatizer = WordNetLemmatizer()
+# If lemma_table.bin has been built (python lemma_table.py build),
+# lemmas are looked up in it and WordNet is only loaded for
+# words that are missing from the table;
+# otherwise it is WordNetLemmatizer, which reduces words to
+# their base (dictionary) form
+lemmatizer = default_lemmatizer()
 
 
 # ----------------------------------------------------
@@ -33,33 +37,16 @@ lemmatizer = WordNetLemmatizer()
 
 # NLTK POS tags (like NN, VB, JJ) are different
 # from WordNet POS tags (NOUN, VERB, ADJ, ADV)
-# This function converts NLTK tags to WordNet tags
-
-def get_wordnet_post(tag):
-
-    # If the POS tag starts with "J"
-    # It represents an adjective (JJ, JJR, JJS)
-    if tag.startswith("J"):
-        return wordnet.ADJ
-
-    # If the POS tag starts with "V"
-    # It represents a verb (VB, VBD, VBG, etc.)
-    elif tag.startswith("V"):
-        return wordnet.VERB
-
-    # If the POS tag starts with "N"
-    # It represents a noun (NN, NNS, NNP)
-    elif tag.startswith("N"):
-        return wordnet.NOUN
-
-    # If the POS tag starts with "R"
-    # It represents an adverb (RB, RBR, RBS)
-    elif tag.startswith("R"):
-        return wordnet.ADV
-
-    # Default case:
-    # If POS tag is unknown, treat the word as a noun
-    return wordnet.NOUN
+#
+# The conversion is lemma_table.wordnet_pos, which looks up
+# the first letter of the tag:
+# "J" → adjective (JJ, JJR, JJS)
+# "V" → verb (VB, VBD, VBG, etc.)
+# "N" → noun (NN, NNS, NNP)
+# "R" → adverb (RB, RBR, RBS)
+# If the POS tag is unknown, the word is treated as a noun
+#
+# Document.lemmas (STEP 6) applies it to every tag
 
 
 # ----------------------------------------------------
@@ -69,13 +56,16 @@ def get_wordnet_post(tag):
 # Example sentence for lemmatization
 paragraph = "The striped bats are hanging on their feet for best."
 
+# Its layers (tokens, tags, lemmas) are computed when first read
+document = Document(paragraph, lemmatizer=lemmatizer)
+
 
 # ----------------------------------------------------
 # STEP 4: TOKENIZATION
 # ----------------------------------------------------
 
 # Split the sentence into individual words
-tokens = nltk.word_tokenize(paragraph)
+tokens = document.tokens
 
 
 # ----------------------------------------------------
@@ -84,7 +74,7 @@ tokens = nltk.word_tokenize(paragraph)
 
 # Assign Part-of-Speech tags to each word
 # Example output: [('striped', 'JJ'), ('bats', 'NNS'), ...]
-pos_tags = nltk.pos_tag(tokens)
+pos_tags = document.pos_tags
 
 
 # ----------------------------------------------------
@@ -93,11 +83,14 @@ pos_tags = nltk.pos_tag(tokens)
 
 # Lemmatize each word using:
 # - the word itself
-# - its converted WordNet POS tag
-lemmatized_words = [
-    lemmatizer.lemmatize(word, get_wordnet_post(tag))
-    for word, tag in pos_tags
-]
+# - its converted WordNet POS tag (STEP 2)
+lemmatized_words = document.lemmas
+
+# The lemma table counts its own hits and misses
+# (a miss falls back to WordNet)
+if isinstance(lemmatizer, LemmaTable):
+    instrumentation.count("cache_hits", "lemma_table", lemmatizer.hits)
+    instrumentation.count("cache_misses", "lemma_table", lemmatizer.misses)
 
 
 # ----------------------------------------------------
@@ -0,0 +1,306 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Remember results of slow NLP steps (tagging, NER, VADER)
+# 2. Look them up by a HASH of the input text
+#    (+ the step name and the model version)
+# 3. Keep recent results in memory (LRU) and all results on disk (SQLite)
+# 4. Limit the disk size and evict the least recently used results
+# 5. Count hits and misses
+# ----------------------------------------------------
+#
+# The same texts come back again and again (retweets, templates,
+# re-ingested documents). With the cache, a repeated input costs
+# one lookup instead of a full tagger / chunker / VADER pass.
+#
+# The cache is OPT-IN: set the environment variable
+#   NLP_RESULT_CACHE=/path/to/cache.sqlite
+# and the scripts start using it automatically.
+
+# atexit: writes pending "last used" times when the program ends
+import atexit
+
+# hashlib: builds the content address (SHA-256) of each input
+import hashlib
+
+# json: turns token lists / tagged lists into a stable string
+import json
+
+# os: reads the environment variable
+import os
+
+# pickle: stores any Python result (lists, tuples, nltk Trees)
+import pickle
+
+# sqlite3: the on-disk store (a single file, safe for several processes)
+import sqlite3
+
+# time: "last used" timestamps for eviction
+import time
+
+# unicodedata: normalizes equivalent unicode spellings
+import unicodedata
+
+# OrderedDict: a simple LRU (least recently used) memory tier
+from collections import OrderedDict
+
+# Optional hit / miss counters per stage (see instrumentation.py)
+import instrumentation
+
+
+# ----------------------------------------------------
+# STEP 1: BUILD THE CACHE KEY
+# ----------------------------------------------------
+
+def normalize_text(text):
+    """
+    Normalize text so that trivially different copies share a key
+    (unicode NFC form, no leading/trailing whitespace)
+    """
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def make_key(stage, version, payload):
+    """
+    Return the content address of one input:
+    SHA-256 of (stage, model version, normalized input)
+
+    payload can be a string or a list (tokens, (word, tag) pairs, ...)
+    """
+    if isinstance(payload, str):
+        body = normalize_text(payload)
+    else:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    raw = "\x00".join([stage, version, body])
+    return hashlib.sha256(raw.encode("utf-8")).digest()
+
+
+# ----------------------------------------------------
+# STEP 2: THE TWO-TIER CACHE
+# ----------------------------------------------------
+
+class ResultCache:
+    """
+    Memory LRU in front of an SQLite table:
+    key (SHA-256) -> pickled result
+    """
+
+    SYNC_EVERY = 1000
+    TOUCH_EVERY = 1000
+
+    def __init__(self, path, max_bytes=512 * 1024 * 1024, memory_entries=10000):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.memory = OrderedDict()
+
+        # Hit / miss counters
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # WAL mode lets several worker processes read while one writes;
+        # synchronous=NORMAL avoids an fsync on every small commit
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key BLOB PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_lru ON results(last_used)")
+        self.db.commit()
+
+        # Running size estimate, so a put() does not have to SUM the table.
+        # Other processes may write too, so it is re-read every SYNC_EVERY puts
+        self.bytes_estimate = self.disk_bytes()
+        self.puts_since_sync = 0
+
+        # "Last used" times of hits (memory AND disk), written to disk in
+        # one batch before eviction, on close, or every TOUCH_EVERY hits
+        self.touched = {}
+
+    # ---------- memory tier ----------
+
+    def _remember(self, key, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        if len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    # ---------- public API ----------
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for key, or default on a miss
+        """
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.memory_hits += 1
+            self._touch(key)
+            return self.memory[key]
+
+        row = self.db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return default
+
+        self.disk_hits += 1
+        self._touch(key)
+        value = pickle.loads(row[0])
+        self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        """
+        Store a value in both tiers and evict old entries if needed
+        """
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self.db.execute(
+            "INSERT OR REPLACE INTO results (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+            (key, blob, len(blob), time.time()),
+        )
+        self.db.commit()
+        self._remember(key, value)
+
+        self.bytes_estimate += len(blob)
+        self.puts_since_sync += 1
+        if self.puts_since_sync >= self.SYNC_EVERY:
+            self.bytes_estimate = self.disk_bytes()
+            self.puts_since_sync = 0
+        if self.bytes_estimate > self.max_bytes:
+            self._evict()
+
+    def get_or_compute(self, stage, version, payload, compute):
+        """
+        Return the cached result for payload,
+        or run compute() once and cache what it returns
+        """
+        key = make_key(stage, version, payload)
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    # ---------- last used (batched) ----------
+
+    def _touch(self, key):
+        self.touched[key] = time.time()
+        if len(self.touched) >= self.TOUCH_EVERY:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the pending "last used" times in one transaction
+        """
+        if not self.touched:
+            return
+        self.db.executemany(
+            "UPDATE results SET last_used = MAX(last_used, ?) WHERE key = ?",
+            [(used, key) for key, used in self.touched.items()],
+        )
+        self.db.commit()
+        self.touched.clear()
+
+    # ---------- size cap ----------
+
+    def disk_bytes(self):
+        return self.db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def _evict(self):
+        """
+        Delete the least recently used rows
+        until the cache is back under 90% of max_bytes
+        """
+        # Recent hits must count as recent before choosing what to delete
+        self.flush()
+        total = self.disk_bytes()
+        target = int(self.max_bytes * 0.9)
+        rows = self.db.execute("SELECT key, size FROM results ORDER BY last_used")
+        doomed = []
+        for key, size in rows:
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        self.db.executemany("DELETE FROM results WHERE key = ?", doomed)
+        self.db.commit()
+
+        for (key,) in doomed:
+            self.memory.pop(key, None)
+        self.evictions += len(doomed)
+        self.bytes_estimate = total
+        self.puts_since_sync = 0
+
+    # ---------- counters ----------
+
+    def stats(self):
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "disk_bytes": self.disk_bytes(),
+        }
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+
+# ----------------------------------------------------
+# STEP 3: SHARED DEFAULT CACHE (OPT-IN)
+# ----------------------------------------------------
+
+_default_cache = None
+_default_cache_pid = None
+
+
+def get_default_cache():
+    """
+    Return the cache named by NLP_RESULT_CACHE,
+    or None when caching is not enabled
+    """
+    global _default_cache, _default_cache_pid
+    path = os.environ.get("NLP_RESULT_CACHE")
+    if not path:
+        return None
+
+    # A forked worker must not reuse its parent's SQLite connection,
+    # so every process opens its own
+    if _default_cache is None or _default_cache.path != path or _default_cache_pid != os.getpid():
+        _default_cache = ResultCache(path)
+        _default_cache_pid = os.getpid()
+        atexit.register(_flush_at_exit, _default_cache, _default_cache_pid)
+    return _default_cache
+
+
+def _flush_at_exit(cache, pid):
+    # Only in the process that opened the connection
+    if os.getpid() == pid:
+        try:
+            cache.flush()
+        except sqlite3.Error:
+            pass
+
+
+def cached(stage, version, payload, compute):
+    """
+    Run compute() through the default cache
+    (or directly, when caching is disabled)
+    """
+    cache = get_default_cache()
+    if cache is None:
+        return compute()
+    misses = cache.misses
+    value = cache.get_or_compute(stage, version, payload, compute)
+    instrumentation.count("cache_misses" if cache.misses > misses else "cache_hits", stage)
+    return value
@@ -6,6 +6,15 @@
 # 4. Evaluate model accuracy
 # 5. Display most informative words
 # ----------------------------------------------------
+#
+# USAGE:
+#   python sentiment.py                    (NLTK NaiveBayesClassifier)
+#   python sentiment.py --engine sparse    (same results, vectorized:
+#                                           see sparse_nb.py)
+#   python sentiment.py --token-cache movie_reviews_cache
+#                                          (load the reviews from the
+#                                           preprocessed token cache,
+#                                           see token_cache.py)
 
 # Import movie reviews dataset from NLTK
 # This dataset contains positive and negative movie reviews
@@ -20,6 +29,17 @@ from nltk.classify import NaiveBayesClassifier
 # Import accuracy function to evaluate the classifier
 from nltk.classify.util import accuracy
 
+# Import argparse to choose the engine from the command line
+import argparse
+
+parser = argparse.ArgumentParser(description="Naive Bayes sentiment classifier on movie reviews.")
+parser.add_argument("--engine", choices=["nltk", "sparse"], default="nltk",
+                    help="nltk: dict features + NaiveBayesClassifier, "
+                         "sparse: CSR matrix + NumPy (sparse_nb.py)")
+parser.add_argument("--token-cache", metavar="DIR",
+                    help="read the reviews from a cache built by token_cache.py")
+args = parser.parse_args()
+
 
 # ----------------------------------------------------
 # STEP 1: PREPARE THE DATASET
@@ -28,11 +48,18 @@ from nltk.classify.util import accuracy
 # Create a list of tuples:
 # (list of words in the review, review category)
 # category is either 'pos' (positive) or 'neg' (negative)
-documents = [
-    (list(movie_reviews.words(fileid)), category)
-    for category in movie_reviews.categories()
-    for fileid in movie_reviews.fileids(category)
-]
+if args.token_cache:
+    # Same documents, same order, but read from one memory-mapped
+    # array of token ids instead of 2000 files
+    from token_cache import TokenCache
+
+    documents = TokenCache(args.token_cache).documents()
+else:
+    documents = [
+        (list(movie_reviews.words(fileid)), category)
+        for category in movie_reviews.categories()
+        for fileid in movie_reviews.fileids(category)
+    ]
 
 # Shuffle the dataset to avoid bias
 # This ensures training and testing data are mixed randomly
@@ -55,21 +82,36 @@ def document_features(words):
 
 # Convert all documents into feature sets
 # Each item: (feature_dictionary, category)
-featuresets = [
-    (document_features(d), c)
-    for (d, c) in documents
-]
+if args.engine == "sparse":
+    # Sparse engine: every word gets an integer id and the
+    # documents become rows of ONE 0/1 matrix (CSR) instead
+    # of 2000 dictionaries (see sparse_nb.py)
+    from sparse_nb import SparseNaiveBayes, build_vocabulary, to_matrix
+
+    vocabulary = build_vocabulary(d for (d, c) in documents[:1500])
+    featuresets = (to_matrix((d for (d, c) in documents), vocabulary),
+                   [c for (d, c) in documents])
+else:
+    featuresets = [
+        (document_features(d), c)
+        for (d, c) in documents
+    ]
 
 
 # ----------------------------------------------------
 # STEP 3: SPLIT INTO TRAINING AND TEST SETS
 # ----------------------------------------------------
 
-# First 1500 reviews for training
-train_set = featuresets[:1500]
+if args.engine == "sparse":
+    X, labels = featuresets
+    train_set = (X[:1500], labels[:1500])
+    test_set = (X[1500:], labels[1500:])
+else:
+    # First 1500 reviews for training
+    train_set = featuresets[:1500]
 
-# Remaining reviews for testing
-test_set = featuresets[1500:]
+    # Remaining reviews for testing
+    test_set = featuresets[1500:]
 
 
 # ----------------------------------------------------
@@ -77,7 +119,10 @@ test_set = featuresets[1500:]
 # ----------------------------------------------------
 
 # Train the classifier using the training set
-classifier = NaiveBayesClassifier.train(train_set)
+if args.engine == "sparse":
+    classifier = SparseNaiveBayes("nltk").fit(*train_set, vocabulary)
+else:
+    classifier = NaiveBayesClassifier.train(train_set)
 
 
 # ----------------------------------------------------
@@ -85,7 +130,10 @@ classifier = NaiveBayesClassifier.train(train_set)
 # ----------------------------------------------------
 
 # Calculate and print classification accuracy
-print("Accuracy:", accuracy(classifier, test_set))
+if args.engine == "sparse":
+    print("Accuracy:", classifier.accuracy(*test_set))
+else:
+    print("Accuracy:", accuracy(classifier, test_set))
 
 
 # ----------------------------------------------------
@@ -0,0 +1,301 @@
+# ----------------------------------------------------
+# GOAL:
+# 1. Read a labeled corpus (movie_reviews, or our own review
+#    dumps) ONCE and store it as integer token ids
+# 2. Keep all tokens in ONE flat uint32 array on disk
+# 3. Load it back instantly with a memory map: every document
+#    is a zero-copy slice of that array
+# ----------------------------------------------------
+#
+# WHY:
+# sentiment.py rebuilds its documents on every run by calling
+# movie_reviews.words(fileid) for all 2000 files through NLTK's
+# corpus reader, and keeps every token as a Python string.
+#
+# FILE FORMAT (one directory):
+#   meta.json    version, number of documents / tokens, label names
+#   vocab.txt    one word per line, word id = line number
+#   tokens.u32   all token ids, document after document (uint32)
+#   offsets.u64  N + 1 positions: document i = tokens[offsets[i]:offsets[i+1]]
+#   labels.u16   label id of every document (index into meta["labels"])
+#   ids.txt      document id (file name) of every document
+#
+# meta.json is written LAST: a directory without it is an
+# unfinished build and is never loaded.
+#
+# USAGE:
+#   python token_cache.py build movie_reviews_cache
+#   python token_cache.py build reviews_cache --jsonl reviews.jsonl
+#   python token_cache.py bench movie_reviews_cache
+
+# argparse / json / os / time / tracemalloc: command line, files, benchmark
+import argparse
+import json
+import os
+import time
+import tracemalloc
+
+# array: growing typed arrays for the offsets and labels
+from array import array
+
+# NumPy: memory-mapped typed arrays
+import numpy as np
+
+FORMAT_VERSION = 1
+
+# Tokens are written to disk in blocks of this many ids
+FLUSH_EVERY = 1 << 20
+
+
+# ----------------------------------------------------
+# STEP 1: CORPUS READERS
+# ----------------------------------------------------
+# Each reader yields (doc_id, words, label)
+
+def movie_reviews_records():
+    """
+    The NLTK movie_reviews corpus, in the same order as sentiment.py
+    """
+    from nltk.corpus import movie_reviews
+
+    for category in movie_reviews.categories():
+        for fileid in movie_reviews.fileids(category):
+            yield fileid, movie_reviews.words(fileid), category
+
+
+def jsonl_records(path, text_field="text", label_field="label", id_field="id"):
+    """
+    Our own review dumps: one JSON object per line
+    {"id": ..., "text": ..., "label": ...}
+    The text is lowercased and split with word_tokenize
+    """
+    import nltk
+
+    with open(path, encoding="utf-8") as f:
+        for index, line in enumerate(f):
+            if line.strip():
+                record = json.loads(line)
+                words = nltk.word_tokenize(record[text_field].lower())
+                yield str(record.get(id_field, index)), words, str(record[label_field])
+
+
+# ----------------------------------------------------
+# STEP 2: BUILD THE CACHE (STREAMING)
+# ----------------------------------------------------
+
+def _replace(directory, name, write):
+    """
+    Write one file through a temporary name, then rename it
+    """
+    path = os.path.join(directory, name)
+    with open(path + ".tmp", "wb") as f:
+        write(f)
+    os.replace(path + ".tmp", path)
+
+
+def build_cache(records, directory):
+    """
+    Write records (doc_id, words, label) to `directory`;
+    only the vocabulary and one block of ids are kept in memory.
+    Returns the metadata dictionary
+    """
+    os.makedirs(directory, exist_ok=True)
+    meta_path = os.path.join(directory, "meta.json")
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    vocabulary = {}
+    label_ids = {}
+    offsets = array("Q", [0])
+    labels = array("H")
+    doc_ids = []
+    block = array("I")
+
+    tokens_tmp = os.path.join(directory, "tokens.u32.tmp")
+    with open(tokens_tmp, "wb") as tokens_file:
+        for doc_id, words, label in records:
+            for word in words:
+                word_id = vocabulary.get(word)
+                if word_id is None:
+                    # One word per line in vocab.txt
+                    if "\n" in word or "\r" in word:
+                        raise ValueError(f"token contains a line break: {word!r}")
+                    word_id = vocabulary[word] = len(vocabulary)
+                block.append(word_id)
+            if len(block) >= FLUSH_EVERY:
+                block.tofile(tokens_file)
+                block = array("I")
+
+            offsets.append(offsets[-1] + len(words))
+            labels.append(label_ids.setdefault(label, len(label_ids)))
+            doc_ids.append(doc_id)
+        block.tofile(tokens_file)
+    os.replace(tokens_tmp, os.path.join(directory, "tokens.u32"))
+
+    _replace(directory, "offsets.u64", offsets.tofile)
+    _replace(directory, "labels.u16", labels.tofile)
+    _replace(directory, "vocab.txt",
+             lambda f: f.write("".join(word + "\n" for word in vocabulary).encode("utf-8")))
+    _replace(directory, "ids.txt",
+             lambda f: f.write("".join(doc_id + "\n" for doc_id in doc_ids).encode("utf-8")))
+
+    meta = {
+        "version": FORMAT_VERSION,
+        "documents": len(labels),
+        "tokens": offsets[-1],
+        "vocabulary": len(vocabulary),
+        "labels": list(label_ids),
+    }
+    _replace(directory, "meta.json", lambda f: f.write(json.dumps(meta, indent=2).encode("utf-8")))
+    return meta
+
+
+# ----------------------------------------------------
+# STEP 3: LOAD THE CACHE (ZERO-COPY)
+# ----------------------------------------------------
+
+class TokenCache:
+    """
+    Read-only view of a built cache
+
+    cache.token_ids(i) -> uint32 slice of the memory map (no copy)
+    cache.words(i)     -> list of words (decoded on demand)
+    cache.label(i)     -> label name
+    """
+
+    def __init__(self, directory):
+        meta_path = os.path.join(directory, "meta.json")
+        if not os.path.exists(meta_path):
+            raise FileNotFoundError(f"{directory} is not a finished token cache (no meta.json)")
+        with open(meta_path, encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta["version"] != FORMAT_VERSION:
+            raise ValueError(f"{directory}: unsupported token cache version {self.meta['version']}")
+
+        self.directory = directory
+        self.label_names = self.meta["labels"]
+
+        def mapped(name, dtype):
+            # np.memmap cannot map an empty file
+            if os.path.getsize(os.path.join(directory, name)) == 0:
+                return np.zeros(0, dtype=dtype)
+            return np.memmap(os.path.join(directory, name), dtype=dtype, mode="r")
+
+        self.tokens = mapped("tokens.u32", np.uint32)
+        self.offsets = mapped("offsets.u64", np.uint64)
+        self.labels = mapped("labels.u16", np.uint16)
+
+        # Read only when a method needs them
+        self._vocab = None
+        self._doc_ids = None
+
+    def __len__(self):
+        return len(self.labels)
+
+    # ---------- per document ----------
+
+    def token_ids(self, i):
+        return self.tokens[int(self.offsets[i]):int(self.offsets[i + 1])]
+
+    def words(self, i):
+        vocab = self.vocab
+        return [vocab[word_id] for word_id in self.token_ids(i).tolist()]
+
+    def label(self, i):
+        return self.label_names[self.labels[i]]
+
+    # ---------- lazily loaded tables ----------
+
+    @property
+    def vocab(self):
+        """
+        List of words, indexed by word id
+        """
+        if self._vocab is None:
+            with open(os.path.join(self.directory, "vocab.txt"), encoding="utf-8") as f:
+                self._vocab = f.read().split("\n")[:-1]
+        return self._vocab
+
+    @property
+    def doc_ids(self):
+        if self._doc_ids is None:
+            with open(os.path.join(self.directory, "ids.txt"), encoding="utf-8") as f:
+                self._doc_ids = f.read().split("\n")[:-1]
+        return self._doc_ids
+
+    # ---------- whole corpus ----------
+
+    def documents(self):
+        """
+        [(list of words, label), ...]: the `documents` list of sentiment.py
+        """
+        return [(self.words(i), self.label(i)) for i in range(len(self))]
+
+    def matrix(self):
+        """
+        CSR document x word-id matrix with 1 where the word occurs
+        (for sparse_nb.py), built straight from the token ids
+        """
+        from scipy import sparse
+
+        counts = sparse.csr_matrix(
+            (np.ones(len(self.tokens), dtype=np.float32),
+             self.tokens.astype(np.int32),
+             self.offsets.astype(np.int64)),
+            shape=(len(self), self.meta["vocabulary"]),
+        )
+        counts.sum_duplicates()
+        counts.data[:] = 1
+        return counts
+
+
+# ----------------------------------------------------
+# STEP 4: BENCHMARK (CORPUS READER vs CACHE)
+# ----------------------------------------------------
+
+def measure(step):
+    """
+    Run step() and return (result, seconds, peak MB allocated)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = step()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def benchmark(directory):
+    _, seconds, peak = measure(lambda: [(list(words), label) for _, words, label in movie_reviews_records()])
+    print(f"corpus reader, list of words   {seconds:7.2f}s  {peak:8.1f} MB")
+
+    cache, seconds, peak = measure(lambda: TokenCache(directory))
+    print(f"token cache, open (memory map) {seconds:7.2f}s  {peak:8.1f} MB")
+    _, seconds, peak = measure(lambda: [cache.token_ids(i) for i in range(len(cache))])
+    print(f"token cache, id views          {seconds:7.2f}s  {peak:8.1f} MB")
+    _, seconds, peak = measure(cache.documents)
+    print(f"token cache, list of words     {seconds:7.2f}s  {peak:8.1f} MB")
+    _, seconds, peak = measure(cache.matrix)
+    print(f"token cache, CSR matrix        {seconds:7.2f}s  {peak:8.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memory-mapped token id cache for labeled corpora.")
+    parser.add_argument("command", choices=["build", "bench"])
+    parser.add_argument("directory", help="cache directory")
+    parser.add_argument("--jsonl", help="build from a JSONL review dump instead of movie_reviews")
+    parser.add_argument("--text-field", default="text")
+    parser.add_argument("--label-field", default="label")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        if args.jsonl:
+            records = jsonl_records(args.jsonl, args.text_field, args.label_field)
+        else:
+            records = movie_reviews_records()
+        meta = build_cache(records, args.directory)
+        print(f"Wrote {args.directory}: {meta['documents']} documents, "
+              f"{meta['tokens']} tokens, {meta['vocabulary']} words, labels {meta['labels']}")
+    else:
+        benchmark(args.directory)
@@ -7,6 +7,17 @@
 # 5. Count word frequencies
 # 6. Display the top 20 most frequent words
 # ----------------------------------------------------
+#
+# USAGE:
+#   python tokenization.py               (analyze the example text below)
+#   python tokenization.py corpus.txt    (STREAMING MODE for large files)
+#   python tokenization.py corpus.txt --approx 100000
+#                                        (fixed-memory APPROXIMATE counts,
+#                                         see heavy_hitters.py)
+#
+# In streaming mode the file is memory-mapped and processed in
+# chunks cut on line boundaries, so peak memory depends on the
+# vocabulary size (the Counter), not on the size of the file.
 
 # Import the Natural Language Toolkit (NLTK) library
 # NLTK provides tools for text processing and NLP tasks
@@ -14,7 +25,8 @@ import nltk
 
 # Import the word_tokenize function
 # This function splits text into individual words
-from nltk.tokenize import word_tokenize
+# (NLTK's exact tokenizer, or the fast one: see fast_tokenizer.py)
+from fast_tokenizer import MODES, get_mode, set_mode, word_tokenize
 
 # Import stopwords list from NLTK
 # Stopwords are common words that usually carry little meaning
@@ -27,6 +39,18 @@ from collections import Counter
 # Used here to access punctuation characters like . , ! ?
 import string
 
+# Import mmap and argparse
+# mmap lets us read huge files without loading them into memory
+# argparse reads the command line options
+import mmap
+import argparse
+
+# Import the fixed-memory approximate counter
+from heavy_hitters import SpaceSaving
+
+# Import the optional per-stage timing (see instrumentation.py)
+from instrumentation import stage
+
 
 # ----------------------------------------------------
 # INPUT TEXT
@@ -45,47 +69,134 @@ to ensure safe deployment of advanced AI systems.
 # STEP 1: TOKENIZATION
 # ----------------------------------------------------
 
-# Convert the entire text to lowercase
-# This ensures words like "AI" and "ai" are treated the same
-text = text.lower()
+def tokenize(text):
+    """
+    Lowercase the text and split it into words (tokens)
+    """
 
-# Split the text into words (tokens)
-# Example output: ["artificial", "intelligence", "continues", ...]
-tokens = word_tokenize(text)
+    # Convert the entire text to lowercase
+    # This ensures words like "AI" and "ai" are treated the same
+    text = text.lower()
+
+    # Split the text into words (tokens)
+    # Example output: ["artificial", "intelligence", "continues", ...]
+    with stage("tokenize") as s:
+        tokens = word_tokenize(text)
+        s.tokens = len(tokens)
+    return tokens
 
 
 # ----------------------------------------------------
 # STEP 2: REMOVE STOPWORDS AND PUNCTUATION
 # ----------------------------------------------------
 
-# Load English stopwords from NLTK
+# Load English stopwords from NLTK (only once, when first needed)
 # Examples: "the", "is", "are", "in", "to"
-stop_words = set(stopwords.words('english'))
+_stop_words = None
+
 
-# Create a cleaned list of words
-# Conditions:
-# - word is NOT a stopword
-# - word is NOT punctuation (.,!? etc.)
-clean_text = [
-    token for token in tokens
-    if token not in stop_words
-    and token not in string.punctuation
-]
+def get_stop_words():
+    global _stop_words
+    if _stop_words is None:
+        _stop_words = set(stopwords.words('english'))
+    return _stop_words
+
+
+def clean_tokens(tokens):
+    """
+    Yield only the useful tokens (a generator, no list is built)
+    Conditions:
+    - word is NOT a stopword
+    - word is NOT punctuation (.,!? etc.)
+    """
+    stop_words = get_stop_words()
+    for token in tokens:
+        if token not in stop_words and token not in string.punctuation:
+            yield token
 
 
 # ----------------------------------------------------
 # STEP 3: FREQUENCY COUNT
 # ----------------------------------------------------
 
-# Count how many times each word appears
-# Counter creates a dictionary-like object
-freq = Counter(clean_text)
+def count_words(texts, freq=None):
+    """
+    Update a Counter with the clean tokens of every text
+    (texts can be a list or a generator of chunks)
+    """
+    if freq is None:
+        freq = Counter()
+    for chunk in texts:
+        tokens = tokenize(chunk)
+        with stage("filter_count", tokens=len(tokens)):
+            freq.update(clean_tokens(tokens))
+    return freq
+
+
+# ----------------------------------------------------
+# STREAMING MODE: READ A FILE IN CHUNKS
+# ----------------------------------------------------
+
+def iter_chunks(path, chunk_bytes=8 * 1024 * 1024, start=0, stop=None):
+    """
+    Yield the file as text chunks of about chunk_bytes each
+
+    Every chunk ends on a line boundary, so no word
+    (and no line) is ever split between two chunks
+
+    start / stop limit reading to one byte range of the file
+    (they should also be line boundaries, see parallel_word_freq.py)
+    """
+    with open(path, "rb") as f:
+
+        # mmap cannot map an empty file
+        if f.seek(0, 2) == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            size = len(data) if stop is None else min(stop, len(data))
+            while start < size:
+                end = min(start + chunk_bytes, size)
+
+                # Move the cut back to the last newline in the chunk
+                # (or forward to the next one for a very long line)
+                if end < size:
+                    newline = data.rfind(b"\n", start, end)
+                    if newline == -1:
+                        newline = data.find(b"\n", end, size)
+                    end = size if newline == -1 else newline + 1
+
+                yield data[start:end].decode("utf-8", errors="replace")
+                start = end
 
 
 # ----------------------------------------------------
 # STEP 4: DISPLAY RESULTS
 # ----------------------------------------------------
 
-# Print the top 20 most frequent words
-# Output format: [('word', count), ('word', count), ...]
-print(freq.most_common(20))
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Top 20 words without stopwords.")
+    parser.add_argument("path", nargs="?", help="text file to stream (default: example text)")
+    parser.add_argument("--approx", type=int, metavar="CAPACITY",
+                        help="approximate counts with at most CAPACITY words in memory")
+    parser.add_argument("--tokenizer", choices=MODES, default=get_mode(),
+                        help="exact = nltk.word_tokenize, fast = fast_tokenizer.py (default: $NLP_TOKENIZER or exact)")
+    args = parser.parse_args()
+    set_mode(args.tokenizer)
+
+    # Count how many times each word appears
+    # Counter creates a dictionary-like object;
+    # SpaceSaving has the same update / most_common methods
+    # but never keeps more than CAPACITY words
+    freq = SpaceSaving(args.approx) if args.approx else Counter()
+
+    if args.path:
+        # Streaming mode: count every chunk of the file
+        count_words(iter_chunks(args.path), freq)
+    else:
+        count_words([text], freq)
+
+    # Print the top 20 most frequent words
+    # Output format: [('word', count), ('word', count), ...]
+    print(freq.most_common(20))
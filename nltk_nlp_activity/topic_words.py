@@ -6,72 +6,136 @@
 # 4. Count how often each noun appears
 # 5. Display the most frequent nouns
 # ----------------------------------------------------
-
-# Import the NLTK library
-# Used for tokenization and POS tagging
-import nltk
+#
+# USAGE:
+#   python topic_words.py                    (analyze the example text below)
+#   python topic_words.py articles.txt       (one text per line, streamed)
+#   python topic_words.py articles.txt --workers 4
+#                                            (batched tagging on 4 processes)
+#   python topic_words.py articles.txt --approx 100000
+#                                            (fixed-memory APPROXIMATE counts,
+#                                             see heavy_hitters.py)
 
 # Import Counter for frequency analysis
 # Counter counts how many times each word appears
 from collections import Counter
 
+# Import argparse to read the command line options
+import argparse
 
-# ----------------------------------------------------
-# STEP 1: INPUT TEXT
-# ----------------------------------------------------
-
-# Sample text where we want to extract topic words
-text = "Artificial intelligence and machine learning are transforming industries worldwide."
-
-
-# ----------------------------------------------------
-# STEP 2: TOKENIZATION
-# ----------------------------------------------------
-
-# Split the text into individual tokens (words)
-# Example output:
-# ['Artificial', 'intelligence', 'and', 'machine', 'learning', ...]
-tokens = nltk.word_tokenize(text)
-
-
-# ----------------------------------------------------
-# STEP 3: PART-OF-SPEECH TAGGING
-# ----------------------------------------------------
+# Import the shared tagging stage (see batch_tagging.py)
+# It loads the POS tagger once instead of on every pos_tag call
+from batch_tagging import flatten, tag_documents
 
-# Assign POS tags to each token
-# Example:
-# ('Artificial', 'JJ'), ('intelligence', 'NN')
-pos_tags = nltk.pos_tag(tokens)
+# Import the Document (see document.py): tokens and tags are
+# computed once and shared with the lemma and entity scripts
+from document import Document
 
+# Import the fixed-memory approximate counter
+from heavy_hitters import SpaceSaving
 
-# ----------------------------------------------------
-# STEP 4: SELECT NOUNS ONLY
-# ----------------------------------------------------
+# Import the optional per-stage timing (see instrumentation.py)
+from instrumentation import stage
 
-# Keep only words whose POS tag starts with 'NN'
-# NN   → noun
-# NNS  → plural noun
-# NNP  → proper noun
-# NNPS → plural proper noun
-nouns = [
-    word for word, tag in pos_tags
-    if tag.startswith('NN')
-]
+# Import the tokenizer switch (exact or fast, see fast_tokenizer.py)
+from fast_tokenizer import MODES, get_mode, set_mode
 
 
 # ----------------------------------------------------
-# STEP 5: FREQUENCY ANALYSIS
+# STEP 1: INPUT TEXT
 # ----------------------------------------------------
 
-# Count how often each noun appears
-freq = Counter(nouns)
-
+# Sample text where we want to extract topic words
+text = "Artificial intelligence and machine learning are transforming industries worldwide."
 
-# ----------------------------------------------------
-# STEP 6: OUTPUT
-# ----------------------------------------------------
 
-# Print the 10 most common nouns (topic candidates)
-# Example output:
-# [('intelligence', 1), ('learning', 1), ('industries', 1)]
-print(freq.most_common(10))
+def select_nouns(pos_tags):
+    """
+    Keep only words whose POS tag starts with 'NN' (STEP 4)
+    NN   → noun
+    NNS  → plural noun
+    NNP  → proper noun
+    NNPS → plural proper noun
+    """
+    return [
+        word for word, tag in pos_tags
+        if tag.startswith('NN')
+    ]
+
+
+def find_nouns(text):
+    """
+    Return the nouns of one text (STEPS 2-4)
+    (text can also be a Document whose tags are already computed)
+    """
+    document = text if isinstance(text, Document) else Document(text)
+
+    # ----------------------------------------------------
+    # STEP 2: TOKENIZATION
+    # ----------------------------------------------------
+
+    # Split the text into individual tokens (words)
+    # (computed the first time document.tokens is read)
+    # Example output:
+    # ['Artificial', 'intelligence', 'and', 'machine', 'learning', ...]
+    tokens = document.tokens
+
+    # ----------------------------------------------------
+    # STEP 3: PART-OF-SPEECH TAGGING
+    # ----------------------------------------------------
+
+    # Assign POS tags to each token
+    # Example:
+    # ('Artificial', 'JJ'), ('intelligence', 'NN')
+    pos_tags = document.pos_tags
+
+    # ----------------------------------------------------
+    # STEP 4: SELECT NOUNS ONLY
+    # ----------------------------------------------------
+
+    return select_nouns(pos_tags)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Most frequent nouns (topic candidates).")
+    parser.add_argument("path", nargs="?", help="file with one text per line (default: example text)")
+    parser.add_argument("--approx", type=int, metavar="CAPACITY",
+                        help="approximate counts with at most CAPACITY nouns in memory")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="tag the file in batches on this many processes")
+    parser.add_argument("--tokenizer", choices=MODES, default=get_mode(),
+                        help="exact = nltk.word_tokenize, fast = fast_tokenizer.py (default: $NLP_TOKENIZER or exact)")
+    args = parser.parse_args()
+    set_mode(args.tokenizer)
+
+    # ----------------------------------------------------
+    # STEP 5: FREQUENCY ANALYSIS
+    # ----------------------------------------------------
+
+    # Count how often each noun appears
+    # (SpaceSaving has the same update / most_common methods
+    # as Counter but never keeps more than CAPACITY nouns)
+    freq = SpaceSaving(args.approx) if args.approx else Counter()
+
+    if args.path:
+        # Lines are split into sentences and tagged in batches
+        # (one tagger per worker, results come back in order)
+        with open(args.path, encoding="utf-8") as f:
+            for tagged in tag_documents(f, args.workers):
+                pos_tags = flatten(tagged)
+                with stage("count_nouns", tokens=len(pos_tags)):
+                    freq.update(select_nouns(pos_tags))
+    else:
+        nouns = find_nouns(text)
+        with stage("count_nouns", tokens=len(nouns)):
+            freq.update(nouns)
+
+    # ----------------------------------------------------
+    # STEP 6: OUTPUT
+    # ----------------------------------------------------
+
+    # Print the 10 most common nouns (topic candidates)
+    # Example output:
+    # [('intelligence', 1), ('learning', 1), ('industries', 1)]
+    print(freq.most_common(10))
@@ -0,0 +1,274 @@
+# ============================================================
+# BULK SENTIMENT SCORING WITH A PROCESS POOL (VADER)
+# ============================================================
+# sentiment_analysis.py scores ONE sentence at a time.
+# This program scores a whole FILE (or stdin) of texts by
+# splitting it into chunks and sending the chunks to a pool
+# of worker processes.
+#
+# MAIN CONCEPTS USED:
+# - Streaming input (JSONL / CSV / plain text)
+# - Process pool (one analyzer per worker, loaded once)
+# - Chunking (many texts per task to reduce overhead)
+# - Ordered output (rows come back in input order)
+#
+# EXAMPLES:
+#   python bulk_sentiment.py tweets.jsonl -o scores.jsonl
+#   python bulk_sentiment.py reviews.csv --text-field review --workers 8
+#   cat texts.txt | python bulk_sentiment.py - --format txt
+# ============================================================
+
+
+# ------------------------------------------------------------
+# STEP 0: IMPORT REQUIRED LIBRARIES
+# ------------------------------------------------------------
+
+# argparse: command line options
+# csv / json: input and output formats
+# os / sys / time: cpu count, stdin/stdout and timing
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+# collections.deque:
+# Keeps the chunks that are currently being scored, in order
+from collections import deque
+
+# multiprocessing:
+# Runs several Python processes so every CPU core is used
+from multiprocessing import Pool
+
+# get_analyzer / polarity_scores / label_from_compound come from the
+# single-sentence script so both programs score texts in exactly the same way
+# (including the optional result cache)
+from sentiment_analysis import get_analyzer, label_from_compound, polarity_scores
+
+# get_batch_scorer: scores a whole chunk at once with NumPy (see vader_batch.py)
+from vader_batch import get_batch_scorer
+
+
+# ------------------------------------------------------------
+# STEP 1: READ THE INPUT RECORDS
+# ------------------------------------------------------------
+# Every record becomes a pair: (id, text)
+#
+# Supported formats:
+# - jsonl: one JSON object per line, e.g. {"id": 7, "text": "..."}
+# - csv:   a header row, then one text per row
+# - tsv:   the same, separated by tabs
+# - txt:   one text per line (the line number is used as id)
+
+FORMATS = ("jsonl", "csv", "tsv", "txt")
+
+
+def detect_format(path):
+    """
+    Guess the input format from the file extension
+    (stdin and unknown extensions are treated as plain text)
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    if extension == ".csv":
+        return "csv"
+    if extension == ".tsv":
+        return "tsv"
+    return "txt"
+
+
+def read_records(stream, fmt, id_field="id", text_field="text"):
+    """
+    Yield (id, text) pairs one at a time,
+    so the whole file is never loaded into memory
+    """
+    if fmt == "jsonl":
+        for index, line in enumerate(stream):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield record.get(id_field, index), record[text_field]
+
+    elif fmt in ("csv", "tsv"):
+        delimiter = "\t" if fmt == "tsv" else ","
+        for index, row in enumerate(csv.DictReader(stream, delimiter=delimiter)):
+            yield row.get(id_field, index), row[text_field]
+
+    else:
+        for index, line in enumerate(stream):
+            yield index, line.rstrip("\n")
+
+
+def chunked(records, chunk_size):
+    """
+    Group records into lists of chunk_size items
+    (one list = one task for a worker)
+    """
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ------------------------------------------------------------
+# STEP 2: WORKER FUNCTIONS
+# ------------------------------------------------------------
+
+def init_worker(vectorized=False):
+    """
+    Runs ONCE when each worker process starts:
+    builds the analyzer (loads the lexicon) a single time
+    """
+    if vectorized:
+        get_batch_scorer()
+    else:
+        get_analyzer()
+
+
+def score_chunk(chunk, vectorized=False):
+    """
+    Score a list of (id, text) pairs and return one row per text:
+    {id, neg, neu, pos, compound, label}
+    """
+    if vectorized:
+        # The whole chunk in one call (same scores, no result cache)
+        all_scores = get_batch_scorer().polarity_scores([text for _, text in chunk])
+    else:
+        all_scores = (polarity_scores(text) for _, text in chunk)
+
+    rows = []
+    for (doc_id, _), scores in zip(chunk, all_scores):
+        rows.append({
+            "id": doc_id,
+            "neg": scores["neg"],
+            "neu": scores["neu"],
+            "pos": scores["pos"],
+            "compound": scores["compound"],
+            "label": label_from_compound(scores["compound"]),
+        })
+    return rows
+
+
+# ------------------------------------------------------------
+# STEP 3: SCORE ALL CHUNKS (IN INPUT ORDER)
+# ------------------------------------------------------------
+
+def score_records(records, workers, chunk_size, vectorized=False):
+    """
+    Yield scored rows in the same order as the input records
+
+    Only a few chunks per worker are "in flight" at any time,
+    so memory stays small even for millions of texts
+    """
+    chunks = chunked(records, chunk_size)
+
+    # A single worker does not need a pool at all
+    if workers <= 1:
+        init_worker(vectorized)
+        for chunk in chunks:
+            yield from score_chunk(chunk, vectorized)
+        return
+
+    with Pool(processes=workers, initializer=init_worker, initargs=(vectorized,)) as pool:
+        pending = deque()
+        max_pending = workers * 2
+
+        for chunk in chunks:
+            pending.append(pool.apply_async(score_chunk, (chunk, vectorized)))
+
+            # Wait for the OLDEST chunk first -> output keeps input order
+            if len(pending) >= max_pending:
+                yield from pending.popleft().get()
+
+        while pending:
+            yield from pending.popleft().get()
+
+
+# ------------------------------------------------------------
+# STEP 4: WRITE THE OUTPUT ROWS
+# ------------------------------------------------------------
+
+OUTPUT_FIELDS = ["id", "neg", "neu", "pos", "compound", "label"]
+
+
+def write_rows(rows, stream, fmt):
+    """
+    Write rows as JSONL (default) or CSV and return how many were written
+    """
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=OUTPUT_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            stream.write(json.dumps(row) + "\n")
+            count += 1
+    return count
+
+
+# ------------------------------------------------------------
+# STEP 5: COMMAND LINE PROGRAM
+# ------------------------------------------------------------
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Score many texts with VADER using a pool of worker processes."
+    )
+    parser.add_argument("input", help="input file, or '-' for stdin")
+    parser.add_argument("-o", "--output", default="-",
+                        help="output file, or '-' for stdout (default)")
+    parser.add_argument("--format", choices=FORMATS,
+                        help="input format (default: guessed from the file extension)")
+    parser.add_argument("--output-format", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("--id-field", default="id")
+    parser.add_argument("--text-field", default="text")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=500,
+                        help="texts sent to a worker per task (default: 500)")
+    parser.add_argument("--vectorized", action="store_true",
+                        help="score each chunk with the NumPy batch scorer (vader_batch.py); "
+                             "same scores, but bypasses the result cache")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    fmt = args.format or ("txt" if args.input == "-" else detect_format(args.input))
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8", newline="")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+
+    start = time.perf_counter()
+    try:
+        records = read_records(source, fmt, args.id_field, args.text_field)
+        rows = score_records(records, args.workers, args.chunk_size, args.vectorized)
+        total = write_rows(rows, target, args.output_format)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    elapsed = time.perf_counter() - start
+
+    # Throughput report goes to stderr so it never mixes with the output rows
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(
+        f"Scored {total} docs in {elapsed:.2f}s "
+        f"({rate:,.0f} docs/sec, {args.workers} workers, chunk size {args.chunk_size})",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -16,8 +16,14 @@
 # STEP 0: IMPORT REQUIRED LIBRARIES
 # ------------------------------------------------------------
 
+# os / sys:
+# Used to check whether the precompiled lexicon exists
+# and to find the shared result cache in ../nltk_nlp_activity
+import os
+import sys
+
 # nltk:
-# Natural Language Toolkit – used for text processing
+# Only its version is used here (part of the cache version)
 import nltk
 
 # SentimentIntensityAnalyzer:
@@ -26,18 +32,61 @@ from nltk.sentiment import SentimentIntensityAnalyzer
 
 
 # ------------------------------------------------------------
-# STEP 1: DOWNLOAD REQUIRED LEXICON
+# STEP 1: LOAD THE LEXICON (OFFLINE)
 # ------------------------------------------------------------
 # VADER uses a predefined sentiment dictionary (lexicon)
-# This download is required only ONCE per environment
-nltk.download('vader_lexicon')
+#
+# The lexicon is NOT downloaded at run time.
+# Build the precompiled artifact once (e.g. when packaging):
+#   python vader_compiled.py build
+# and it is loaded from vader_lexicon.pickle with a single unpickle.
+# Without the artifact, the lexicon already installed in
+# nltk_data is used instead.
+from vader_compiled import ARTIFACT_PATH, lexicon_hash, load_analyzer
+
+# Optional result cache shared with the nltk_nlp_activity scripts
+# (enabled by setting NLP_RESULT_CACHE=/path/to/cache.sqlite)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nltk_nlp_activity"))
+from result_cache import cached
 
 
 # ------------------------------------------------------------
 # STEP 2: CREATE SENTIMENT ANALYZER OBJECT
 # ------------------------------------------------------------
 # This object will calculate sentiment scores
-sia = SentimentIntensityAnalyzer()
+#
+# It is created on first use and then reused, so every
+# process (including each bulk worker) loads the lexicon once
+sia = None
+
+# Result cache version: NLTK version + a hash of the lexicon
+# contents, so a lexicon rebuilt with edited valences (even with
+# the same number of words) starts a fresh cache
+cache_version = None
+
+
+def get_analyzer():
+    """
+    Return the shared SentimentIntensityAnalyzer,
+    creating it the first time it is needed
+    """
+    global sia, cache_version
+    if sia is None:
+        if os.path.exists(ARTIFACT_PATH):
+            sia = load_analyzer(ARTIFACT_PATH)
+        else:
+            sia = SentimentIntensityAnalyzer()
+        cache_version = f"{nltk.__version__}:{lexicon_hash(sia.lexicon)[:16]}"
+    return sia
+
+
+def polarity_scores(text):
+    """
+    Return VADER's {neg, neu, pos, compound} scores for text,
+    looked up in the result cache when the same text was seen before
+    """
+    analyzer = get_analyzer()
+    return cached("vader", cache_version, text, lambda: analyzer.polarity_scores(text))
 
 
 # ------------------------------------------------------------
@@ -51,6 +100,25 @@ sentence = ["My name is Ali."]
 # ------------------------------------------------------------
 # STEP 4: DEFINE SENTIMENT ANALYSIS FUNCTION
 # ------------------------------------------------------------
+def label_from_compound(score):
+    """
+    This function converts a compound score
+    into a sentiment label:
+    Positive, Negative, or Neutral
+    """
+
+    # Compound score interpretation (VADER standard):
+    # score >=  0.05  → Positive
+    # score <= -0.05  → Negative
+    # otherwise       → Neutral
+    if score >= 0.05:
+        return "Positive"
+    elif score <= -0.05:
+        return "Negative"
+    else:
+        return "Neutral"
+
+
 def sentiment_analyzer_scores(text):
     """
     This function takes a sentence as input
@@ -65,27 +133,20 @@ def sentiment_analyzer_scores(text):
     #   'pos': positive score,
     #   'compound': final combined score
     # }
-    score = sia.polarity_scores(text)['compound']
+    score = polarity_scores(text)['compound']
 
-    # Compound score interpretation (VADER standard):
-    # score >=  0.05  → Positive
-    # score <= -0.05  → Negative
-    # otherwise       → Neutral
-    if score >= 0.05:
-        return "Positive"
-    elif score <= -0.05:
-        return "Negative"
-    else:
-        return "Neutral"
+    return label_from_compound(score)
 
 
 # ------------------------------------------------------------
 # STEP 5: CALL FUNCTION AND DISPLAY RESULT
 # ------------------------------------------------------------
 
-# Analyze the first sentence in the list
-result = sentiment_analyzer_scores(sentence[0])
+if __name__ == "__main__":
+
+    # Analyze the first sentence in the list
+    result = sentiment_analyzer_scores(sentence[0])
 
-# Print the sentiment result
-print("Sentence:", sentence[0])
-print("Predicted Sentiment:", result)
+    # Print the sentiment result
+    print("Sentence:", sentence[0])
+    print("Predicted Sentiment:", result)
@@ -0,0 +1,485 @@
+# ============================================================
+# VECTORIZED BATCH VADER SCORER
+# ============================================================
+# SentimentIntensityAnalyzer.polarity_scores scores ONE text
+# with Python loops over its words: lexicon lookup, booster
+# and negation windows, "but" handling, ALL CAPS emphasis.
+#
+# This program scores a whole BATCH of texts at once:
+# 1. every distinct word gets an integer id and its properties
+#    (valence, booster, negation, ...) are stored in NumPy arrays
+#    the first time it is seen
+# 2. the words of all texts become ONE array of ids
+# 3. the VADER rules are applied to all words together with
+#    array operations (the 3-word window = shifted arrays)
+# 4. neg / neu / pos / compound are computed for all texts at once
+#
+# The rules are the same as in nltk.sentiment.vader (NLTK 3.9+),
+# in the same order, so the scores match polarity_scores; the
+# rare idioms ("the bomb", "cut the mustard") are scored by
+# VADER itself.
+#
+# EXAMPLES:
+#   python vader_batch.py check                       (parity with polarity_scores)
+#   python vader_batch.py check --input reviews.txt
+#   python vader_batch.py bench --input reviews.txt   (texts/sec, single core)
+# ============================================================
+
+
+# ------------------------------------------------------------
+# STEP 0: IMPORT REQUIRED LIBRARIES
+# ------------------------------------------------------------
+
+import argparse
+import random
+import string
+import time
+
+# SimpleNamespace: stands in for VADER's SentiText (words + caps flag)
+from types import SimpleNamespace
+
+# numpy: the arrays that replace the per-word loops
+import numpy as np
+
+# get_analyzer: the same lexicon and tables as sentiment_analysis.py
+# (the compiled artifact when it exists, see vader_compiled.py)
+from sentiment_analysis import get_analyzer
+
+
+# ------------------------------------------------------------
+# STEP 1: THE SCORER (WORD PROPERTIES AS ARRAYS)
+# ------------------------------------------------------------
+
+# One array per word property, indexed by word id
+WORD_FIELDS = {
+    "valence": np.float64,    # lexicon valence of the lowercased word (0 if absent)
+    "in_lexicon": bool,
+    "upper": bool,            # word.isupper()
+    "booster": np.float64,    # BOOSTER_DICT value (0 if not a booster)
+    "is_booster": bool,
+    "negated": bool,          # negation word, or contains "n't"
+    "least": bool,
+    "at_very": bool,          # "at" / "very" (they cancel "least")
+    "kind": bool,
+    "of": bool,
+    "but": bool,
+    "never": bool,            # exactly "never" (case-sensitive in VADER)
+    "so_this": bool,          # exactly "so" / "this"
+}
+
+
+class BatchScorer:
+    """
+    Scores lists of texts with VADER's rules, vectorized over all words
+    """
+
+    def __init__(self, analyzer=None):
+        self.analyzer = analyzer or get_analyzer()
+        constants = self.analyzer.constants
+        self.constants = constants
+
+        # Punctuation that VADER strips from the start / end of a word
+        self.punc_list = list(constants.PUNC_LIST)
+        self.punc_chars = set("".join(self.punc_list))
+        self.remove_punctuation = constants.REGEX_REMOVE_PUNCTUATION
+
+        self.punc_set = set(self.punc_list)
+
+        # Multi-word idioms and boosters ("the bomb", "kind of"), as word lists
+        self.phrases = [phrase.split(" ") for phrase in
+                        list(constants.SPECIAL_CASE_IDIOMS) + list(constants.BOOSTER_DICT) if " " in phrase]
+
+        self.vocabulary = {}
+        self.arrays = {name: np.zeros(0, dtype=dtype) for name, dtype in WORD_FIELDS.items()}
+
+    def word_properties(self, word):
+        lower = word.lower()
+        constants = self.constants
+        return (
+            self.analyzer.lexicon.get(lower, 0.0),
+            lower in self.analyzer.lexicon,
+            word.isupper(),
+            constants.BOOSTER_DICT.get(lower, 0.0),
+            lower in constants.BOOSTER_DICT,
+            lower in constants.NEGATE or "n't" in lower,
+            lower == "least",
+            lower in ("at", "very"),
+            lower == "kind",
+            lower == "of",
+            lower == "but",
+            word == "never",
+            word in ("so", "this"),
+        )
+
+    def add_words(self, new_words):
+        """
+        Give new words an id and append their properties to the arrays
+        """
+        columns = list(zip(*(self.word_properties(word) for word in new_words)))
+        for (name, dtype), column in zip(WORD_FIELDS.items(), columns):
+            self.arrays[name] = np.concatenate([self.arrays[name], np.array(column, dtype=dtype)])
+        for word in new_words:
+            self.vocabulary[word] = len(self.vocabulary)
+
+    # ---------- tokenization (same words as VADER's SentiText) ----------
+
+    def split_words(self, text):
+        """
+        Whitespace tokens longer than one character, with one leading or
+        trailing punctuation mark removed when the rest is a plain word
+        """
+        words = [word for word in text.split() if len(word) > 1]
+        punc_chars = self.punc_chars
+        if not any(word[0] in punc_chars or word[-1] in punc_chars for word in words):
+            return words
+
+        # A mark is removed only when the rest is a word of the text without punctuation
+        plain = {word for word in self.remove_punctuation.sub("", text).split() if len(word) > 1}
+        for i, word in enumerate(words):
+            if word[-1] in punc_chars:
+                rest = word.rstrip(string.punctuation)
+                if word[len(rest):] in self.punc_set and rest in plain:
+                    words[i] = rest
+                    continue
+            if word[0] in punc_chars:
+                rest = word.lstrip(string.punctuation)
+                if word[:len(word) - len(rest)] in self.punc_set and rest in plain:
+                    words[i] = rest
+        return words
+
+    # ---------- the VADER rules, on arrays ----------
+
+    def score_arrays(self, texts):
+        """
+        Unrounded scores for all texts: {"neg": array, "neu": ..., "pos": ..., "compound": ...}
+        """
+        constants = self.constants
+        C_INCR, N_SCALAR = constants.C_INCR, constants.N_SCALAR
+
+        # All words of the batch in one list, plus where each text starts
+        text_words = [self.split_words(text) for text in texts]
+        lengths = np.array([len(words) for words in text_words], dtype=np.int64)
+        tokens = [word for words in text_words for word in words]
+        new_words = list(dict.fromkeys(word for word in tokens if word not in self.vocabulary))
+        if new_words:
+            self.add_words(new_words)
+
+        n_texts = len(texts)
+        ids = np.array([self.vocabulary[word] for word in tokens], dtype=np.int64)
+        text_of = np.repeat(np.arange(n_texts), lengths)
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]) if n_texts else np.zeros(0, dtype=np.int64)
+        position = np.arange(len(ids))
+        local = position - starts[text_of] if len(ids) else position
+        text_length = lengths[text_of]
+
+        def word(field, offset=0):
+            # Property of the word `offset` places away (clipped at the batch edges;
+            # the callers only use it where `local` says the word exists)
+            if offset == 0:
+                return self.arrays[field][ids]
+            shifted = np.clip(position + offset, 0, max(len(ids) - 1, 0))
+            return self.arrays[field][ids[shifted]]
+
+        # ALL CAPS counts only when some, but not all, words are capitalized
+        upper_count = np.bincount(text_of, word("upper"), minlength=n_texts)
+        cap_diff = ((upper_count > 0) & (upper_count < lengths))[text_of]
+
+        # Valence of the word itself (+ ALL CAPS emphasis)
+        in_lexicon = word("in_lexicon")
+        valence = word("valence")
+        shout = word("upper") & cap_diff
+        valence = np.where(shout, np.where(valence > 0, valence + C_INCR, valence - C_INCR), valence)
+
+        # The 3 preceding words: boosters / dampeners and negations
+        for k, damp in ((0, 1.0), (1, 0.95), (2, 0.9)):
+            before = -(k + 1)
+            active = (local > k) & ~word("in_lexicon", before)
+
+            scalar = word("booster", before)
+            scalar = np.where(valence < 0, -scalar, scalar)
+            booster_shout = word("is_booster", before) & word("upper", before) & cap_diff
+            scalar = np.where(booster_shout, np.where(valence > 0, scalar + C_INCR, scalar - C_INCR), scalar)
+            if k > 0:
+                scalar = scalar * damp
+            updated = valence + scalar
+
+            negated = word("negated", before)
+            if k == 0:
+                updated = np.where(negated, updated * N_SCALAR, updated)
+            elif k == 1:
+                never_so = word("never", -2) & word("so_this", -1)
+                updated = np.where(never_so, updated * 1.5, np.where(negated, updated * N_SCALAR, updated))
+            else:
+                never_so = (word("never", -3) & word("so_this", -2)) | word("so_this", -1)
+                updated = np.where(never_so, updated * 1.25, np.where(negated, updated * N_SCALAR, updated))
+            valence = np.where(active, updated, valence)
+
+        # "least" right before the word negates it (but not "at least" / "very least")
+        least = (local > 0) & ~word("in_lexicon", -1) & word("least", -1)
+        least &= (local == 1) | ~word("at_very", -2)
+        valence = np.where(least, valence * N_SCALAR, valence)
+
+        # Idioms: VADER looks for them from 3 words before to 2 words after
+        # a scored word; where one starts that close, VADER scores the word itself
+        starts_idiom = self.phrase_starts(ids, text_of, position)
+        near_idiom = np.zeros(len(ids), dtype=bool)
+        for offset in range(-3, 1):
+            shifted = np.clip(position + offset, 0, max(len(ids) - 1, 0))
+            near_idiom |= (local + offset >= 0) & starts_idiom[shifted]
+        near_idiom &= in_lexicon & (local > 2) & ~word("in_lexicon", -3)
+        for i in np.flatnonzero(near_idiom):
+            valence[i] = self.scalar_valence(text_words[text_of[i]], int(local[i]), bool(cap_diff[i]))
+
+        valence = np.where(in_lexicon, valence, 0.0)
+
+        # Boosters themselves (and "kind" of "kind of") score 0
+        kind_of = word("kind") & (local < text_length - 1) & word("of", 1)
+        valence = np.where(word("is_booster") | kind_of, 0.0, valence)
+
+        # VADER scores a repeated word at its FIRST position in the text
+        first = self.first_positions(text_of, ids)
+        sentiments = valence[first]
+
+        # "but": words before it count half, words after it 1.5 times
+        but_at = np.full(n_texts, len(ids), dtype=np.int64)
+        is_but = word("but")
+        np.minimum.at(but_at, text_of[is_but], position[is_but])
+        has_but = np.zeros(n_texts, dtype=bool)
+        has_but[text_of[is_but]] = True
+        but_at = but_at[text_of]
+        factor = np.where(position < but_at, 0.5, np.where(position > but_at, 1.5, 1.0))
+        sentiments = np.where(has_but[text_of], sentiments * factor, sentiments)
+
+        return self.combine(texts, text_of, sentiments, lengths)
+
+    def phrase_starts(self, ids, text_of, position):
+        """
+        True where a multi-word idiom / booster starts (all its words in the same text)
+        """
+        starts = np.zeros(len(ids), dtype=bool)
+        for phrase in self.phrases:
+            phrase_ids = [self.vocabulary.get(word) for word in phrase]
+            if None in phrase_ids:
+                continue
+            found = np.ones(len(ids), dtype=bool)
+            for offset, word_id in enumerate(phrase_ids):
+                shifted = np.clip(position + offset, 0, max(len(ids) - 1, 0))
+                found &= (ids[shifted] == word_id) & (text_of[shifted] == text_of) & (position + offset < len(ids))
+            starts |= found
+        return starts
+
+    def scalar_valence(self, words, i, cap_diff):
+        """
+        VADER's own per-word rule (used for the idiom positions)
+        """
+        sentitext = SimpleNamespace(words_and_emoticons=words, is_cap_diff=cap_diff)
+        return self.analyzer.sentiment_valence(0, sentitext, words[i], i, [])[0]
+
+    @staticmethod
+    def first_positions(text_of, ids):
+        """
+        For every word: the position of its first occurrence in its text
+        """
+        if not len(ids):
+            return ids
+        keys = text_of * (int(ids.max()) + 1) + ids
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        return first[inverse]
+
+    def combine(self, texts, text_of, sentiments, lengths):
+        """
+        Per-text sums → neg / neu / pos / compound (bincount adds in word order,
+        like VADER's own loop)
+        """
+        n_texts = len(texts)
+
+        # Emphasis from "!" (up to 4) and "??" / "???" / "????+"
+        exclamations = np.array([min(text.count("!"), 4) for text in texts], dtype=np.float64)
+        questions = np.array([text.count("?") for text in texts], dtype=np.float64)
+        amplifier = exclamations * 0.292
+        amplifier = amplifier + np.where(questions > 1, np.where(questions <= 3, questions * 0.18, 0.96), 0)
+
+        total_sum = np.bincount(text_of, sentiments, minlength=n_texts)
+        total_sum = np.where(total_sum > 0, total_sum + amplifier,
+                             np.where(total_sum < 0, total_sum - amplifier, total_sum))
+        compound = total_sum / np.sqrt(total_sum * total_sum + 15)
+
+        pos_sum = np.bincount(text_of, np.where(sentiments > 0, sentiments + 1, 0.0), minlength=n_texts)
+        neg_sum = np.bincount(text_of, np.where(sentiments < 0, sentiments - 1, 0.0), minlength=n_texts)
+        neu_count = np.bincount(text_of, sentiments == 0, minlength=n_texts)
+        pos_sum, neg_sum = (np.where(pos_sum > np.abs(neg_sum), pos_sum + amplifier, pos_sum),
+                            np.where(pos_sum < np.abs(neg_sum), neg_sum - amplifier, neg_sum))
+
+        scored = lengths > 0
+        total = np.where(scored, pos_sum + np.abs(neg_sum) + neu_count, 1.0)
+        return {
+            "neg": np.where(scored, np.abs(neg_sum / total), 0.0),
+            "neu": np.where(scored, np.abs(neu_count / total), 0.0),
+            "pos": np.where(scored, np.abs(pos_sum / total), 0.0),
+            "compound": np.where(scored, compound, 0.0),
+        }
+
+    def polarity_scores(self, texts):
+        """
+        One {neg, neu, pos, compound} dictionary per text, rounded like polarity_scores
+        """
+        arrays = self.score_arrays(texts)
+        return [
+            {"neg": round(neg, 3), "neu": round(neu, 3), "pos": round(pos, 3), "compound": round(compound, 4)}
+            for neg, neu, pos, compound in zip(arrays["neg"].tolist(), arrays["neu"].tolist(),
+                                               arrays["pos"].tolist(), arrays["compound"].tolist())
+        ]
+
+
+# Created on first use and then reused (one per process, like get_analyzer)
+scorer = None
+
+
+def get_batch_scorer():
+    global scorer
+    if scorer is None:
+        scorer = BatchScorer()
+    return scorer
+
+
+# ------------------------------------------------------------
+# STEP 2: PARITY CHECK AGAINST polarity_scores
+# ------------------------------------------------------------
+# Generated sentences exercise every rule: boosters, dampeners,
+# negations, "never so", "least", "but", ALL CAPS, idioms,
+# punctuation, repeated words, emoticons
+
+RULE_WORDS = [
+    "very", "extremely", "kind of", "sort of", "barely", "slightly", "not", "isn't", "never",
+    "never so", "this", "at least", "least", "very least", "but", "BUT", "without", "hardly",
+    "the bomb", "the shit", "yeah right", "cut the mustard", "kiss of death", "bad ass",
+]
+FILLER_WORDS = ["the", "movie", "was", "I", "it", "service", "food", "and", "really", "so", "is", "a"]
+PUNCTUATION = ["", "", "", ".", "!", "!!", "?", "??", "???", "!?!", ",", ":)", ":(", "'", '"']
+
+
+def generated_texts(count, seed=0):
+    """
+    Random sentences mixing lexicon words with VADER's rule words
+    """
+    analyzer = get_analyzer()
+    rng = random.Random(seed)
+    lexicon_words = sorted(word for word in analyzer.lexicon if word.isalpha())
+    texts = []
+    for _ in range(count):
+        words = []
+        for _ in range(rng.randint(0, 18)):
+            kind = rng.random()
+            if kind < 0.35:
+                word = rng.choice(lexicon_words)
+            elif kind < 0.6:
+                word = rng.choice(RULE_WORDS)
+            else:
+                word = rng.choice(FILLER_WORDS)
+            if rng.random() < 0.15:
+                word = word.upper()
+            elif rng.random() < 0.1:
+                word = word.capitalize()
+            if rng.random() < 0.2:
+                word = rng.choice(PUNCTUATION) + word if rng.random() < 0.3 else word + rng.choice(PUNCTUATION)
+            words.append(word)
+        if words and rng.random() < 0.3:
+            words.append(rng.choice(words))
+        texts.append(" ".join(words) + rng.choice(PUNCTUATION))
+    return texts
+
+
+def check(texts, tolerance=1e-9, batch_size=1000, show=5):
+    """
+    Compare every score with polarity_scores; returns the number of mismatches
+    """
+    analyzer = get_analyzer()
+    batch_scorer = get_batch_scorer()
+    mismatches = 0
+    largest = 0.0
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start:start + batch_size]
+        for text, got in zip(batch, batch_scorer.polarity_scores(batch)):
+            expected = analyzer.polarity_scores(text)
+            difference = max(abs(got[key] - expected[key]) for key in expected)
+            largest = max(largest, difference)
+            if difference > tolerance:
+                mismatches += 1
+                if mismatches <= show:
+                    print(f"MISMATCH {text!r}\n  polarity_scores {expected}\n  batch           {got}")
+    print(f"{len(texts)} texts, {mismatches} outside tolerance {tolerance:g} "
+          f"(largest difference {largest:g})")
+    return mismatches
+
+
+# ------------------------------------------------------------
+# STEP 3: BENCHMARK (TEXTS/SEC, ONE CORE)
+# ------------------------------------------------------------
+
+def bench(texts, batch_size, repeat):
+    analyzer = get_analyzer()
+    batch_scorer = get_batch_scorer()
+
+    # Warm up: the first batch also fills the word arrays
+    batch_scorer.polarity_scores(texts[:batch_size])
+
+    def loop():
+        for text in texts:
+            analyzer.polarity_scores(text)
+
+    def batched():
+        for start in range(0, len(texts), batch_size):
+            batch_scorer.polarity_scores(texts[start:start + batch_size])
+
+    results = {}
+    for name, run in (("polarity_scores", loop), (f"batch ({batch_size})", batched)):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best
+        print(f"{name:<20} {len(texts) / best:12,.0f} texts/sec  ({best:.3f}s, best of {repeat})")
+
+    loop_time, batch_time = results.values()
+    print(f"speedup: {loop_time / batch_time:.1f}x")
+
+
+# ------------------------------------------------------------
+# STEP 4: COMMAND LINE PROGRAM
+# ------------------------------------------------------------
+
+def read_texts(path):
+    with open(path, encoding="utf-8") as f:
+        return [line.rstrip("\n") for line in f]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vectorized batch VADER scorer.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    check_cmd = sub.add_parser("check", help="compare with polarity_scores")
+    check_cmd.add_argument("--tolerance", type=float, default=1e-9)
+
+    bench_cmd = sub.add_parser("bench", help="texts/sec, polarity_scores vs batch")
+    bench_cmd.add_argument("--repeat", type=int, default=3)
+
+    for command in (check_cmd, bench_cmd):
+        command.add_argument("--input", help="one text per line (default: generated texts)")
+        command.add_argument("--count", type=int, default=20000, help="number of generated texts")
+        command.add_argument("--batch-size", type=int, default=1000)
+        command.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args(argv)
+    texts = read_texts(args.input) if args.input else generated_texts(args.count, args.seed)
+
+    if args.command == "check":
+        if check(texts, args.tolerance, args.batch_size):
+            raise SystemExit(1)
+    else:
+        bench(texts, args.batch_size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+# ============================================================
+# PRECOMPILED (OFFLINE) VADER LEXICON
+# ============================================================
+# SentimentIntensityAnalyzer() normally:
+# 1. finds vader_lexicon.zip in nltk_data (downloaded from the internet)
+# 2. opens the zip and reads the text lexicon
+# 3. parses ~7500 "word<TAB>score" lines into a dictionary
+#
+# This program does those steps ONCE, at build time, and saves
+# the result (plus VADER's booster, negation and idiom tables)
+# as a single binary file: vader_lexicon.pickle
+#
+# At run time the file is loaded with ONE unpickle and turned
+# into a normal SentimentIntensityAnalyzer, so scores are identical
+# and no network access or nltk_data directory is needed.
+#
+# EXAMPLES:
+#   python vader_compiled.py build                     (uses nltk_data)
+#   python vader_compiled.py build --lexicon vader_lexicon.txt
+#   python vader_compiled.py bench                     (time-to-first-score)
+# ============================================================
+
+
+# ------------------------------------------------------------
+# STEP 0: IMPORT REQUIRED LIBRARIES
+# ------------------------------------------------------------
+
+import argparse
+import hashlib
+import os
+import pickle
+import subprocess
+import sys
+
+# VaderConstants holds the booster / negation / idiom tables
+# SentimentIntensityAnalyzer is the scorer we rebuild from the artifact
+from nltk.sentiment.vader import SentimentIntensityAnalyzer, VaderConstants
+
+
+# ------------------------------------------------------------
+# STEP 1: ARTIFACT LOCATION AND FORMAT
+# ------------------------------------------------------------
+
+# The artifact lives next to this file so it ships with the code
+ARTIFACT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vader_lexicon.pickle")
+
+# Bump this when the layout of the saved dictionary changes
+ARTIFACT_VERSION = 1
+
+# Default location of the lexicon inside nltk_data
+NLTK_LEXICON = "sentiment/vader_lexicon.zip/vader_lexicon/vader_lexicon.txt"
+
+# VaderConstants tables that are copied into the artifact
+CONSTANT_TABLES = ["NEGATE", "BOOSTER_DICT", "SPECIAL_CASE_IDIOMS"]
+
+
+# ------------------------------------------------------------
+# STEP 2: BUILD THE ARTIFACT
+# ------------------------------------------------------------
+
+def parse_lexicon(lexicon_text):
+    """
+    Convert the lexicon text into {word: score}
+    (same rules as SentimentIntensityAnalyzer.make_lex_dict;
+    blank lines, e.g. a final newline, are skipped)
+    """
+    lex_dict = {}
+    for line in lexicon_text.splitlines():
+        if not line.strip():
+            continue
+        (word, measure) = line.strip().split("\t")[0:2]
+        lex_dict[word] = float(measure)
+    return lex_dict
+
+
+def build_artifact(output_path=ARTIFACT_PATH, lexicon_path=None):
+    """
+    Compile the lexicon and VADER tables into one pickle file
+
+    lexicon_path: a plain vader_lexicon.txt file;
+    if omitted, the lexicon installed in nltk_data is used
+    """
+    if lexicon_path:
+        with open(lexicon_path, encoding="utf-8") as f:
+            lexicon_text = f.read()
+    else:
+        import nltk.data
+        lexicon_text = nltk.data.load(NLTK_LEXICON)
+
+    artifact = {
+        "version": ARTIFACT_VERSION,
+        "lexicon": parse_lexicon(lexicon_text),
+        "constants": {name: getattr(VaderConstants, name) for name in CONSTANT_TABLES},
+    }
+
+    # Write to a temporary file first, then rename:
+    # a crash never leaves a half-written artifact behind
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, output_path)
+
+    return len(artifact["lexicon"])
+
+
+# ------------------------------------------------------------
+# STEP 3: LOAD THE ARTIFACT INTO AN ANALYZER
+# ------------------------------------------------------------
+
+def load_analyzer(path=ARTIFACT_PATH):
+    """
+    Return a SentimentIntensityAnalyzer built from the artifact
+    (no nltk_data lookup, no zip file, no text parsing)
+    """
+    with open(path, "rb") as f:
+        artifact = pickle.load(f)
+
+    if artifact.get("version") != ARTIFACT_VERSION:
+        raise ValueError(
+            f"{path} has artifact version {artifact.get('version')}, "
+            f"expected {ARTIFACT_VERSION}; rebuild it with 'python vader_compiled.py build'"
+        )
+
+    # __new__ creates the object WITHOUT running __init__,
+    # which is the part that reads the lexicon from nltk_data
+    analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    analyzer.lexicon_file = None
+    analyzer.lexicon = artifact["lexicon"]
+
+    # Instance attributes override the class-level tables
+    analyzer.constants = VaderConstants()
+    for name, table in artifact["constants"].items():
+        setattr(analyzer.constants, name, table)
+
+    return analyzer
+
+
+def lexicon_hash(lexicon):
+    """
+    SHA-256 of the {word: score} items (sorted, so the order of the
+    file does not matter); changes when any word or valence changes
+    """
+    digest = hashlib.sha256()
+    for word, score in sorted(lexicon.items()):
+        digest.update(f"{word}\t{score!r}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+# ------------------------------------------------------------
+# STEP 4: BENCHMARK TIME-TO-FIRST-SCORE
+# ------------------------------------------------------------
+# Each measurement runs in a FRESH Python process,
+# so load costs are counted exactly like a cold start
+
+BENCH_SNIPPETS = {
+    "nltk_data lexicon": (
+        "from nltk.sentiment import SentimentIntensityAnalyzer\n"
+        "sia = SentimentIntensityAnalyzer()\n"
+    ),
+    "compiled artifact": (
+        "from vader_compiled import load_analyzer\n"
+        "sia = load_analyzer({path!r})\n"
+    ),
+}
+
+# The clock starts AFTER the imports: importing nltk itself
+# (which pulls in scipy / scikit-learn) is the same for both
+# paths and is reported separately as "import nltk"
+BENCH_TEMPLATE = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "import nltk.sentiment.vader\n"
+    "loaded = time.perf_counter()\n"
+    "{setup}"
+    "sia.polarity_scores('VADER is smart, handsome, and funny!')\n"
+    "print(loaded - start, time.perf_counter() - loaded)\n"
+)
+
+
+def time_to_first_score(setup, runs):
+    """
+    Return the best (import time, time-to-first-score) in seconds
+    over several cold starts
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    code = BENCH_TEMPLATE.format(setup=setup)
+    best_import = best_score = None
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=here,
+            capture_output=True, text=True, check=True,
+        )
+        import_time, score_time = (float(value) for value in out.stdout.split())
+        best_import = import_time if best_import is None else min(best_import, import_time)
+        best_score = score_time if best_score is None else min(best_score, score_time)
+    return best_import, best_score
+
+
+def bench(path, runs):
+    for name, setup in BENCH_SNIPPETS.items():
+        import_time, score_time = time_to_first_score(setup.format(path=path), runs)
+        print(
+            f"{name:<20} time-to-first-score: {score_time * 1000:8.1f} ms "
+            f"(+ {import_time * 1000:.0f} ms import nltk, best of {runs})"
+        )
+
+
+# ------------------------------------------------------------
+# STEP 5: COMMAND LINE PROGRAM
+# ------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or benchmark the compiled VADER lexicon.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build_cmd = sub.add_parser("build", help="compile the lexicon into a binary artifact")
+    build_cmd.add_argument("--lexicon", help="path to vader_lexicon.txt (default: nltk_data)")
+    build_cmd.add_argument("-o", "--output", default=ARTIFACT_PATH)
+
+    bench_cmd = sub.add_parser("bench", help="compare cold-start time-to-first-score")
+    bench_cmd.add_argument("--artifact", default=ARTIFACT_PATH)
+    bench_cmd.add_argument("--runs", type=int, default=5)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        words = build_artifact(args.output, args.lexicon)
+        print(f"Wrote {args.output} ({words} lexicon entries)")
+    else:
+        bench(args.artifact, args.runs)
+
+
+if __name__ == "__main__":
+    main()
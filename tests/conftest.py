@@ -0,0 +1,40 @@
+# ----------------------------------------------------
+# Shared setup for the tests of the projects and the benchmarks
+# ----------------------------------------------------
+# The projects are folders of scripts that import each other
+# by module name, so each folder goes on sys.path (the same
+# thing as running a script from inside its folder).
+
+import os
+import sys
+
+import nltk
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECTS = ["nltk_nlp_activity", "sentiment-analysis-nltk", "ml-disease-prediction", "benchmarks"]
+
+for project in PROJECTS:
+    path = os.path.join(ROOT, project)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def needs_nltk_data(*resources):
+    """
+    Skip a test when NLTK data it needs is not installed
+    """
+    missing = []
+    for resource in resources:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            missing.append(resource)
+    return pytest.mark.skipif(bool(missing), reason=f"NLTK data not installed: {', '.join(missing)}")
+
+
+@pytest.fixture(autouse=True)
+def no_shared_state(monkeypatch):
+    # Never read or write the user's result cache, always the exact tokenizer
+    monkeypatch.delenv("NLP_RESULT_CACHE", raising=False)
+    monkeypatch.delenv("NLP_TOKENIZER", raising=False)
@@ -0,0 +1,21 @@
+import pytest
+
+from compiled_model import CompiledModel, check_parity
+from model_artifact import KINDS, example_data, train
+
+
+@pytest.mark.parametrize("kind", KINDS)
+@pytest.mark.parametrize("max_combinations", [1000000, 0])
+def test_compiled_model_matches_sklearn(kind, max_combinations):
+    # max_combinations=0 forces the no-table paths (gather / tree walk)
+    artifact = train(example_data(), kind)
+    checked, wrong_prediction, wrong_proba = check_parity(artifact, CompiledModel(artifact, max_combinations))
+    assert checked == 6
+    assert wrong_prediction == 0
+    assert wrong_proba == 0
+
+
+def test_wrong_number_of_symptoms_is_a_value_error():
+    compiled = CompiledModel(train(example_data(), 'tree'))
+    with pytest.raises(ValueError):
+        compiled.predict(["Paralysis"])
@@ -0,0 +1,11 @@
+from conftest import needs_nltk_data
+
+from fast_tokenizer import DIFFERENTIAL_CORPUS, check, generated_corpus
+
+
+@needs_nltk_data("tokenizers/punkt_tab")
+def test_same_tokens_as_word_tokenize():
+    documents, identical, tokens, differing, examples = check(DIFFERENTIAL_CORPUS + generated_corpus(300, seed=1))
+    assert documents == len(DIFFERENTIAL_CORPUS) + 300
+    assert tokens > 0
+    assert (identical, differing, examples) == (documents, 0, [])
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from incremental_nb import IncrementalNaiveBayes, check_parity
+
+
+def seeded_documents(count=400, seed=0):
+    """
+    Two labels with overlapping word lists
+    """
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(60)]
+    documents = []
+    for _ in range(count):
+        label = rng.choice(["pos", "neg"])
+        words = vocabulary[:40] if label == "pos" else vocabulary[20:]
+        documents.append((rng.sample(words, rng.randint(3, 12)), label))
+    return documents
+
+
+def test_updates_and_merge_match_naive_bayes_classifier():
+    mismatches, same_features = check_parity(seeded_documents(), train_size=300, batches=4)
+    assert mismatches == 0
+    assert same_features
+
+
+def test_save_load_roundtrips_any_vocabulary(tmp_path):
+    path = str(tmp_path / "model.npz")
+    model = IncrementalNaiveBayes().partial_fit([["two\nlines", "", "plain"], ["other"]], ["pos", "neg"])
+    model.save(path)
+    loaded = IncrementalNaiveBayes.load(path)
+    assert loaded.words() == ["two\nlines", "", "plain", "other"]
+    assert (loaded.counts == model.counts[:, :len(model.vocabulary)]).all()
+
+    only_empty = IncrementalNaiveBayes().partial_fit([[""]], ["pos"])
+    only_empty.save(path)
+    assert IncrementalNaiveBayes.load(path).words() == [""]
+
+
+def test_merge_rejects_a_different_model():
+    nltk_model = IncrementalNaiveBayes("nltk").partial_fit([["good"]], ["pos"])
+    multinomial = IncrementalNaiveBayes("multinomial").partial_fit([["bad"]], ["neg"])
+    with pytest.raises(ValueError):
+        nltk_model.merge(multinomial)
@@ -0,0 +1,82 @@
+import struct
+
+from conftest import needs_nltk_data
+
+import lemma_table
+from document import Document
+from lemma_table import LemmaTable, build_table, check_parity, wordnet_pos
+
+TEXTS = [
+    "The striped bats are hanging on their feet for best.",
+    "She was running faster than the other runners.",
+    "Cars crossed the bridges while dogs barked loudly.",
+]
+
+TAGGED = needs_nltk_data("tokenizers/punkt_tab", "taggers/averaged_perceptron_tagger_eng")
+
+
+class SuffixLemmatizer:
+    """
+    A tiny stand-in for WordNetLemmatizer: strips a final "s" from nouns
+    """
+
+    def lemmatize(self, word, pos="n"):
+        return word[:-1] if pos == "n" and word.endswith("s") else word
+
+
+class WrongLemmatizer(SuffixLemmatizer):
+
+    def lemmatize(self, word, pos="n"):
+        return "bat!" if word == "bats" else super().lemmatize(word, pos)
+
+
+def tagged_pairs(texts):
+    return {(word, wordnet_pos(tag)) for text in texts for word, tag in Document(text).pos_tags}
+
+
+def test_table_lookup_and_byte_order(tmp_path):
+    path = str(tmp_path / "lemmas.bin")
+    pairs = [("bats", "n"), ("runs", "v"), ("cats", "n"), ("cats", "n")]
+    assert build_table(pairs, path, lemmatizer=SuffixLemmatizer()) == 3
+
+    table = LemmaTable(path)
+    assert table.lookup("bats", "n") == "bat"
+    assert table.lookup("runs", "v") == "runs"
+    assert table.lookup("dogs", "n") is None
+    table.close()
+
+    # Count and offsets are little-endian on every machine
+    with open(path, "rb") as f:
+        raw = f.read()
+    assert raw[:8] == lemma_table.MAGIC
+    assert struct.unpack_from("<I", raw, 8)[0] == 3
+    assert struct.unpack_from("<4I", raw, 12)[0] == 0
+
+
+@TAGGED
+def test_check_parity_matches_pipeline_without_table(tmp_path):
+    path = str(tmp_path / "lemmas.bin")
+    build_table(tagged_pairs(TEXTS), path, lemmatizer=SuffixLemmatizer())
+
+    checked, mismatches = check_parity(TEXTS + [""], path, reference=SuffixLemmatizer())
+    assert checked == sum(len(Document(text).pos_tags) for text in TEXTS)
+    assert mismatches == []
+
+
+@TAGGED
+def test_check_parity_reports_a_wrong_table(tmp_path):
+    path = str(tmp_path / "lemmas.bin")
+    build_table(tagged_pairs(TEXTS), path, lemmatizer=WrongLemmatizer())
+
+    _, mismatches = check_parity(TEXTS, path, reference=SuffixLemmatizer())
+    assert mismatches == [("bats", "NNS", "bat", "bat!")]
+
+
+@TAGGED
+@needs_nltk_data("corpora/wordnet")
+def test_check_parity_with_wordnet(tmp_path):
+    path = str(tmp_path / "lemmas.bin")
+    build_table(tagged_pairs(TEXTS), path)
+
+    checked, mismatches = check_parity(TEXTS, path)
+    assert checked and mismatches == []
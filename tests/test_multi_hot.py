@@ -0,0 +1,9 @@
+import pytest
+
+from multi_hot import roundtrip
+
+
+@pytest.mark.parametrize("kind", ["nb", "tree"])
+def test_artifact_loads_in_a_fresh_process(kind):
+    # roundtrip() raises SystemExit when loading or the prediction differs
+    roundtrip(kind, patients=200, vocabulary=30)
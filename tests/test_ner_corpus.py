@@ -0,0 +1,26 @@
+from collections import Counter
+
+from ner_corpus import EntityIndex
+
+
+def test_reindexing_a_document_replaces_its_postings(tmp_path):
+    index = EntityIndex(str(tmp_path / "entities.sqlite"))
+    index.add("doc-1", Counter({("Obama", "PERSON"): 2, ("Paris", "GPE"): 1}))
+    index.add("doc-2", Counter({("Obama", "PERSON"): 1}))
+    index.commit()
+
+    # doc-1 changed: Paris is gone, Obama is mentioned once
+    index.add("doc-1", Counter({("Obama", "PERSON"): 1}))
+    index.commit()
+
+    assert index.top("PERSON", 10) == [("Obama", 2, 2)]
+    assert index.top("GPE", 10) == []
+    assert sorted(index.documents("Obama", "PERSON")) == ["doc-1", "doc-2"]
+    index.close()
+
+
+def test_reindex_delete_uses_an_index(tmp_path):
+    index = EntityIndex(str(tmp_path / "entities.sqlite"))
+    plan = index.db.execute("EXPLAIN QUERY PLAN DELETE FROM postings WHERE doc_id = ?", ("doc-1",)).fetchall()
+    index.close()
+    assert "USING INDEX postings_doc" in " ".join(row[-1] for row in plan)
@@ -0,0 +1,51 @@
+import asyncio
+import json
+
+import pytest
+from conftest import needs_nltk_data
+
+from nlp_server import Server
+
+MALFORMED = [
+    b"not json\n",
+    b"[1, 2]\n",
+    b'{"layers": ["tags"]}\n',
+    b'{"text": "Hi.", "layers": "tags"}\n',
+    b'{"text": "Hi.", "layers": ["nope"]}\n',
+    b'{"text": "Hi.", "layers": ["top_words"], "top": true}\n',
+    b'{"text": "Hi.", "layers": ["top_words"], "top": -1}\n',
+    b'{"text": "Hi.", "layers": ["entities"], "labels": "PERSON"}\n',
+]
+
+
+@pytest.mark.parametrize("line", MALFORMED)
+def test_malformed_message_gets_an_error(line):
+    server = Server({})
+    assert "error" in server.handle_message(line)
+    assert server.errors == 1 and server.requests == 0
+
+
+async def exchange(path, lines):
+    """
+    Serve on a Unix socket and send all lines on ONE connection
+    """
+    server_state = Server({})
+    server = await asyncio.start_unix_server(server_state.handle, path=path)
+    reader, writer = await asyncio.open_unix_connection(path)
+    replies = []
+    for line in lines:
+        writer.write(line)
+        await writer.drain()
+        replies.append(json.loads(await asyncio.wait_for(reader.readline(), 5)))
+    writer.close()
+    server.close()
+    await server.wait_closed()
+    return replies
+
+
+@needs_nltk_data("tokenizers/punkt_tab")
+def test_connection_survives_malformed_messages(tmp_path):
+    good = b'{"text": "Cats sleep. Dogs bark.", "layers": ["tokens"]}\n'
+    replies = asyncio.run(exchange(str(tmp_path / "nlp.sock"), MALFORMED + [good]))
+    assert all("error" in reply for reply in replies[:-1])
+    assert replies[-1] == {"tokens": ["Cats", "sleep", ".", "Dogs", "bark", "."]}
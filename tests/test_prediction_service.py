@@ -0,0 +1,60 @@
+import asyncio
+import json
+
+import pytest
+
+from model_artifact import example_data, train
+from prediction_service import MicroBatcher, make_handler
+
+
+async def exchange(raw_requests):
+    """
+    Start the service on a free port, send each raw request on its own
+    connection and return (replies, metrics)
+    """
+    batcher = MicroBatcher(train(example_data(), 'tree'))
+    batch_task = asyncio.create_task(batcher.run())
+    server = await asyncio.start_server(make_handler(batcher), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    replies = []
+    for raw in raw_requests:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        await writer.drain()
+        replies.append(await asyncio.wait_for(reader.read(), 5))
+        writer.close()
+
+    server.close()
+    await server.wait_closed()
+    batch_task.cancel()
+    return replies, batcher.metrics
+
+
+def parse(reply):
+    head, _, body = reply.partition(b"\r\n\r\n")
+    return int(head.split(b" ", 2)[1]), json.loads(body)
+
+
+@pytest.mark.parametrize("raw", [
+    b"GARBAGE\r\n\r\n",
+    b"POST /predict HTTP/1.1\r\nContent-Length: abc\r\n\r\n",
+    b"POST /predict HTTP/1.1\r\nContent-Length: -5\r\n\r\n",
+])
+def test_malformed_request_gets_400(raw):
+    replies, metrics = asyncio.run(exchange([raw]))
+    status, body = parse(replies[0])
+    assert status == 400
+    assert body["error"].startswith("malformed request")
+    assert metrics.errors == 1
+
+
+def test_valid_request_still_served():
+    body = json.dumps({"symptoms": ["Paralysis", "Vomiting"]}).encode()
+    raw = (b"POST /predict HTTP/1.1\r\nConnection: close\r\n"
+           b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+    replies, metrics = asyncio.run(exchange([raw]))
+    status, result = parse(replies[0])
+    assert status == 200
+    assert result["disease"] == "Ritengitis"
+    assert metrics.errors == 0
@@ -0,0 +1,8 @@
+from vader_compiled import lexicon_hash
+
+
+def test_lexicon_hash_follows_the_contents():
+    lexicon = {"good": 1.9, "bad": -2.5}
+    assert lexicon_hash(lexicon) == lexicon_hash({"bad": -2.5, "good": 1.9})
+    # Same size, one edited valence: a different cache version
+    assert lexicon_hash(lexicon) != lexicon_hash({"good": 1.9, "bad": -2.0})
@@ -0,0 +1,38 @@
+import time
+
+from run_benchmarks import SCALES, compare, run_benchmark
+
+PARAMS = dict(SCALES["small"], seed=0)
+
+
+def report(results):
+    return {"params": PARAMS, "results": results}
+
+
+def measured(rate, rss=100.0):
+    return {"seconds": 1.0, "rates": {"rows_per_sec": rate}, "peak_rss_mb": rss}
+
+
+def test_compare_flags_slower_and_bigger():
+    baseline = report({"a": measured(1000.0), "b": measured(1000.0)})
+    current = report({"a": measured(850.0), "b": measured(1000.0, rss=150.0)})
+    regressions = compare(current, baseline, 0.10)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("a: rows_per_sec")
+    assert regressions[1].startswith("b: peak_rss_mb")
+
+
+def test_compare_flags_a_benchmark_that_lost_its_rates():
+    baseline = report({"a": measured(1000.0), "b": measured(1000.0), "c": {"skipped": "no WordNet"}})
+    current = report({"a": {"error": "run failed: ValueError()"}, "b": {"skipped": "no WordNet"},
+                      "c": {"skipped": "no WordNet"}})
+    regressions = compare(current, baseline, 0.10)
+    assert [message.split(":")[0] for message in regressions] == ["a", "b"]
+
+
+def test_failing_benchmark_reports_its_error_at_once():
+    # Training on zero rows fails inside the child process
+    start = time.perf_counter()
+    result = run_benchmark("disease_nb_train", dict(PARAMS, rows=0), repeat=1, timeout=120)
+    assert "ValueError" in result["error"]
+    assert time.perf_counter() - start < 60
@@ -0,0 +1,9 @@
+from conftest import needs_nltk_data
+
+from vader_batch import check, generated_texts
+
+
+@needs_nltk_data("sentiment/vader_lexicon.zip")
+def test_batch_scores_match_polarity_scores():
+    texts = generated_texts(500, seed=3) + ["", "   ", "kind of good", "not bad at all!!", "THE BEST :)"]
+    assert check(texts, batch_size=128) == 0